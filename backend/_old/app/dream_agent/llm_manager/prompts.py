@@ -133,19 +133,36 @@ def format_response_prompt(user_input: str, ml_result: dict, biz_result: dict) -
     )
 
 
+# Replan 프롬프트에 포함할 todo 필드 (replan 응답 처리에 필요한 필드만)
+# - 중첩 metadata 구조와 flat 구조 모두 지원 (없는 필드는 무시됨)
+REPLAN_TODO_FIELDS = {
+    "id": True,
+    "task": True,
+    "task_type": True,
+    "layer": True,
+    "status": True,
+    "priority": True,
+    "tool": True,
+    "tool_params": True,
+    "depends_on": True,
+    "metadata": {
+        "execution": {"tool", "tool_params"},
+        "dependency": {"depends_on"},
+    },
+}
+
+
 def format_replan_prompt(current_plan: dict, current_todos: list, user_instruction: str) -> str:
     """Format replan layer user prompt"""
     import json
 
-    # TodoItem 객체를 dict로 변환
-    todos_data = []
-    for todo in current_todos:
-        if hasattr(todo, 'model_dump'):
-            todos_data.append(todo.model_dump(mode='json'))
-        elif isinstance(todo, dict):
-            todos_data.append(todo)
-        else:
-            todos_data.append(str(todo))
+    # TodoItem 객체를 필요한 필드만 dict로 변환 (history/progress 등 제외)
+    todos_data = [
+        todo.model_dump(mode='json', include=REPLAN_TODO_FIELDS) if hasattr(todo, 'model_dump')
+        else todo if isinstance(todo, dict)
+        else str(todo)
+        for todo in current_todos
+    ]
 
     return REPLAN_USER_TEMPLATE.format(
         current_plan=json.dumps(current_plan, indent=2, ensure_ascii=False) if current_plan else "No current plan",
@@ -21,7 +21,7 @@ from backend.app.dream_agent.llm_manager import (
     PLANNING_SYSTEM_PROMPT,
     format_planning_prompt
 )
-from backend.app.dream_agent.workflow_manager import TodoValidator, TodoDependencyManager
+from backend.app.dream_agent.workflow_manager import TodoValidator, TodoDependencyManager, IntentView
 from backend.app.dream_agent.workflow_manager.planning_manager import (
     plan_manager,
     resource_planner,
@@ -161,6 +161,8 @@ async def planning_node(state: Dict[str, Any]) -> Command:
     user_input = get_user_input(state)
     intent = get_intent(state)
     current_context = get_current_context(state)
+    # 검증과 fallback이 함께 쓰는 intent 뷰 (요청당 한 번 생성)
+    intent_view = IntentView.from_intent(intent, user_input)
 
     log.info(f"Starting planning for intent type: {intent.get('intent_type', 'unknown')}")
     log.info(f"[planning] Intent flags: requires_ml={intent.get('requires_ml')}, requires_biz={intent.get('requires_biz')}")
@@ -327,13 +329,13 @@ async def planning_node(state: Dict[str, Any]) -> Command:
         log.info("[Phase 2] Validating todos with PlanManager")
         validation_result = plan_manager.validate_plan_todos(
             plan_id=plan_obj.plan_id,
-            user_input=user_input
+            intent=intent_view
         )
 
         if not validation_result["valid"]:
             log.error(f"Todo validation failed: {validation_result['errors']}")
             log.warning("Using fallback todos due to validation failure")
-            fallback_todos = TodoValidator.get_fallback_todos(intent, user_input)
+            fallback_todos = TodoValidator.get_fallback_todos(intent_view)
 
             # Fallback todos로 Plan 재생성
             plan_obj = plan_manager.create_plan_for_session(
@@ -409,7 +411,7 @@ async def planning_node(state: Dict[str, Any]) -> Command:
             "estimated_complexity": "low",
             "workflow_type": "linear",
         }
-        todos = TodoValidator.get_fallback_todos(intent, user_input)
+        todos = TodoValidator.get_fallback_todos(intent_view)
         log.info(f"Generated {len(todos)} fallback todos")
 
         # Fallback Plan 생성
@@ -448,7 +450,7 @@ async def planning_node(state: Dict[str, Any]) -> Command:
             "workflow_type": "linear",
             "error": str(e)
         }
-        todos = TodoValidator.get_fallback_todos(intent, user_input)
+        todos = TodoValidator.get_fallback_todos(intent_view)
         log.info(f"Generated {len(todos)} fallback todos due to error")
 
         # Fallback Plan 생성
@@ -35,6 +35,7 @@ from .todo_manager import (
     TodoDependencyManager,
     todo_dependency_manager,
     TodoValidator,
+    IntentView,
 )
 
 # HITL Manager
@@ -121,6 +122,7 @@ __all__ = [
     "TodoDependencyManager",
     "todo_dependency_manager",
     "TodoValidator",
+    "IntentView",
 
     # HITL Manager
     "ReplanManager",
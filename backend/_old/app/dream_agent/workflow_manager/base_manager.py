@@ -29,7 +29,7 @@ BaseManager - Manager 추상 클래스
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, TypeVar, Generic
+from typing import ClassVar, Dict, Any, Optional, List, TypeVar, Generic
 from enum import Enum
 from datetime import datetime
 from dataclasses import dataclass, field
@@ -89,6 +89,8 @@ class BaseManager(ABC):
 
     name: str = "base_manager"
     version: str = "1.0.0"
+    # initialize_all_sync에서 동기 초기화 가능 여부
+    supports_sync_init: ClassVar[bool] = True
 
     def __init__(self, name: Optional[str] = None):
         if name:
@@ -260,6 +262,9 @@ class AsyncBaseManager(BaseManager):
                 return {"valid": self._db_connected}
     """
 
+    # 동기 초기화(_do_initialize)도 제공하는 서브클래스는 True로 재정의
+    supports_sync_init: ClassVar[bool] = False
+
     async def initialize_async(self) -> None:
         """
         비동기 Manager 초기화
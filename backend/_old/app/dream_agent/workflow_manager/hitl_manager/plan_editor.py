@@ -3,15 +3,26 @@
 Todo CRUD 작업 및 의존성 관리
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Callable, Deque, List, Optional, Set, Tuple
+from array import array
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import logging
+import sys
+import threading
 import uuid
 
+from cachetools import TTLCache
+
 from ...models.plan import Plan, PlanChange, PlanVersion, create_plan_change
-from ...models.todo import TodoItem, TodoMetadata, TodoDependencyConfig
+from ...models.todo import (
+    TodoItem,
+    TodoMetadata,
+    TodoExecutionConfig,
+    TodoDependencyConfig,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +36,7 @@ class EditOperation(str, Enum):
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanEdit:
     """계획 편집 요청"""
     operation: EditOperation
@@ -43,7 +54,7 @@ class PlanEdit:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EditResult:
     """편집 결과"""
     success: bool
@@ -75,11 +86,205 @@ class PlanEditor:
     - Todo 건너뛰기 (SKIP)
     """
 
-    def __init__(self, session_id: str):
+    # 변경 이력 compaction 기준
+    COMPACT_THRESHOLD = 200     # plan_obj.changes가 이 개수를 넘으면 compaction
+    RETAIN_DETAIL_COUNT = 100   # 최근 N개 변경만 change_data 상세 유지
+
+    def __init__(self, session_id: str, max_history: int = 1024):
+        """
+        Args:
+            session_id: 세션 ID
+            max_history: 보관할 최대 편집 히스토리 수 (초과 시 오래된 항목부터 제거)
+        """
         self.session_id = session_id
-        self._edit_history: List[Dict[str, Any]] = []
+        self._max_history = max_history
+        # (edit, result, timestamp) - dict 직렬화는 get_edit_history() 호출 시점으로 지연
+        self._edit_history: Deque[Tuple[PlanEdit, EditResult, float]] = deque(
+            maxlen=max_history
+        )
         self._created_at = datetime.now()
 
+        # Todo ID 인덱스 / 역방향 의존성 인덱스 (todo_id -> 해당 todo에 의존하는 todo IDs)
+        self._todo_index: Dict[str, TodoItem] = {}
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+
+        # 변경 이력 컬럼 저장소 - 요약/분석 시 PlanChange 객체를 순회하지 않음
+        # (편집 히스토리와 같이 최근 max_history개만 유지)
+        self._change_types: List[str] = []
+        self._change_actors: List[str] = []
+        self._change_ts: array = array("d")
+
+        # 배치 중 삭제 보류 IDs - 배치 끝에서 plan_obj.todos를 1회만 재구성
+        self._pending_deletes: Set[str] = set()
+
+        # 배치 중 의존성 변경 기록 (todo_id, 이전 depends_on) - 순환 발생 시 되돌리기용
+        self._dependency_undo: List[Tuple[str, List[str]]] = []
+
+        # 작업 유형별 dispatch 테이블
+        self._dispatch: Dict[
+            EditOperation, Callable[[Plan, PlanEdit, str, datetime], EditResult]
+        ] = {
+            EditOperation.ADD: lambda p, e, a, n: self._add_todo(p, e.data, e.position, a, n),
+            EditOperation.UPDATE: lambda p, e, a, n: self._update_todo(p, e.todo_id, e.data, a, n),
+            EditOperation.DELETE: lambda p, e, a, n: self._delete_todo(p, e.todo_id, a, n),
+            EditOperation.REORDER: lambda p, e, a, n: self._reorder_todo(p, e.todo_id, e.position, a, n),
+            EditOperation.SKIP: lambda p, e, a, n: self._skip_todo(p, e.todo_id, a, n),
+        }
+
+        # apply_edits 배치 중에는 per-op 버전 증가를 생략하고 배치 끝에서 1회 증가
+        self._batch_mode = False
+
+    def _build_indexes(self, plan_obj: Plan) -> None:
+        """Todo ID 인덱스 및 역방향 의존성 인덱스 구축 (배치당 1회)"""
+        self._todo_index = {t.id: t for t in plan_obj.todos}
+        self._dependents = defaultdict(set)
+        for t in plan_obj.todos:
+            if t.metadata and t.metadata.dependency:
+                for dep_id in t.metadata.dependency.depends_on:
+                    self._dependents[dep_id].add(t.id)
+
+    def _flush_pending_deletes(self, plan_obj: Plan) -> None:
+        """보류된 삭제를 plan_obj.todos에 한 번에 반영"""
+        if self._pending_deletes:
+            pending = self._pending_deletes
+            plan_obj.todos = [t for t in plan_obj.todos if t.id not in pending]
+            self._pending_deletes = set()
+
+    def _record_change(self, plan_obj: Plan, change: PlanChange) -> None:
+        """변경 이력 추가 (Plan + 컬럼 저장소, 컬럼은 최근 max_history개로 제한)"""
+        plan_obj.changes.append(change)
+        self._change_types.append(change.change_type)
+        self._change_actors.append(change.actor)
+        self._change_ts.append(change.timestamp.timestamp())
+
+        excess = len(self._change_ts) - self._max_history
+        if excess > 0:
+            del self._change_types[:excess]
+            del self._change_actors[:excess]
+            del self._change_ts[:excess]
+
+    def _maybe_compact(self, plan_obj: Plan) -> int:
+        """
+        변경 이력 compaction
+
+        - 같은 todo에 대한 modify_todo 변경은 최신 것만 유지
+        - 최근 RETAIN_DETAIL_COUNT개 이전 변경은 change_data를 비워 감사 기록만 유지
+        - PlanVersion이 참조하는 변경은 제거하지 않음
+
+        Returns:
+            제거된 변경 수
+        """
+        changes = plan_obj.changes
+        if len(changes) <= self.COMPACT_THRESHOLD:
+            return 0
+
+        referenced = {v.change_id for v in plan_obj.versions}
+        seen_modified: Set[Tuple[str, ...]] = set()
+        kept: List[PlanChange] = []
+
+        # 최신 -> 과거 순으로 순회
+        for change in reversed(changes):
+            if change.change_type == "modify_todo" and change.change_id not in referenced:
+                key = tuple(change.affected_todo_ids)
+                if key in seen_modified:
+                    continue
+                seen_modified.add(key)
+
+            if len(kept) >= self.RETAIN_DETAIL_COUNT:
+                change.change_data = {}
+            kept.append(change)
+
+        kept.reverse()
+        removed = len(changes) - len(kept)
+        plan_obj.changes = kept
+
+        logger.debug(
+            "[PlanEditor] Compacted changes: removed=%d, kept=%d", removed, len(kept)
+        )
+        return removed
+
+    def _update_dependents(
+        self,
+        todo_id: str,
+        old_deps: List[str],
+        new_deps: List[str]
+    ) -> None:
+        """역방향 의존성 인덱스 증분 갱신"""
+        old_set, new_set = set(old_deps), set(new_deps)
+        for dep_id in old_set - new_set:
+            self._dependents[dep_id].discard(todo_id)
+        for dep_id in new_set - old_set:
+            self._dependents[dep_id].add(todo_id)
+
+    def _find_cycle_todos(self, plan_obj: Plan) -> Set[str]:
+        """
+        Kahn 알고리즘으로 위상 정렬되지 않는 todo IDs 반환
+
+        Returns:
+            순환 의존성에 걸린(또는 그 뒤에 있는) todo IDs, 없으면 빈 집합
+        """
+        in_degree: Dict[str, int] = {}
+        for t in plan_obj.todos:
+            deps = t.metadata.dependency.depends_on if t.metadata and t.metadata.dependency else []
+            in_degree[t.id] = sum(1 for dep_id in set(deps) if dep_id in self._todo_index)
+
+        queue = deque(todo_id for todo_id, degree in in_degree.items() if degree == 0)
+        while queue:
+            todo_id = queue.popleft()
+            for dependent_id in self._dependents.get(todo_id, ()):
+                if dependent_id in in_degree:
+                    in_degree[dependent_id] -= 1
+                    if in_degree[dependent_id] == 0:
+                        queue.append(dependent_id)
+
+        return {todo_id for todo_id, degree in in_degree.items() if degree > 0}
+
+    def _validate_dependencies(self, plan_obj: Plan, actor: str) -> List[str]:
+        """
+        배치 의존성 검증 - 순환이 생기면 최근 의존성 변경부터 되돌림
+
+        Args:
+            plan_obj: Plan 객체
+            actor: 편집 주체
+
+        Returns:
+            의존성이 되돌려진 todo IDs
+        """
+        reverted: List[str] = []
+        cycle_ids = self._find_cycle_todos(plan_obj)
+
+        while cycle_ids and self._dependency_undo:
+            todo_id, previous_deps = self._dependency_undo.pop()
+            todo = self._todo_index.get(todo_id)
+            if todo is None or todo_id not in cycle_ids:
+                continue
+
+            self._update_dependents(
+                todo_id, todo.metadata.dependency.depends_on, previous_deps
+            )
+            todo.metadata.dependency.depends_on = list(previous_deps)
+            reverted.append(todo_id)
+            cycle_ids = self._find_cycle_todos(plan_obj)
+
+        if reverted:
+            logger.warning(
+                f"[PlanEditor] Dependency cycle detected, reverted depends_on: {reverted}"
+            )
+            self._record_change(plan_obj, create_plan_change(
+                change_type="modify_todo",
+                reason=f"Dependency cycle reverted (edits by {actor})",
+                actor="system",
+                affected_todo_ids=reverted,
+                change_data={"reverted_depends_on": reverted}
+            ))
+
+        if cycle_ids:
+            logger.warning(
+                f"[PlanEditor] Unresolved dependency cycle: {sorted(cycle_ids)}"
+            )
+
+        return reverted
+
     async def apply_edits(
         self,
         plan_obj: Plan,
@@ -100,17 +305,35 @@ class PlanEditor:
         results: List[EditResult] = []
         applied_edits: List[PlanEdit] = []
 
-        for edit in edits:
-            result = await self._apply_single_edit(plan_obj, edit, actor)
-            results.append(result)
+        self._build_indexes(plan_obj)
+        self._dependency_undo = []
+        self._pending_deletes = set()
 
-            if result.success:
-                applied_edits.append(edit)
-                self._edit_history.append({
-                    "edit": edit.to_dict(),
-                    "result": result.to_dict(),
-                    "timestamp": datetime.now().isoformat(),
-                })
+        # 배치 전체가 하나의 트랜잭션 - 동일 시각 사용
+        now = datetime.now()
+        now_ts = now.timestamp()
+        self._batch_mode = True
+        try:
+            for edit in edits:
+                result = self._apply_single_edit(plan_obj, edit, actor, now)
+                results.append(result)
+
+                if result.success:
+                    applied_edits.append(edit)
+                    self._edit_history.append((edit, result, now_ts))
+        finally:
+            self._flush_pending_deletes(plan_obj)
+            self._batch_mode = False
+
+        # 배치 커밋 시점에 의존성 DAG 1회 검증
+        if self._dependency_undo:
+            self._validate_dependencies(plan_obj, actor)
+
+        # 배치 단위 버전 증가 (1회)
+        if applied_edits:
+            plan_obj.current_version += 1
+            plan_obj.updated_at = now
+            self._maybe_compact(plan_obj)
 
         # State 업데이트 생성
         state_update = {
@@ -121,41 +344,29 @@ class PlanEditor:
         # 요약 로그
         success_count = sum(1 for r in results if r.success)
         logger.info(
-            f"[PlanEditor] Session {self.session_id}: "
-            f"{success_count}/{len(edits)} edits applied"
+            "[PlanEditor] Session %s: %d/%d edits applied",
+            self.session_id, success_count, len(edits)
         )
 
         return plan_obj, state_update
 
-    async def _apply_single_edit(
+    def _apply_single_edit(
         self,
         plan_obj: Plan,
         edit: PlanEdit,
-        actor: str
+        actor: str,
+        now: datetime
     ) -> EditResult:
         """단일 편집 적용"""
         try:
-            if edit.operation == EditOperation.ADD:
-                return await self._add_todo(plan_obj, edit.data, edit.position, actor)
-
-            elif edit.operation == EditOperation.UPDATE:
-                return await self._update_todo(plan_obj, edit.todo_id, edit.data, actor)
-
-            elif edit.operation == EditOperation.DELETE:
-                return await self._delete_todo(plan_obj, edit.todo_id, actor)
-
-            elif edit.operation == EditOperation.REORDER:
-                return await self._reorder_todo(plan_obj, edit.todo_id, edit.position, actor)
-
-            elif edit.operation == EditOperation.SKIP:
-                return await self._skip_todo(plan_obj, edit.todo_id, actor)
-
-            else:
+            handler = self._dispatch.get(edit.operation)
+            if handler is None:
                 return EditResult(
                     success=False,
                     operation=edit.operation,
                     error=f"Unknown operation: {edit.operation}"
                 )
+            return handler(plan_obj, edit, actor, now)
 
         except Exception as e:
             logger.error(f"Edit failed: {e}")
@@ -166,12 +377,13 @@ class PlanEditor:
                 error=str(e)
             )
 
-    async def _add_todo(
+    def _add_todo(
         self,
         plan_obj: Plan,
         data: Dict[str, Any],
         position: Optional[int],
-        actor: str
+        actor: str,
+        now: datetime
     ) -> EditResult:
         """
         Todo 추가
@@ -186,6 +398,7 @@ class PlanEditor:
                 - priority: 우선순위
             position: 삽입 위치 (None이면 끝)
             actor: 작업 주체
+            now: 배치 편집 시각
         """
         if not data:
             return EditResult(
@@ -204,17 +417,23 @@ class PlanEditor:
 
         # TodoItem 생성
         todo_id = str(uuid.uuid4())
-        metadata = TodoMetadata()
 
-        # 메타데이터 설정
-        if data.get("tool"):
-            metadata.execution.tool = data["tool"]
-
-        if data.get("tool_params"):
-            metadata.execution.tool_params = data["tool_params"]
+        # 메타데이터 설정 - 지정된 필드만 한 번에 생성, 없으면 TodoItem 기본값 사용
+        metadata_kwargs: Dict[str, Any] = {}
+        if data.get("tool") or data.get("tool_params"):
+            metadata_kwargs["execution"] = TodoExecutionConfig(
+                tool=data.get("tool"),
+                tool_params=data.get("tool_params") or {},
+            )
 
         if data.get("depends_on"):
-            metadata.dependency.depends_on = data["depends_on"]
+            metadata_kwargs["dependency"] = TodoDependencyConfig(
+                depends_on=list(data["depends_on"])
+            )
+
+        todo_kwargs: Dict[str, Any] = {}
+        if metadata_kwargs:
+            todo_kwargs["metadata"] = TodoMetadata(**metadata_kwargs)
 
         todo = TodoItem(
             id=todo_id,
@@ -222,19 +441,27 @@ class PlanEditor:
             task_type=data.get("task_type", "general"),
             layer=data.get("layer", "ml_execution"),
             priority=data.get("priority", 5),
-            metadata=metadata,
             created_by=actor,
+            **todo_kwargs,
         )
 
-        # 위치에 삽입
+        # 위치에 삽입 (위치 계산 전 보류된 삭제 반영)
+        if position is not None:
+            self._flush_pending_deletes(plan_obj)
         if position is not None and 0 <= position <= len(plan_obj.todos):
             plan_obj.todos.insert(position, todo)
         else:
             plan_obj.todos.append(todo)
 
-        # 버전 증가
-        plan_obj.current_version += 1
-        plan_obj.updated_at = datetime.now()
+        self._todo_index[todo_id] = todo
+        if todo.metadata.dependency.depends_on:
+            self._update_dependents(todo_id, [], todo.metadata.dependency.depends_on)
+            self._dependency_undo.append((todo_id, []))
+
+        # 버전 증가 (배치 모드에서는 apply_edits가 1회만 증가)
+        if not self._batch_mode:
+            plan_obj.current_version += 1
+            plan_obj.updated_at = now
 
         # 변경 이력 기록
         change = create_plan_change(
@@ -244,9 +471,9 @@ class PlanEditor:
             affected_todo_ids=[todo_id],
             change_data={"todo_data": data, "position": position}
         )
-        plan_obj.changes.append(change)
+        self._record_change(plan_obj, change)
 
-        logger.info(f"[PlanEditor] Added todo: {todo_id} - {task[:30]}")
+        logger.info("[PlanEditor] Added todo: %s - %.30s", todo_id, task)
 
         return EditResult(
             success=True,
@@ -255,12 +482,13 @@ class PlanEditor:
             details={"task": task, "position": position}
         )
 
-    async def _update_todo(
+    def _update_todo(
         self,
         plan_obj: Plan,
         todo_id: str,
         data: Dict[str, Any],
-        actor: str
+        actor: str,
+        now: datetime
     ) -> EditResult:
         """
         Todo 수정
@@ -275,6 +503,7 @@ class PlanEditor:
                 - depends_on: 의존 IDs
                 - tool: 도구
             actor: 작업 주체
+            now: 배치 편집 시각
         """
         if not todo_id:
             return EditResult(
@@ -283,7 +512,7 @@ class PlanEditor:
                 error="todo_id is required"
             )
 
-        todo = plan_obj.get_todo_by_id(todo_id)
+        todo = self._todo_index.get(todo_id)
         if not todo:
             return EditResult(
                 success=False,
@@ -292,11 +521,11 @@ class PlanEditor:
                 error=f"Todo not found: {todo_id}"
             )
 
-        # 변경 이전 상태 저장
+        # 변경 이전 상태 저장 - 실제로 변경되는 필드만 스냅샷
         previous_state = {
-            "task": todo.task,
-            "status": todo.status,
-            "priority": todo.priority,
+            key: getattr(todo, key)
+            for key in ("task", "status", "priority")
+            if key in data or (key == "task" and "content" in data)
         }
 
         # 필드 업데이트
@@ -307,7 +536,8 @@ class PlanEditor:
             updated_fields.append("task")
 
         if "status" in data:
-            todo.status = data["status"]
+            # status는 작은 고정 어휘 - intern으로 중복 문자열 할당 제거
+            todo.status = sys.intern(data["status"])
             updated_fields.append("status")
 
         if "priority" in data:
@@ -316,7 +546,14 @@ class PlanEditor:
 
         if "depends_on" in data:
             if todo.metadata and todo.metadata.dependency:
-                todo.metadata.dependency.depends_on = data["depends_on"]
+                new_deps = list(data["depends_on"])
+                self._dependency_undo.append(
+                    (todo_id, list(todo.metadata.dependency.depends_on))
+                )
+                self._update_dependents(
+                    todo_id, todo.metadata.dependency.depends_on, new_deps
+                )
+                todo.metadata.dependency.depends_on = new_deps
                 updated_fields.append("depends_on")
 
         if "tool" in data:
@@ -331,9 +568,10 @@ class PlanEditor:
 
         # 버전 증가
         todo.version += 1
-        todo.updated_at = datetime.now()
-        plan_obj.current_version += 1
-        plan_obj.updated_at = datetime.now()
+        todo.updated_at = now
+        if not self._batch_mode:
+            plan_obj.current_version += 1
+            plan_obj.updated_at = now
 
         # 변경 이력 기록
         change = create_plan_change(
@@ -347,9 +585,9 @@ class PlanEditor:
                 "new_data": data
             }
         )
-        plan_obj.changes.append(change)
+        self._record_change(plan_obj, change)
 
-        logger.info(f"[PlanEditor] Updated todo: {todo_id} - fields: {updated_fields}")
+        logger.info("[PlanEditor] Updated todo: %s - fields: %s", todo_id, updated_fields)
 
         return EditResult(
             success=True,
@@ -358,11 +596,12 @@ class PlanEditor:
             details={"updated_fields": updated_fields}
         )
 
-    async def _delete_todo(
+    def _delete_todo(
         self,
         plan_obj: Plan,
         todo_id: str,
-        actor: str
+        actor: str,
+        now: datetime
     ) -> EditResult:
         """
         Todo 삭제
@@ -371,6 +610,7 @@ class PlanEditor:
             plan_obj: Plan 객체
             todo_id: 삭제할 Todo ID
             actor: 작업 주체
+            now: 배치 편집 시각
         """
         if not todo_id:
             return EditResult(
@@ -379,7 +619,7 @@ class PlanEditor:
                 error="todo_id is required"
             )
 
-        todo = plan_obj.get_todo_by_id(todo_id)
+        todo = self._todo_index.get(todo_id)
         if not todo:
             return EditResult(
                 success=False,
@@ -391,20 +631,30 @@ class PlanEditor:
         # 삭제 전 정보 저장
         deleted_task = todo.task
 
-        # Todo 삭제
-        plan_obj.todos = [t for t in plan_obj.todos if t.id != todo_id]
+        # Todo 삭제 - 배치 중에는 보류 후 배치 끝에서 1회 재구성
+        self._pending_deletes.add(todo_id)
+        if not self._batch_mode:
+            self._flush_pending_deletes(plan_obj)
 
-        # 의존성 정리 - 삭제된 todo에 의존하는 다른 todos 업데이트
+        # 의존성 정리 - 역방향 인덱스로 삭제된 todo에 의존하는 todos만 업데이트
         affected_todos = []
-        for t in plan_obj.todos:
-            if t.metadata and t.metadata.dependency:
-                if todo_id in t.metadata.dependency.depends_on:
-                    t.metadata.dependency.depends_on.remove(todo_id)
-                    affected_todos.append(t.id)
-
-        # 버전 증가
-        plan_obj.current_version += 1
-        plan_obj.updated_at = datetime.now()
+        for dependent_id in self._dependents.pop(todo_id, ()):
+            dependent = self._todo_index.get(dependent_id)
+            if dependent is None:
+                continue
+            depends_on = dependent.metadata.dependency.depends_on
+            if todo_id in depends_on:
+                depends_on.remove(todo_id)
+                affected_todos.append(dependent_id)
+
+        if todo.metadata and todo.metadata.dependency:
+            self._update_dependents(todo_id, todo.metadata.dependency.depends_on, [])
+        self._todo_index.pop(todo_id, None)
+
+        # 버전 증가 (배치 모드에서는 apply_edits가 1회만 증가)
+        if not self._batch_mode:
+            plan_obj.current_version += 1
+            plan_obj.updated_at = now
 
         # 변경 이력 기록
         change = create_plan_change(
@@ -417,11 +667,11 @@ class PlanEditor:
                 "dependency_updated_todos": affected_todos
             }
         )
-        plan_obj.changes.append(change)
+        self._record_change(plan_obj, change)
 
         logger.info(
-            f"[PlanEditor] Deleted todo: {todo_id} - {deleted_task[:30]}, "
-            f"dependency updated: {len(affected_todos)} todos"
+            "[PlanEditor] Deleted todo: %s - %.30s, dependency updated: %d todos",
+            todo_id, deleted_task, len(affected_todos)
         )
 
         return EditResult(
@@ -434,12 +684,13 @@ class PlanEditor:
             }
         )
 
-    async def _reorder_todo(
+    def _reorder_todo(
         self,
         plan_obj: Plan,
         todo_id: str,
         new_position: int,
-        actor: str
+        actor: str,
+        now: datetime
     ) -> EditResult:
         """
         Todo 순서 변경
@@ -449,6 +700,7 @@ class PlanEditor:
             todo_id: 이동할 Todo ID
             new_position: 새 위치
             actor: 작업 주체
+            now: 배치 편집 시각
         """
         if not todo_id:
             return EditResult(
@@ -465,7 +717,7 @@ class PlanEditor:
                 error="new_position is required"
             )
 
-        todo = plan_obj.get_todo_by_id(todo_id)
+        todo = self._todo_index.get(todo_id)
         if not todo:
             return EditResult(
                 success=False,
@@ -474,7 +726,8 @@ class PlanEditor:
                 error=f"Todo not found: {todo_id}"
             )
 
-        # 현재 위치 찾기
+        # 현재 위치 찾기 (보류된 삭제 반영 후)
+        self._flush_pending_deletes(plan_obj)
         old_position = next(
             (i for i, t in enumerate(plan_obj.todos) if t.id == todo_id),
             None
@@ -491,13 +744,27 @@ class PlanEditor:
         # 위치 유효성 검사
         new_position = max(0, min(new_position, len(plan_obj.todos) - 1))
 
-        # 순서 변경
+        # 위치 변화 없음 - 리스트 이동/이력 기록 생략
+        if new_position == old_position:
+            return EditResult(
+                success=True,
+                operation=EditOperation.REORDER,
+                todo_id=todo_id,
+                details={
+                    "old_position": old_position,
+                    "new_position": old_position
+                }
+            )
+
+        # 순서 변경 (pop 이후 줄어든 길이 기준으로 재보정)
         plan_obj.todos.pop(old_position)
+        new_position = min(new_position, len(plan_obj.todos))
         plan_obj.todos.insert(new_position, todo)
 
-        # 버전 증가
-        plan_obj.current_version += 1
-        plan_obj.updated_at = datetime.now()
+        # 버전 증가 (배치 모드에서는 apply_edits가 1회만 증가)
+        if not self._batch_mode:
+            plan_obj.current_version += 1
+            plan_obj.updated_at = now
 
         # 변경 이력 기록
         change = create_plan_change(
@@ -510,11 +777,11 @@ class PlanEditor:
                 "new_position": new_position
             }
         )
-        plan_obj.changes.append(change)
+        self._record_change(plan_obj, change)
 
         logger.info(
-            f"[PlanEditor] Reordered todo: {todo_id} - "
-            f"from {old_position} to {new_position}"
+            "[PlanEditor] Reordered todo: %s - from %d to %d",
+            todo_id, old_position, new_position
         )
 
         return EditResult(
@@ -527,11 +794,12 @@ class PlanEditor:
             }
         )
 
-    async def _skip_todo(
+    def _skip_todo(
         self,
         plan_obj: Plan,
         todo_id: str,
-        actor: str
+        actor: str,
+        now: datetime
     ) -> EditResult:
         """
         Todo 건너뛰기
@@ -540,6 +808,7 @@ class PlanEditor:
             plan_obj: Plan 객체
             todo_id: 건너뛸 Todo ID
             actor: 작업 주체
+            now: 배치 편집 시각
         """
         if not todo_id:
             return EditResult(
@@ -548,7 +817,7 @@ class PlanEditor:
                 error="todo_id is required"
             )
 
-        todo = plan_obj.get_todo_by_id(todo_id)
+        todo = self._todo_index.get(todo_id)
         if not todo:
             return EditResult(
                 success=False,
@@ -571,11 +840,12 @@ class PlanEditor:
         # 상태를 skipped로 변경
         todo.status = "skipped"
         todo.version += 1
-        todo.updated_at = datetime.now()
+        todo.updated_at = now
 
-        # 버전 증가
-        plan_obj.current_version += 1
-        plan_obj.updated_at = datetime.now()
+        # 버전 증가 (배치 모드에서는 apply_edits가 1회만 증가)
+        if not self._batch_mode:
+            plan_obj.current_version += 1
+            plan_obj.updated_at = now
 
         # 변경 이력 기록
         change = create_plan_change(
@@ -588,9 +858,9 @@ class PlanEditor:
                 "new_status": "skipped"
             }
         )
-        plan_obj.changes.append(change)
+        self._record_change(plan_obj, change)
 
-        logger.info(f"[PlanEditor] Skipped todo: {todo_id} - {todo.task[:30]}")
+        logger.info("[PlanEditor] Skipped todo: %s - %.30s", todo_id, todo.task)
 
         return EditResult(
             success=True,
@@ -600,21 +870,33 @@ class PlanEditor:
         )
 
     def get_edit_history(self) -> List[Dict[str, Any]]:
-        """편집 히스토리 반환"""
-        return self._edit_history.copy()
+        """편집 히스토리 반환 (요청 시점에 dict로 변환)"""
+        return [
+            {
+                "edit": edit.to_dict(),
+                "result": result.to_dict(),
+                "timestamp": datetime.fromtimestamp(ts).isoformat(),
+            }
+            for edit, result, ts in self._edit_history
+        ]
 
     def get_summary(self) -> Dict[str, Any]:
         """편집기 요약 정보"""
-        operations = {}
-        for entry in self._edit_history:
-            op = entry.get("edit", {}).get("operation", "unknown")
-            operations[op] = operations.get(op, 0) + 1
+        operations = Counter(
+            edit.operation.value for edit, _result, _ts in self._edit_history
+        )
 
         return {
             "session_id": self.session_id,
             "created_at": self._created_at.isoformat(),
             "total_edits": len(self._edit_history),
-            "operations_summary": operations,
+            "operations_summary": dict(operations),
+            "changes_summary": dict(Counter(self._change_types)),
+            "actors_summary": dict(Counter(self._change_actors)),
+            "last_change_at": (
+                datetime.fromtimestamp(self._change_ts[-1]).isoformat()
+                if self._change_ts else None
+            ),
         }
 
 
@@ -622,7 +904,12 @@ class PlanEditor:
 # Session별 Editor 관리
 # ============================================================
 
-_editors: Dict[str, PlanEditor] = {}
+# 세션 수/유휴 시간 제한 - 오래된 세션의 Editor(편집 히스토리 포함)는 자동 제거
+_EDITOR_CACHE_MAXSIZE = 1024
+_EDITOR_CACHE_TTL_SEC = 3600
+
+_editors: TTLCache = TTLCache(maxsize=_EDITOR_CACHE_MAXSIZE, ttl=_EDITOR_CACHE_TTL_SEC)
+_editors_lock = threading.Lock()
 
 
 def get_plan_editor(session_id: str) -> PlanEditor:
@@ -635,9 +922,13 @@ def get_plan_editor(session_id: str) -> PlanEditor:
     Returns:
         PlanEditor 인스턴스
     """
-    if session_id not in _editors:
-        _editors[session_id] = PlanEditor(session_id)
-    return _editors[session_id]
+    with _editors_lock:
+        editor = _editors.get(session_id)
+        if editor is None:
+            editor = PlanEditor(session_id)
+        # 재할당으로 TTL 갱신 (사용 중인 세션은 유지)
+        _editors[session_id] = editor
+        return editor
 
 
 def remove_plan_editor(session_id: str) -> bool:
@@ -650,7 +941,5 @@ def remove_plan_editor(session_id: str) -> bool:
     Returns:
         제거 여부
     """
-    if session_id in _editors:
-        del _editors[session_id]
-        return True
-    return False
+    with _editors_lock:
+        return _editors.pop(session_id, None) is not None
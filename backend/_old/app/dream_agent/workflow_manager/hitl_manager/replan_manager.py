@@ -13,6 +13,7 @@ Usage:
 """
 
 import json
+import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
@@ -27,6 +28,18 @@ from backend.app.dream_agent.llm_manager import (
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# LLM 응답의 ```json ... ``` 코드 펜스 제거
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+# Replan 시 기존 todo에서 업데이트 가능한 필드
+_UPDATABLE_FIELDS = ("task", "status", "priority")
+
 
 class ReplanResult:
     """Replan 결과"""
@@ -121,7 +134,7 @@ class ReplanManager:
             )
 
             # JSON 파싱
-            replan_data = json.loads(response)
+            replan_data = self._parse_response(response)
 
             modification_summary = replan_data.get("modification_summary", "Plan modified")
             changes = replan_data.get("changes", {"added": [], "removed": [], "modified": []})
@@ -137,7 +150,12 @@ class ReplanManager:
 
             # TodoStore에 저장
             if save_to_store and modified_todos:
-                todo_store.save_todos(session_id, modified_todos, backup=True)
+                todo_store.save_todos_raw(
+                    session_id,
+                    self._serialize_todos(modified_todos),
+                    len(modified_todos),
+                    backup=True
+                )
                 log.info(f"Saved {len(modified_todos)} modified todos to store")
 
             return ReplanResult(
@@ -167,6 +185,34 @@ class ReplanManager:
                 error=str(e)
             )
 
+    def _parse_response(self, response: str) -> Dict[str, Any]:
+        """
+        LLM 응답 JSON 파싱
+
+        코드 펜스를 제거한 뒤 orjson으로 파싱하고,
+        실패 시 json.loads로 재시도합니다 (json.JSONDecodeError 전파).
+        """
+        text = _FENCE_RE.sub("", response)
+        if HAS_ORJSON:
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(text)
+
+    def _serialize_todos(self, todos: List[TodoItem]) -> bytes:
+        """
+        todos를 JSON 배열 bytes로 한 번에 직렬화
+
+        orjson은 datetime을 직접 직렬화하므로 model_dump(mode='json') 변환을 생략합니다.
+        """
+        if HAS_ORJSON:
+            return orjson.dumps([todo.model_dump() for todo in todos])
+        return json.dumps(
+            [todo.model_dump(mode='json') for todo in todos],
+            ensure_ascii=False
+        ).encode("utf-8")
+
     def _convert_to_todo_items(
         self,
         todos_data: List[Dict[str, Any]],
@@ -196,14 +242,13 @@ class ReplanManager:
             if todo_id and todo_id in original_map:
                 original_todo = original_map[todo_id]
 
-                # 업데이트 가능한 필드들
-                update_data = {}
-                if "task" in todo_dict:
-                    update_data["task"] = todo_dict["task"]
-                if "status" in todo_dict:
-                    update_data["status"] = todo_dict["status"]
-                if "priority" in todo_dict:
-                    update_data["priority"] = todo_dict["priority"]
+                # 값이 실제로 바뀐 필드만 업데이트 (no-op이면 model_copy 생략)
+                update_data = {
+                    field: todo_dict[field]
+                    for field in _UPDATABLE_FIELDS
+                    if field in todo_dict
+                    and todo_dict[field] != getattr(original_todo, field)
+                }
 
                 if update_data:
                     updated_todo = original_todo.model_copy(update=update_data)
@@ -29,12 +29,14 @@ Manager Registry - Manager 중앙 등록 및 관리
     health = await manager_registry.health_check_all()
 """
 
-from typing import Dict, List, Optional, Any, Set
+from typing import Deque, Dict, List, Optional, Any, Tuple
+from collections import deque
 from enum import Enum
 from datetime import datetime
 from dataclasses import dataclass, field
 import logging
 import asyncio
+import time
 
 from .base_manager import (
     BaseManager,
@@ -56,7 +58,7 @@ class RegistryStatus(Enum):
     SHUTDOWN = "shutdown"
 
 
-@dataclass
+@dataclass(slots=True)
 class RegistryHealth:
     """Registry 헬스체크 결과"""
     status: RegistryStatus
@@ -95,27 +97,50 @@ class ManagerRegistry:
     - 싱글톤 패턴으로 전역 접근
     """
 
+    __slots__ = (
+        "_managers",
+        "_dependencies",
+        "_in_degree",
+        "_reverse_deps",
+        "_is_async",
+        "_initialization_order",
+        "_shutdown_order",
+        "_initialization_layers",
+        "_dirty",
+        "_last_iso_sec",
+        "_last_iso_str",
+        "_status",
+        "_errors",
+    )
+
     _instance: Optional["ManagerRegistry"] = None
 
+    MAX_ERRORS = 256  # _errors 버퍼 크기 (헬스체크에는 최근 에러만 노출)
+
     def __new__(cls):
+        # 상태 초기화는 최초 생성 시 한 번만 수행 (__init__ 없음 - 재호출 비용 없음)
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            self = super().__new__(cls)
+            self._managers: Dict[str, BaseManager] = {}
+            self._dependencies: Dict[str, List[str]] = {}
+            # 위상 정렬용 증분 인덱스 (등록된 의존성 수 / 역방향 의존성)
+            self._in_degree: Dict[str, int] = {}
+            self._reverse_deps: Dict[str, List[str]] = {}
+            # 등록 시점에 계산한 Manager 유형 플래그 (순회 중 isinstance 생략)
+            self._is_async: Dict[str, bool] = {}
+            self._initialization_order: List[str] = []
+            self._shutdown_order: List[str] = []  # _initialization_order 역순 캐시
+            self._initialization_layers: List[List[str]] = []  # 서로 독립적인 Manager 그룹
+            self._dirty = False  # 등록 변경 후 초기화 순서 재계산 필요 여부
+            self._last_iso_sec = 0  # _now_iso 캐시 (초 단위)
+            self._last_iso_str = ""
+            self._status = RegistryStatus.UNINITIALIZED
+            # 최근 MAX_ERRORS개 에러만 보관 (오래된 것부터 제거)
+            self._errors: Deque[str] = deque(maxlen=self.MAX_ERRORS)
+            cls._instance = self
+            logger.debug("ManagerRegistry initialized")
         return cls._instance
 
-    def __init__(self):
-        if self._initialized:
-            return
-
-        self._managers: Dict[str, BaseManager] = {}
-        self._dependencies: Dict[str, List[str]] = {}
-        self._initialization_order: List[str] = []
-        self._status = RegistryStatus.UNINITIALIZED
-        self._errors: List[str] = []
-        self._initialized = True
-
-        logger.debug("ManagerRegistry initialized")
-
     @property
     def status(self) -> RegistryStatus:
         """현재 Registry 상태"""
@@ -146,13 +171,39 @@ class ManagerRegistry:
         if name in self._managers:
             raise ValueError(f"Manager '{name}' is already registered")
 
-        self._managers[name] = manager
-        self._dependencies[name] = depends_on or []
+        self._add_manager(name, manager, depends_on)
 
         # 초기화 순서 재계산 필요
-        self._initialization_order = []
+        self._dirty = True
+
+        logger.info("Registered manager: %s (depends_on: %s)", name, depends_on or "none")
+
+    def register_many(
+        self,
+        specs: List[Tuple[str, BaseManager, Optional[List[str]]]]
+    ) -> None:
+        """
+        여러 Manager 일괄 등록
+
+        초기화 순서는 다음 initialize_all/shutdown_all 시점에 한 번만 계산됩니다.
+
+        Args:
+            specs: (name, manager, depends_on) 튜플 목록
+
+        Raises:
+            ValueError: 이미 등록되었거나 목록 내에서 중복된 이름 (아무것도 등록되지 않음)
+        """
+        names = [name for name, _, _ in specs]
+        duplicates = {name for name in names if name in self._managers or names.count(name) > 1}
+        if duplicates:
+            raise ValueError(f"Managers already registered or duplicated: {sorted(duplicates)}")
+
+        for name, manager, depends_on in specs:
+            self._add_manager(name, manager, depends_on)
+
+        self._dirty = True
 
-        logger.info(f"Registered manager: {name} (depends_on: {depends_on or 'none'})")
+        logger.info("Registered %d managers: %s", len(specs), names)
 
     def unregister(self, name: str) -> Optional[BaseManager]:
         """
@@ -164,12 +215,15 @@ class ManagerRegistry:
         Returns:
             제거된 Manager 인스턴스 (없으면 None)
         """
+        if name in self._managers:
+            self._unlink_dependencies(name)
         manager = self._managers.pop(name, None)
         self._dependencies.pop(name, None)
+        self._is_async.pop(name, None)
 
         if manager:
-            self._initialization_order = []
-            logger.info(f"Unregistered manager: {name}")
+            self._dirty = True
+            logger.info("Unregistered manager: %s", name)
 
         return manager
 
@@ -211,9 +265,51 @@ class ManagerRegistry:
         """특정 Manager의 의존성 목록"""
         return self._dependencies.get(name, [])
 
+    def _add_manager(
+        self,
+        name: str,
+        manager: BaseManager,
+        depends_on: Optional[List[str]]
+    ) -> None:
+        """Manager 저장 및 인덱스/플래그 갱신"""
+        self._managers[name] = manager
+        self._dependencies[name] = depends_on or []
+        self._is_async[name] = isinstance(manager, AsyncBaseManager)
+        self._link_dependencies(name)
+
+    def _link_dependencies(self, name: str) -> None:
+        """등록 시 in-degree / 역방향 의존성 인덱스 갱신"""
+        deps = self._dependencies[name]
+        self._in_degree[name] = sum(1 for dep in deps if dep in self._managers)
+        for dep in deps:
+            self._reverse_deps.setdefault(dep, []).append(name)
+
+        # 이미 등록된 Manager 중 이 Manager에 의존하는 것들의 in-degree 증가
+        for dependent in self._reverse_deps.get(name, []):
+            if dependent in self._managers and dependent != name:
+                self._in_degree[dependent] += 1
+
+    def _unlink_dependencies(self, name: str) -> None:
+        """등록 해제 시 in-degree / 역방향 의존성 인덱스 갱신"""
+        for dep in self._dependencies.get(name, []):
+            dependents = self._reverse_deps.get(dep)
+            if dependents and name in dependents:
+                dependents.remove(name)
+                if not dependents:
+                    del self._reverse_deps[dep]
+
+        for dependent in self._reverse_deps.get(name, []):
+            if dependent in self._managers and dependent != name:
+                self._in_degree[dependent] -= 1
+
+        self._in_degree.pop(name, None)
+
     def _compute_initialization_order(self) -> List[str]:
         """
-        의존성 기반 초기화 순서 계산 (위상 정렬)
+        의존성 기반 초기화 순서 계산 (Kahn 위상 정렬)
+
+        레벨 단위로 진행하여 같은 레이어의 Manager끼리는 서로 의존하지 않는
+        초기화 레이어(self._initialization_layers)도 함께 계산합니다.
 
         Returns:
             초기화 순서대로 정렬된 Manager 이름 목록
@@ -221,42 +317,85 @@ class ManagerRegistry:
         Raises:
             ValueError: 순환 의존성 발견
         """
-        if self._initialization_order:
+        if not self._dirty:
             return self._initialization_order
 
-        visited: Set[str] = set()
-        temp_visited: Set[str] = set()  # 순환 감지용
-        result: List[str] = []
+        for name, deps in self._dependencies.items():
+            for dep in deps:
+                if dep not in self._managers:
+                    logger.warning("Dependency '%s' for '%s' is not registered", dep, name)
 
-        def visit(name: str) -> None:
-            if name in temp_visited:
-                raise ValueError(f"Circular dependency detected involving '{name}'")
-            if name in visited:
-                return
+        in_degree = dict(self._in_degree)
+        layer = [name for name in self._managers if in_degree[name] == 0]
+        layers: List[List[str]] = []
+        result: List[str] = []
 
-            temp_visited.add(name)
+        while layer:
+            layers.append(layer)
+            result.extend(layer)
+            next_layer: List[str] = []
+            for name in layer:
+                for dependent in self._reverse_deps.get(name, []):
+                    if dependent in in_degree:
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            next_layer.append(dependent)
+            layer = next_layer
+
+        if len(result) < len(self._managers):
+            cycle = self._find_cycle([name for name in self._managers if in_degree[name] > 0])
+            raise ValueError(
+                f"Circular dependency detected involving '{cycle[0]}': "
+                f"{' -> '.join(cycle)}"
+            )
 
-            for dep in self._dependencies.get(name, []):
-                if dep in self._managers:
-                    visit(dep)
-                else:
-                    logger.warning(f"Dependency '{dep}' for '{name}' is not registered")
+        self._initialization_order = result
+        self._shutdown_order = result[::-1]
+        self._initialization_layers = layers
+        self._dirty = False
+        return result
 
-            temp_visited.remove(name)
-            visited.add(name)
-            result.append(name)
+    def _find_cycle(self, candidates: List[str]) -> List[str]:
+        """
+        순환 경로 탐색 (반복 DFS - 재귀 한도/프레임 비용 없음)
 
-        for name in self._managers:
-            if name not in visited:
-                visit(name)
+        Args:
+            candidates: Kahn 정렬 후 남은 Manager 이름 (모두 순환에 속하거나 순환에 의존)
 
-        self._initialization_order = result
-        return result
+        Returns:
+            순환 경로 (시작 노드로 끝남, 예: ["a", "b", "a"])
+        """
+        visited = set()
+        for start in candidates:
+            if start in visited:
+                continue
+            path: List[str] = [start]
+            on_path = {start}
+            stack = [iter(self._dependencies.get(start, []))]
+            while stack:
+                dep = next(stack[-1], None)
+                if dep is None:
+                    stack.pop()
+                    done = path.pop()
+                    on_path.discard(done)
+                    visited.add(done)
+                    continue
+                if dep not in self._managers or dep in visited:
+                    continue
+                if dep in on_path:
+                    return path[path.index(dep):] + [dep]
+                path.append(dep)
+                on_path.add(dep)
+                stack.append(iter(self._dependencies.get(dep, [])))
+        return candidates[:1]
 
     async def initialize_all(self) -> Dict[str, Any]:
         """
         모든 Manager 초기화 (의존성 순서)
 
+        같은 의존성 레이어의 Manager들은 동시에 초기화됩니다
+        (동기 Manager는 asyncio.to_thread로 실행).
+
         Returns:
             초기화 결과 딕셔너리:
             - initialized: 성공한 Manager 목록
@@ -264,7 +403,7 @@ class ManagerRegistry:
             - order: 초기화 순서
         """
         self._status = RegistryStatus.INITIALIZING
-        self._errors = []
+        self._errors.clear()
 
         result = {
             "initialized": [],
@@ -281,27 +420,29 @@ class ManagerRegistry:
             result["failed"].append({"name": "registry", "error": str(e)})
             return result
 
-        logger.info(f"Initializing {len(order)} managers in order: {order}")
-
-        for name in order:
-            manager = self._managers.get(name)
-            if not manager:
-                continue
-
-            try:
-                if isinstance(manager, AsyncBaseManager):
-                    await manager.initialize_async()
+        logger.info("Initializing %d managers in order: %s", len(order), order)
+
+        for layer in self._initialization_layers:
+            names = [name for name in layer if name in self._managers]
+            outcomes = await asyncio.gather(
+                *[
+                    self._managers[name].initialize_async()
+                    if self._is_async[name]
+                    else asyncio.to_thread(self._managers[name].initialize)
+                    for name in names
+                ],
+                return_exceptions=True
+            )
+
+            for name, outcome in zip(names, outcomes):
+                if isinstance(outcome, BaseException):
+                    error_msg = f"Failed to initialize '{name}': {outcome}"
+                    self._errors.append(error_msg)
+                    result["failed"].append({"name": name, "error": str(outcome)})
+                    logger.error(error_msg, exc_info=outcome)
                 else:
-                    manager.initialize()
-
-                result["initialized"].append(name)
-                logger.info(f"Manager '{name}' initialized successfully")
-
-            except Exception as e:
-                error_msg = f"Failed to initialize '{name}': {e}"
-                self._errors.append(error_msg)
-                result["failed"].append({"name": name, "error": str(e)})
-                logger.error(error_msg, exc_info=True)
+                    result["initialized"].append(name)
+                    logger.info("Manager '%s' initialized successfully", name)
 
         # 최종 상태 결정
         if not result["failed"]:
@@ -312,8 +453,9 @@ class ManagerRegistry:
             self._status = RegistryStatus.ERROR
 
         logger.info(
-            f"Registry initialization complete: "
-            f"{len(result['initialized'])} succeeded, {len(result['failed'])} failed"
+            "Registry initialization complete: %d succeeded, %d failed",
+            len(result["initialized"]),
+            len(result["failed"]),
         )
 
         return result
@@ -328,7 +470,7 @@ class ManagerRegistry:
             초기화 결과 딕셔너리
         """
         self._status = RegistryStatus.INITIALIZING
-        self._errors = []
+        self._errors.clear()
 
         result = {
             "initialized": [],
@@ -352,7 +494,7 @@ class ManagerRegistry:
                 continue
 
             # 비동기 Manager는 건너뛰기
-            if isinstance(manager, AsyncBaseManager) and not hasattr(manager, '_do_initialize'):
+            if self._is_async[name] and not manager.supports_sync_init:
                 result["skipped"].append(name)
                 continue
 
@@ -378,6 +520,9 @@ class ManagerRegistry:
         """
         모든 Manager 종료 (역순)
 
+        의존성 레이어를 역순으로 진행하며, 같은 레이어의 Manager들은
+        동시에 종료됩니다 (동기 Manager는 asyncio.to_thread로 실행).
+
         Returns:
             종료 결과 딕셔너리
         """
@@ -386,30 +531,32 @@ class ManagerRegistry:
             "failed": [],
         }
 
-        # 초기화 역순으로 종료
-        order = list(reversed(self._compute_initialization_order()))
-
-        logger.info(f"Shutting down {len(order)} managers in reverse order")
-
-        for name in order:
-            manager = self._managers.get(name)
-            if not manager:
-                continue
-
-            try:
-                if isinstance(manager, AsyncBaseManager):
-                    await manager.shutdown_async()
+        # 초기화 역순으로 종료 (순서 계산 시 캐시된 레이어 사용)
+        self._compute_initialization_order()
+
+        logger.info("Shutting down %d managers in reverse order", len(self._shutdown_order))
+
+        for layer in reversed(self._initialization_layers):
+            names = [name for name in layer if name in self._managers]
+            outcomes = await asyncio.gather(
+                *[
+                    self._managers[name].shutdown_async()
+                    if self._is_async[name]
+                    else asyncio.to_thread(self._managers[name].shutdown)
+                    for name in names
+                ],
+                return_exceptions=True
+            )
+
+            for name, outcome in zip(names, outcomes):
+                if isinstance(outcome, BaseException):
+                    result["failed"].append({"name": name, "error": str(outcome)})
+                    logger.error("Failed to shutdown '%s': %s", name, outcome)
                 else:
-                    manager.shutdown()
-
-                result["shutdown"].append(name)
-
-            except Exception as e:
-                result["failed"].append({"name": name, "error": str(e)})
-                logger.error(f"Failed to shutdown '{name}': {e}")
+                    result["shutdown"].append(name)
 
         self._status = RegistryStatus.SHUTDOWN
-        logger.info(f"Registry shutdown complete")
+        logger.info("Registry shutdown complete")
 
         return result
 
@@ -420,7 +567,8 @@ class ManagerRegistry:
             "failed": [],
         }
 
-        order = list(reversed(self._compute_initialization_order()))
+        self._compute_initialization_order()
+        order = self._shutdown_order
 
         for name in order:
             manager = self._managers.get(name)
@@ -436,19 +584,51 @@ class ManagerRegistry:
         self._status = RegistryStatus.SHUTDOWN
         return result
 
+    def _now_iso(self) -> str:
+        """
+        현재 시각 ISO 문자열 (초 단위 캐시)
+
+        같은 초 안의 반복 헬스체크에서는 datetime 생성/포맷팅을 생략합니다.
+        """
+        sec = int(time.time())
+        if sec != self._last_iso_sec:
+            self._last_iso_str = datetime.fromtimestamp(sec).isoformat()
+            self._last_iso_sec = sec
+        return self._last_iso_str
+
     async def health_check_all(self) -> RegistryHealth:
         """
-        모든 Manager 헬스체크
+        모든 Manager 헬스체크 (동시 실행)
+
+        health_check_async를 제공하는 Manager는 await, 나머지는
+        asyncio.to_thread로 실행하여 I/O 대기를 겹칩니다.
 
         Returns:
-            RegistryHealth 결과
+            RegistryHealth 결과 (errors는 최근 MAX_ERRORS개까지)
         """
         manager_health: Dict[str, ManagerHealth] = {}
         initialized_count = 0
         failed_count = 0
 
-        for name, manager in self._managers.items():
-            health = manager.health_check()
+        names = list(self._managers)
+        checks = []
+        for name in names:
+            manager = self._managers[name]
+            check_async = getattr(manager, "health_check_async", None)
+            checks.append(
+                check_async() if check_async else asyncio.to_thread(manager.health_check)
+            )
+        outcomes = await asyncio.gather(*checks, return_exceptions=True)
+
+        for name, health in zip(names, outcomes):
+            if isinstance(health, BaseException):
+                manager = self._managers[name]
+                health = ManagerHealth(
+                    name=manager.name,
+                    status=ManagerStatus.ERROR,
+                    version=manager.version,
+                    error=f"Health check failed: {health}",
+                )
             manager_health[name] = health
 
             if health.status == ManagerStatus.READY:
@@ -462,8 +642,8 @@ class ManagerRegistry:
             initialized_managers=initialized_count,
             failed_managers=failed_count,
             manager_health=manager_health,
-            last_check=datetime.now().isoformat(),
-            errors=self._errors.copy(),
+            last_check=self._now_iso(),
+            errors=list(self._errors),
         )
 
     def health_check_all_sync(self) -> RegistryHealth:
@@ -487,8 +667,8 @@ class ManagerRegistry:
             initialized_managers=initialized_count,
             failed_managers=failed_count,
             manager_health=manager_health,
-            last_check=datetime.now().isoformat(),
-            errors=self._errors.copy(),
+            last_check=self._now_iso(),
+            errors=list(self._errors),
         )
 
     def reset(self) -> None:
@@ -499,9 +679,15 @@ class ManagerRegistry:
         """
         self._managers.clear()
         self._dependencies.clear()
+        self._in_degree.clear()
+        self._reverse_deps.clear()
+        self._is_async.clear()
         self._initialization_order = []
+        self._shutdown_order = []
+        self._initialization_layers = []
+        self._dirty = False
         self._status = RegistryStatus.UNINITIALIZED
-        self._errors = []
+        self._errors.clear()
         logger.debug("ManagerRegistry reset")
 
     def __repr__(self) -> str:
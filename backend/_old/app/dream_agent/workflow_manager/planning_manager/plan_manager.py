@@ -1,6 +1,6 @@
 """Plan Manager - 동적 계획 관리 시스템"""
 
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Union
 from backend.app.core.logging import get_logger
 from backend.app.dream_agent.states import (
     Plan, PlanVersion, PlanChange,
@@ -11,7 +11,7 @@ from backend.app.dream_agent.workflow_manager.hitl_manager import (
     replan_manager, decision_manager
 )
 from backend.app.dream_agent.workflow_manager.todo_manager import (
-    todo_dependency_manager, TodoValidator
+    todo_dependency_manager, TodoValidator, IntentView
 )
 
 logger = get_logger(__name__)
@@ -804,7 +804,7 @@ class PlanManager:
     def validate_plan_todos(
         self,
         plan_id: str,
-        intent: Optional[Dict[str, Any]] = None,
+        intent: Optional[Union[IntentView, Dict[str, Any]]] = None,
         user_input: Optional[str] = None
     ) -> Dict[str, Any]:
         """
@@ -814,8 +814,8 @@ class PlanManager:
 
         Args:
             plan_id: 계획 ID
-            intent: Cognitive layer 결과 (None이면 plan.intent 사용)
-            user_input: 사용자 입력 (None이면 plan.context에서 추출)
+            intent: Cognitive layer 결과 또는 IntentView (None이면 plan.intent 사용)
+            user_input: 사용자 입력 (None이면 plan.context에서 추출, intent가 IntentView면 무시)
 
         Returns:
             검증 결과 dict
@@ -15,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 from enum import Enum
 from datetime import datetime
 import logging
+import operator
+import time
 
 if TYPE_CHECKING:
     from ...states.base import AgentState
@@ -23,6 +25,42 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# _todos_equal 비교 키 (C 구현 attrgetter로 튜플 추출)
+_TODO_KEY = operator.attrgetter(
+    "status", "task", "layer", "metadata.progress.error_message"
+)
+
+# _now 캐시: (초, datetime) - 같은 초 안의 반복 호출은 datetime 생성 생략
+# (SyncResult.timestamp 전용 - 저장되는 모델 필드는 초 미만이 잘리므로 datetime.now() 사용)
+_now_cache: Tuple[int, datetime] = (0, datetime.fromtimestamp(0))
+
+
+def _now() -> datetime:
+    """현재 시각 (초 단위 캐시)"""
+    global _now_cache
+    sec = int(time.time())
+    if sec != _now_cache[0]:
+        _now_cache = (sec, datetime.fromtimestamp(sec))
+    return _now_cache[1]
+
+
+def _plan_id_map(plan_obj: "Plan") -> Dict[str, "TodoItem"]:
+    """
+    plan_obj.todos의 id -> TodoItem 맵 (plan 객체에 메모이즈)
+
+    current_version이 같고 todos가 같은 리스트 객체이면 이전 맵을 재사용합니다.
+    리스트를 id()가 아닌 객체 자체로 보관하므로 해제된 리스트의 id 재사용으로 맵이 오래되지 않으며,
+    제자리 변경(추가/삭제/교체)은 모두 current_version을 올리는 경로에서만 일어납니다.
+    """
+    todos = plan_obj.todos
+    version = plan_obj.current_version
+    cached = plan_obj.__dict__.get("_id_index_v")
+    if cached is not None and cached[0] == version and cached[1] is todos:
+        return cached[2]
+    mapping = {t.id: t for t in todos}
+    plan_obj.__dict__["_id_index_v"] = (version, todos, mapping)
+    return mapping
+
 
 # ============================================================
 # Enums
@@ -47,19 +85,60 @@ class SyncTrigger(Enum):
 # SyncResult
 # ============================================================
 
+_EMPTY: Tuple[Any, ...] = ()
+
+
+def _lazy_list(slot: str) -> property:
+    """
+    첫 접근 시 리스트를 할당하는 속성
+
+    읽기만 하는 내부 경로(to_dict, __repr__)는 slot을 직접 읽어 할당을 피합니다.
+    """
+    def fget(self) -> list:
+        value = getattr(self, slot)
+        if value is None:
+            value = []
+            setattr(self, slot, value)
+        return value
+
+    def fset(self, value: list) -> None:
+        setattr(self, slot, value)
+
+    return property(fget, fset)
+
+
 class SyncResult:
     """동기화 결과"""
 
+    __slots__ = (
+        "synced",
+        "direction",
+        "trigger",
+        "_updated_ids",
+        "_added_ids",
+        "_removed_ids",
+        "_conflicts",
+        "_errors",
+        "timestamp",
+    )
+
+    # 대부분의 성공 경로에서 비어 있으므로 필요할 때만 할당
+    updated_ids = _lazy_list("_updated_ids")
+    added_ids = _lazy_list("_added_ids")
+    removed_ids = _lazy_list("_removed_ids")
+    conflicts = _lazy_list("_conflicts")
+    errors = _lazy_list("_errors")
+
     def __init__(self):
         self.synced: bool = False
         self.direction: Optional[SyncDirection] = None
         self.trigger: Optional[SyncTrigger] = None
-        self.updated_ids: List[str] = []
-        self.added_ids: List[str] = []
-        self.removed_ids: List[str] = []
-        self.conflicts: List[Dict[str, Any]] = []
-        self.errors: List[str] = []
-        self.timestamp: datetime = datetime.now()
+        self._updated_ids: Optional[List[str]] = None
+        self._added_ids: Optional[List[str]] = None
+        self._removed_ids: Optional[List[str]] = None
+        self._conflicts: Optional[List[Dict[str, Any]]] = None
+        self._errors: Optional[List[str]] = None
+        self.timestamp: datetime = _now()
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리 변환"""
@@ -67,11 +146,11 @@ class SyncResult:
             "synced": self.synced,
             "direction": self.direction.value if self.direction else None,
             "trigger": self.trigger.value if self.trigger else None,
-            "updated_ids": self.updated_ids,
-            "added_ids": self.added_ids,
-            "removed_ids": self.removed_ids,
-            "conflicts": self.conflicts,
-            "errors": self.errors,
+            "updated_ids": self._updated_ids or [],
+            "added_ids": self._added_ids or [],
+            "removed_ids": self._removed_ids or [],
+            "conflicts": self._conflicts or [],
+            "errors": self._errors or [],
             "timestamp": self.timestamp.isoformat(),
         }
 
@@ -79,11 +158,11 @@ class SyncResult:
         return (
             f"SyncResult(synced={self.synced}, "
             f"direction={self.direction}, "
-            f"updated={len(self.updated_ids)}, "
-            f"added={len(self.added_ids)}, "
-            f"removed={len(self.removed_ids)}, "
-            f"conflicts={len(self.conflicts)}, "
-            f"errors={len(self.errors)})"
+            f"updated={len(self._updated_ids or _EMPTY)}, "
+            f"added={len(self._added_ids or _EMPTY)}, "
+            f"removed={len(self._removed_ids or _EMPTY)}, "
+            f"conflicts={len(self._conflicts or _EMPTY)}, "
+            f"errors={len(self._errors or _EMPTY)})"
         )
 
 
@@ -108,7 +187,8 @@ class SyncManager:
     @staticmethod
     def compare_todos(
         state_todos: List["TodoItem"],
-        plan_todos: List["TodoItem"]
+        plan_todos: List["TodoItem"],
+        plan_map: Optional[Dict[str, "TodoItem"]] = None
     ) -> Dict[str, Any]:
         """
         두 todo 목록 비교
@@ -116,31 +196,40 @@ class SyncManager:
         Args:
             state_todos: state["todos"]의 todo 목록
             plan_todos: plan_obj.todos의 todo 목록
+            plan_map: plan_todos의 id 맵 (있으면 재사용)
 
         Returns:
             비교 결과 딕셔너리
         """
-        state_map = {t.id: t for t in state_todos}
-        plan_map = {t.id: t for t in plan_todos}
-
-        state_ids = set(state_map.keys())
-        plan_ids = set(plan_map.keys())
-
-        # 공통 ID 중 내용이 다른 것 찾기
+        if plan_map is None:
+            plan_map = {t.id: t for t in plan_todos}
+        seen = set()
+        state_only = []
         different = []
-        for tid in state_ids & plan_ids:
-            if not SyncManager._todos_equal(state_map[tid], plan_map[tid]):
+        common = []
+
+        # state 한 번 순회로 state_only / common / different 분류
+        for t in state_todos:
+            tid = t.id
+            if tid in seen:
+                continue
+            seen.add(tid)
+            plan_todo = plan_map.get(tid)
+            if plan_todo is None:
+                state_only.append(tid)
+                continue
+            common.append(tid)
+            if not SyncManager._todos_equal(t, plan_todo):
                 different.append(tid)
 
+        plan_only = [tid for tid in plan_map if tid not in seen]
+
         return {
-            "in_sync": (
-                state_ids == plan_ids and
-                len(different) == 0
-            ),
-            "state_only": list(state_ids - plan_ids),
-            "plan_only": list(plan_ids - state_ids),
+            "in_sync": not state_only and not plan_only and not different,
+            "state_only": state_only,
+            "plan_only": plan_only,
             "different": different,
-            "common": list(state_ids & plan_ids),
+            "common": common,
             "state_count": len(state_todos),
             "plan_count": len(plan_todos),
         }
@@ -154,14 +243,9 @@ class SyncManager:
         - status (상태)
         - task (내용)
         - layer (레이어)
-        - error_message (에러 메시지)
+        - error_message (에러 메시지, metadata.progress)
         """
-        return (
-            todo1.status == todo2.status and
-            todo1.task == todo2.task and
-            todo1.layer == todo2.layer and
-            getattr(todo1, 'error_message', None) == getattr(todo2, 'error_message', None)
-        )
+        return _TODO_KEY(todo1) == _TODO_KEY(todo2)
 
     @staticmethod
     def get_todo_diff(todo1: "TodoItem", todo2: "TodoItem") -> Dict[str, Any]:
@@ -193,7 +277,8 @@ class SyncManager:
     @staticmethod
     def sync_state_to_plan(
         state: "AgentState",
-        trigger: SyncTrigger = SyncTrigger.MANUAL
+        trigger: SyncTrigger = SyncTrigger.MANUAL,
+        collect_diff: bool = False
     ) -> Tuple["AgentState", SyncResult]:
         """
         State의 todos를 Plan에 동기화
@@ -204,6 +289,7 @@ class SyncManager:
         Args:
             state: 현재 AgentState
             trigger: 동기화 트리거
+            collect_diff: True면 compare_todos로 updated/added/removed IDs 기록
 
         Returns:
             (업데이트된 state, SyncResult)
@@ -218,13 +304,30 @@ class SyncManager:
             logger.warning("sync_state_to_plan: plan_obj not found")
             return state, result
 
+        return SyncManager._sync_state_to_plan_inner(
+            state, plan_obj, _plan_id_map(plan_obj), result, collect_diff
+        )
+
+    @staticmethod
+    def _sync_state_to_plan_inner(
+        state: "AgentState",
+        plan_obj: "Plan",
+        plan_map: Dict[str, "TodoItem"],
+        result: SyncResult,
+        collect_diff: bool
+    ) -> Tuple["AgentState", SyncResult]:
+        """sync_state_to_plan 본체 (plan_map을 호출자와 공유)"""
         state_todos = state.get("todos", [])
         if not state_todos:
             result.errors.append("No todos in state to sync")
             return state, result
 
-        # 변경 전 비교
-        comparison = SyncManager.compare_todos(state_todos, plan_obj.todos)
+        # 변경 전 비교 (collect_diff일 때만)
+        comparison = None
+        if collect_diff:
+            comparison = SyncManager.compare_todos(
+                state_todos, plan_obj.todos, plan_map
+            )
 
         # Plan의 todos를 State 기준으로 업데이트
         plan_obj.todos = [t.model_copy(deep=True) for t in state_todos]
@@ -233,23 +336,27 @@ class SyncManager:
 
         # 결과 기록
         result.synced = True
-        result.updated_ids = comparison["different"]
-        result.added_ids = comparison["state_only"]
-        result.removed_ids = comparison["plan_only"]
-
-        logger.info(
-            f"sync_state_to_plan: synced {len(state_todos)} todos, "
-            f"updated={len(result.updated_ids)}, "
-            f"added={len(result.added_ids)}, "
-            f"removed={len(result.removed_ids)}"
-        )
+        if comparison is not None:
+            result.updated_ids = comparison["different"]
+            result.added_ids = comparison["state_only"]
+            result.removed_ids = comparison["plan_only"]
+            logger.info(
+                "sync_state_to_plan: synced %d todos, updated=%d, added=%d, removed=%d",
+                len(state_todos),
+                len(result.updated_ids),
+                len(result.added_ids),
+                len(result.removed_ids),
+            )
+        else:
+            logger.info("sync_state_to_plan: synced %d todos", len(state_todos))
 
         return state, result
 
     @staticmethod
     def sync_plan_to_state(
         state: "AgentState",
-        trigger: SyncTrigger = SyncTrigger.MANUAL
+        trigger: SyncTrigger = SyncTrigger.MANUAL,
+        collect_diff: bool = False
     ) -> Tuple[Dict[str, Any], SyncResult]:
         """
         Plan의 todos를 State에 동기화
@@ -260,6 +367,7 @@ class SyncManager:
         Args:
             state: 현재 AgentState
             trigger: 동기화 트리거
+            collect_diff: True면 compare_todos로 updated/added/removed IDs 기록
 
         Returns:
             (state 업데이트용 딕셔너리, SyncResult)
@@ -274,26 +382,46 @@ class SyncManager:
             logger.warning("sync_plan_to_state: plan_obj not found")
             return {}, result
 
+        return SyncManager._sync_plan_to_state_inner(
+            state, plan_obj, _plan_id_map(plan_obj), result, collect_diff
+        )
+
+    @staticmethod
+    def _sync_plan_to_state_inner(
+        state: "AgentState",
+        plan_obj: "Plan",
+        plan_map: Dict[str, "TodoItem"],
+        result: SyncResult,
+        collect_diff: bool
+    ) -> Tuple[Dict[str, Any], SyncResult]:
+        """sync_plan_to_state 본체 (plan_map을 호출자와 공유)"""
         state_todos = state.get("todos", [])
 
-        # 변경 전 비교
-        comparison = SyncManager.compare_todos(state_todos, plan_obj.todos)
+        # 변경 전 비교 (collect_diff일 때만)
+        comparison = None
+        if collect_diff:
+            comparison = SyncManager.compare_todos(
+                state_todos, plan_obj.todos, plan_map
+            )
 
         # State의 todos를 Plan 기준으로 업데이트
         new_todos = [t.model_copy(deep=True) for t in plan_obj.todos]
 
         # 결과 기록
         result.synced = True
-        result.updated_ids = comparison["different"]
-        result.added_ids = comparison["plan_only"]
-        result.removed_ids = comparison["state_only"]
-
-        logger.info(
-            f"sync_plan_to_state: synced {len(new_todos)} todos, "
-            f"updated={len(result.updated_ids)}, "
-            f"added={len(result.added_ids)}, "
-            f"removed={len(result.removed_ids)}"
-        )
+        if comparison is not None:
+            result.updated_ids = comparison["different"]
+            result.added_ids = comparison["plan_only"]
+            result.removed_ids = comparison["state_only"]
+            logger.info(
+                "sync_plan_to_state: synced %d todos, updated=%d, added=%d, removed=%d",
+                len(new_todos),
+                len(result.updated_ids),
+                len(result.added_ids),
+                len(result.removed_ids),
+            )
+        else:
+            logger.info("sync_plan_to_state: synced %d todos", len(new_todos))
 
         return {"todos": new_todos}, result
 
@@ -324,16 +452,36 @@ class SyncManager:
         """
         plan_obj = state.get("plan_obj")
 
+        # 원소가 모두 동일 객체면 변경 없음 - 복사/버전 증가/통계 재계산 생략
+        if (
+            plan_obj
+            and len(plan_obj.todos) == len(updated_todos)
+            and all(a is b for a, b in zip(plan_obj.todos, updated_todos))
+        ):
+            return {
+                "todos": updated_todos,
+                "plan_obj": plan_obj
+            }, plan_obj
+
         if plan_obj:
-            # Plan 객체 업데이트
-            plan_obj.todos = [t.model_copy(deep=True) for t in updated_todos]
+            # Plan 객체 업데이트 - 변경된 todo만 deep copy, 나머지는 기존 객체 재사용
+            old_map = _plan_id_map(plan_obj)
+            new_todos = []
+            for t in updated_todos:
+                old = old_map.get(t.id)
+                if old is not None and (old is t or old == t):
+                    new_todos.append(old)
+                else:
+                    new_todos.append(t.model_copy(deep=True))
+            plan_obj.todos = new_todos
             plan_obj.current_version += 1
             plan_obj.updated_at = datetime.now()
             plan_obj.update_statistics()
 
             logger.debug(
-                f"sync_on_todo_update: synced {len(updated_todos)} todos to plan "
-                f"(trigger={trigger.value})"
+                "sync_on_todo_update: synced %d todos to plan (trigger=%s)",
+                len(updated_todos),
+                trigger.value,
             )
 
         # State 업데이트용 딕셔너리 반환
@@ -368,7 +516,9 @@ class SyncManager:
             }
 
         state_todos = state.get("todos", [])
-        comparison = SyncManager.compare_todos(state_todos, plan_obj.todos)
+        comparison = SyncManager.compare_todos(
+            state_todos, plan_obj.todos, _plan_id_map(plan_obj)
+        )
 
         issues = []
         if comparison["state_only"]:
@@ -411,7 +561,8 @@ class SyncManager:
         # State → Plan 동기화
         _, result = SyncManager.sync_state_to_plan(
             state,
-            trigger=SyncTrigger.MANUAL
+            trigger=SyncTrigger.MANUAL,
+            collect_diff=logger.isEnabledFor(logging.DEBUG)
         )
 
         return {}, result
@@ -439,40 +590,41 @@ class SyncManager:
         """
         result = SyncResult()
         result.direction = prefer
+        result.trigger = SyncTrigger.MANUAL
 
         plan_obj = state.get("plan_obj")
         if not plan_obj:
             result.errors.append("plan_obj not found")
             return {}, result
 
-        state_todos = state.get("todos", [])
-        state_map = {t.id: t for t in state_todos}
-        plan_map = {t.id: t for t in plan_obj.todos}
-
-        resolved_todos = []
-
-        for tid in conflict_ids:
-            if prefer == SyncDirection.STATE_TO_PLAN:
-                # State 우선
-                if tid in state_map:
-                    resolved_todos.append(state_map[tid])
-                    result.updated_ids.append(tid)
-            else:
-                # Plan 우선
-                if tid in plan_map:
-                    resolved_todos.append(plan_map[tid])
-                    result.updated_ids.append(tid)
+        # 충돌 판정과 전체 동기화가 같은 plan_map을 사용
+        plan_map = _plan_id_map(plan_obj)
+
+        if prefer == SyncDirection.STATE_TO_PLAN:
+            # State 우선
+            state_ids = {t.id for t in state.get("todos", [])}
+            result.updated_ids = [tid for tid in conflict_ids if tid in state_ids]
+        else:
+            # Plan 우선
+            result.updated_ids = [tid for tid in conflict_ids if tid in plan_map]
 
-        result.synced = True
         result.conflicts = [{"id": tid, "resolved": prefer.value} for tid in conflict_ids]
 
-        logger.info(f"resolve_conflict: resolved {len(conflict_ids)} conflicts using {prefer.value}")
+        logger.info(
+            "resolve_conflict: resolved %d conflicts using %s",
+            len(conflict_ids),
+            prefer.value,
+        )
 
         # 전체 동기화 수행
         if prefer == SyncDirection.STATE_TO_PLAN:
-            return SyncManager.sync_state_to_plan(state, SyncTrigger.MANUAL)
+            return SyncManager._sync_state_to_plan_inner(
+                state, plan_obj, plan_map, result, False
+            )
         else:
-            return SyncManager.sync_plan_to_state(state, SyncTrigger.MANUAL)
+            return SyncManager._sync_plan_to_state_inner(
+                state, plan_obj, plan_map, result, False
+            )
 
 
 # ============================================================
@@ -4,7 +4,7 @@
 from .todo_manager import TodoDependencyManager, todo_dependency_manager
 
 # Validation
-from .todo_validator import TodoValidator
+from .todo_validator import TodoValidator, IntentView
 
 # Creation
 from .todo_creator import (
@@ -20,10 +20,15 @@ from .todo_updater import update_todo_status
 
 # Queries
 from .todo_queries import (
+    TodoIndex,
+    ReadyTracker,
     get_pending_todos,
+    peek_next_pending,
+    get_ready_todos,
     get_in_progress_todos,
     get_completed_todos,
-    get_failed_todos
+    get_failed_todos,
+    partition_by_status
 )
 
 # Failure Recovery
@@ -41,6 +46,7 @@ __all__ = [
     "todo_dependency_manager",
     # Validation
     "TodoValidator",
+    "IntentView",
     # Creation
     "create_todo",
     "create_ml_todo",
@@ -50,10 +56,15 @@ __all__ = [
     "todo_reducer",
     "update_todo_status",
     # Queries
+    "TodoIndex",
+    "ReadyTracker",
     "get_pending_todos",
+    "peek_next_pending",
+    "get_ready_todos",
     "get_in_progress_todos",
     "get_completed_todos",
     "get_failed_todos",
+    "partition_by_status",
     # Failure Recovery
     "TodoFailureRecovery",
     "todo_failure_recovery",
@@ -6,6 +6,12 @@ from backend.app.dream_agent.models.todo import (
     TodoMetadata
 )
 
+# create_todo_legacy: dict.pop 기본값 (None 값과 키 없음 구분)
+_MISSING = object()
+
+# 내부 생성 헬퍼용 metadata 팩토리 (검증 생략, 하위 config는 기본값으로 채워짐)
+_EMPTY_METADATA_FACTORY = TodoMetadata.model_construct
+
 
 def create_todo(
     task: str,
@@ -38,20 +44,22 @@ def create_todo(
         TodoItem
     """
     if metadata is None:
-        # metadata 자동 생성
-        metadata = TodoMetadata()
+        # metadata 자동 생성 (todo마다 새 인스턴스 - update_todo_status 등이 제자리 수정하므로 공유 불가)
+        metadata = _EMPTY_METADATA_FACTORY()
 
-        if tool:
-            metadata.execution.tool = tool
+        # 선택 인자가 모두 없으면 (골격 todo) 개별 검사 생략
+        if tool or tool_params or depends_on or output_path:
+            if tool:
+                metadata.execution.tool = tool
 
-        if tool_params:
-            metadata.execution.tool_params = tool_params
+            if tool_params:
+                metadata.execution.tool_params = tool_params
 
-        if depends_on:
-            metadata.dependency.depends_on = depends_on
+            if depends_on:
+                metadata.dependency.depends_on = depends_on
 
-        if output_path:
-            metadata.data.output_path = output_path
+            if output_path:
+                metadata.data.output_path = output_path
 
     return TodoItem(
         task=task,
@@ -72,15 +80,25 @@ def create_ml_todo(
     depends_on: Optional[List[str]] = None
 ) -> TodoItem:
     """ML Execution Todo 생성 헬퍼"""
-    return create_todo(
+    metadata = _EMPTY_METADATA_FACTORY()
+    metadata.execution.tool = tool
+
+    if tool_params:
+        metadata.execution.tool_params = tool_params
+
+    if depends_on:
+        metadata.dependency.depends_on = depends_on
+
+    if output_path:
+        metadata.data.output_path = output_path
+
+    # 공개 헬퍼이므로 TodoItem 검증 유지 (priority 0-10 등) - metadata 골격만 검증 생략
+    return TodoItem(
         task=task,
-        task_type=f"ml_{tool}",
         layer="ml_execution",
+        task_type=f"ml_{tool}",
         priority=priority,
-        tool=tool,
-        tool_params=tool_params or {},
-        output_path=output_path,
-        depends_on=depends_on or []
+        metadata=metadata
     )
 
 
@@ -93,7 +111,7 @@ def create_biz_todo(
     depends_on: Optional[List[str]] = None
 ) -> TodoItem:
     """Biz Execution Todo 생성 헬퍼"""
-    metadata = TodoMetadata()
+    metadata = _EMPTY_METADATA_FACTORY()
     metadata.execution.tool = tool
     metadata.approval.requires_approval = requires_approval
     metadata.dependency.depends_on = depends_on or []
@@ -101,10 +119,11 @@ def create_biz_todo(
     if input_data:
         metadata.data.input_data = input_data
 
+    # 공개 헬퍼이므로 TodoItem 검증 유지 (priority 0-10 등) - metadata 골격만 검증 생략
     return TodoItem(
         task=task,
-        task_type=f"biz_{tool}",
         layer="biz_execution",
+        task_type=f"biz_{tool}",
         priority=priority,
         metadata=metadata
     )
@@ -125,27 +144,32 @@ def create_todo_legacy(
     todo_metadata = TodoMetadata()
 
     if metadata:
-        # dict에서 TodoMetadata 필드 추출
-        if "tool" in metadata:
-            todo_metadata.execution.tool = metadata["tool"]
+        # dict에서 TodoMetadata 필드 추출 (복사본에서 pop → 남은 키는 context)
+        remaining = dict(metadata)
+
+        value = remaining.pop("tool", _MISSING)
+        if value is not _MISSING:
+            todo_metadata.execution.tool = value
 
-        if "tool_params" in metadata:
-            todo_metadata.execution.tool_params = metadata["tool_params"]
+        value = remaining.pop("tool_params", _MISSING)
+        if value is not _MISSING:
+            todo_metadata.execution.tool_params = value
 
-        if "source" in metadata:
+        value = remaining.pop("source", _MISSING)
+        if value is not _MISSING:
             # collector 등에서 사용하는 source
-            todo_metadata.execution.tool_params["source"] = metadata["source"]
+            todo_metadata.execution.tool_params["source"] = value
 
-        if "depends_on" in metadata:
-            todo_metadata.dependency.depends_on = metadata["depends_on"]
+        value = remaining.pop("depends_on", _MISSING)
+        if value is not _MISSING:
+            todo_metadata.dependency.depends_on = value
 
-        if "output_path" in metadata:
-            todo_metadata.data.output_path = metadata["output_path"]
+        value = remaining.pop("output_path", _MISSING)
+        if value is not _MISSING:
+            todo_metadata.data.output_path = value
 
         # 기타 필드는 context에 저장
-        for key, value in metadata.items():
-            if key not in ["tool", "tool_params", "source", "depends_on", "output_path"]:
-                todo_metadata.context[key] = value
+        todo_metadata.context.update(remaining)
 
     return TodoItem(
         task=task,
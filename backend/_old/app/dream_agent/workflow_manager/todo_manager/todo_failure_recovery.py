@@ -2,22 +2,255 @@
 
 import asyncio
 import json
-from typing import Dict, Any, List, Optional
+import random
+import re
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from backend.app.core.logging import get_logger
 from backend.app.dream_agent.models.todo import TodoItem
 from .todo_updater import update_todo_status
+from .todo_manager import todo_dependency_manager
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = get_logger(__name__)
 
+# 에러 분류 패턴 (그룹 순서 = 우선순위, lastgroup으로 분류)
+_ERROR_PATTERN = re.compile(
+    r"(?P<timeout>timeout|timed out)"
+    r"|(?P<temporary_network>network|connection)"
+    r"|(?P<rate_limit>rate limit|429)"
+    r"|(?P<invalid_input>invalid|validation)"
+    r"|(?P<missing_data>not found|missing)"
+    r"|(?P<permission_denied>permission|forbidden|403)"
+    r"|(?P<quota_exceeded>quota|limit exceeded)",
+    re.IGNORECASE
+)
+_ERROR_CATEGORIES = tuple(_ERROR_PATTERN.groupindex)
+
+# 자동 재시도 백오프 (초): uniform(BASE, BASE * 3**n), 최대 MAX
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+
+# 결과 dict 공용 상수 (updated_todos가 없을 때 공유하는 빈 tuple - 호출자는 변경하지 않음)
+_NO_UPDATES: Tuple[TodoItem, ...] = ()
+_RETRY_MSG = "사용자가 재시도를 선택했습니다"
+_MODIFY_RETRY_MSG = "파라미터를 수정하여 재시도합니다"
+_SKIP_MSG = "이 todo를 건너뛰었습니다"
+_ABORT_MSG = "사용자가 전체 작업을 중단했습니다"
+
+# 세션별 사용자 결정 큐 크기 (가득 차면 submit_user_decision이 QueueFull 발생)
+_DECISION_QUEUE_SIZE = 16
+
+
+def _fast_update(
+    todo: TodoItem,
+    history_entry: Dict[str, Any],
+    execution_update: Optional[Dict[str, Any]] = None,
+    progress_update: Optional[Dict[str, Any]] = None,
+    **fields: Any
+) -> TodoItem:
+    """
+    검증 없이 Todo 갱신본 생성 (이미 검증된 내부 데이터 전용)
+
+    변경되는 중첩 모델(execution/progress)과 history만 새로 만들고
+    나머지 필드는 원본과 공유합니다 (원본 todo는 변경되지 않음).
+    model_copy(update=...)는 검증 없이 __dict__만 복사하므로,
+    모든 필드의 기본값을 다시 확인하는 model_construct보다 빠릅니다.
+
+    Args:
+        todo: 원본 todo
+        history_entry: 추가할 history 항목
+        execution_update: metadata.execution 변경 필드
+        progress_update: metadata.progress 변경 필드
+        **fields: 최상위 변경 필드 (status, version 등)
+
+    Returns:
+        갱신된 TodoItem
+    """
+    metadata = todo.metadata
+    if execution_update or progress_update:
+        meta_update = {}
+        if execution_update:
+            meta_update["execution"] = metadata.execution.model_copy(update=execution_update)
+        if progress_update:
+            meta_update["progress"] = metadata.progress.model_copy(update=progress_update)
+        metadata = metadata.model_copy(update=meta_update)
+
+    fields["metadata"] = metadata
+    fields["history"] = [*todo.history, history_entry]
+    return todo.model_copy(update=fields)
+
+
+# 자동 수정 요청 프롬프트 (str.format용, 리터럴 중괄호는 {{ }})
+_FIX_PROMPT_TMPL = """
+Todo 실행 중 에러가 발생했습니다.
+
+**Todo**:
+- Task: {task}
+- Tool: {tool}
+- Parameters: {params}
+
+**Error**:
+{error}
+
+**요청**:
+1. 에러 원인을 분석하세요.
+2. tool_params를 수정하여 에러를 해결하세요.
+3. 수정된 tool_params를 JSON으로 반환하세요.
+
+출력 형식:
+{{
+  "analysis": "에러 원인 분석",
+  "fixed_params": {{}},
+  "explanation": "수정 사항 설명"
+}}
+"""
+
+
+def _dumps_indent(value: Any) -> str:
+    """프롬프트 삽입용 들여쓰기 JSON (orjson 우선)"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(value, indent=2)
+
+
+def _loads(text: str) -> Any:
+    """JSON 파싱 (orjson 우선, 실패 시 json.loads로 재시도)"""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _dumps(message: Dict[str, Any]) -> str:
+    """WebSocket 텍스트 프레임용 JSON 직렬화 (orjson 우선)"""
+    if HAS_ORJSON:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(message, ensure_ascii=False, default=str)
+
+
+# 실패 알림의 사용자 선택지 (고정값)
+_FAILURE_OPTIONS = [
+    {
+        "id": "retry",
+        "label": "재시도",
+        "description": "동일한 설정으로 다시 시도"
+    },
+    {
+        "id": "modify_and_retry",
+        "label": "수정 후 재시도",
+        "description": "파라미터를 수정한 후 재시도",
+        "requires_input": True
+    },
+    {
+        "id": "skip",
+        "label": "건너뛰기",
+        "description": "이 todo를 건너뛰고 다음으로 진행"
+    },
+    {
+        "id": "skip_dependent",
+        "label": "의존 todos도 건너뛰기",
+        "description": "이 todo와 의존하는 모든 todos 건너뛰기"
+    },
+    {
+        "id": "abort",
+        "label": "중단",
+        "description": "전체 작업 중단"
+    }
+]
+
+# orjson이면 미리 직렬화한 Fragment를 그대로 삽입 (알림마다 재인코딩하지 않음)
+if HAS_ORJSON:
+    _FAILURE_OPTIONS_JSON = orjson.dumps(_FAILURE_OPTIONS)
+    _FAILURE_OPTIONS_PAYLOAD: Any = orjson.Fragment(_FAILURE_OPTIONS_JSON)
+else:
+    _FAILURE_OPTIONS_PAYLOAD = _FAILURE_OPTIONS
+
+
+class _NotificationBatcher:
+    """
+    세션별 실패 알림 병합 전송
+
+    window 초 동안 쌓인 알림을 한 프레임으로 전송합니다.
+    - 1건: 기존 "todo_failure" 메시지 그대로
+    - 여러 건: {"type": "todo_failure_batch", "items": [...]}
+    max_items에 도달하면 즉시 전송합니다.
+    """
+
+    def __init__(self, window: float = 0.03, max_items: int = 50):
+        self._window = window
+        self._max_items = max_items
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._sockets: Dict[str, Any] = {}
+        self._timers: Dict[str, asyncio.Task] = {}
+
+    async def enqueue(self, websocket, session_id: str, payload: Dict[str, Any]) -> None:
+        """알림 추가 (전송은 window 후 또는 max_items 도달 시)"""
+        buffer = self._buffers.setdefault(session_id, [])
+        buffer.append(payload)
+        self._sockets[session_id] = websocket
+
+        if len(buffer) >= self._max_items:
+            timer = self._timers.pop(session_id, None)
+            if timer:
+                timer.cancel()
+            await self._flush(session_id)
+        elif session_id not in self._timers:
+            self._timers[session_id] = asyncio.create_task(self._flush_later(session_id))
+
+    async def _flush_later(self, session_id: str) -> None:
+        await asyncio.sleep(self._window)
+        self._timers.pop(session_id, None)
+        await self._flush(session_id)
+
+    async def _flush(self, session_id: str) -> None:
+        items = self._buffers.pop(session_id, None)
+        websocket = self._sockets.pop(session_id, None)
+        if not items or websocket is None:
+            return
+
+        if len(items) == 1:
+            message = items[0]
+        else:
+            message = {
+                "type": "todo_failure_batch",
+                "session_id": session_id,
+                "items": items,
+                "timestamp": datetime.now().isoformat()
+            }
+
+        try:
+            await websocket.send_text(_dumps(message))
+        except Exception as e:
+            logger.error(f"Failed to send failure notification for session {session_id}: {e}")
+
 
 class TodoFailureRecovery:
     """Todo 실패 복구 관리자"""
 
     def __init__(self):
-        self._pending_decisions: Dict[str, asyncio.Event] = {}
-        self._decision_results: Dict[str, Dict[str, Any]] = {}
+        # 세션별 bounded 결정 큐 + 대기 중인 todo ID -> future (대기자가 없으면 세션 항목 제거)
+        self._session_queues: Dict[str, asyncio.Queue] = {}
+        self._pending_decisions: Dict[str, Dict[str, asyncio.Future]] = {}
+        self._batcher = _NotificationBatcher()
+        # 사용자 결정 action -> 핸들러
+        self._decision_handlers = {
+            "retry": self._apply_retry,
+            "modify_and_retry": self._apply_modify_retry,
+            "skip": self._apply_skip,
+            "skip_dependent": self._apply_skip_dependent,
+            "abort": self._apply_abort,
+        }
 
     async def handle_todo_failure(
         self,
@@ -48,7 +281,7 @@ class TodoFailureRecovery:
             {
                 "action": "retry" | "modify_and_retry" | "skip" | "abort",
                 "updated_todo": TodoItem,
-                "updated_todos": List[TodoItem],  # 의존 todos 업데이트
+                "updated_todos": Sequence[TodoItem],  # 의존 todos 업데이트 (없으면 공유 빈 tuple)
                 "message": str
             }
         """
@@ -100,28 +333,13 @@ class TodoFailureRecovery:
 
     def _classify_error(self, error: Exception) -> str:
         """에러 분류"""
-        error_msg = str(error).lower()
-
-        if "timeout" in error_msg or "timed out" in error_msg:
-            return "timeout"
+        error_msg = str(error)
 
-        if "network" in error_msg or "connection" in error_msg:
-            return "temporary_network"
-
-        if "rate limit" in error_msg or "429" in error_msg:
-            return "rate_limit"
-
-        if "invalid" in error_msg or "validation" in error_msg:
-            return "invalid_input"
-
-        if "not found" in error_msg or "missing" in error_msg:
-            return "missing_data"
-
-        if "permission" in error_msg or "forbidden" in error_msg or "403" in error_msg:
-            return "permission_denied"
-
-        if "quota" in error_msg or "limit exceeded" in error_msg:
-            return "quota_exceeded"
+        # 카테고리별로 가장 먼저 매칭되는 위치가 아니라 기존 if 순서의 우선순위를 유지
+        matched = {m.lastgroup for m in _ERROR_PATTERN.finditer(error_msg)}
+        for category in _ERROR_CATEGORIES:
+            if category in matched:
+                return category
 
         return "unknown"
 
@@ -148,34 +366,41 @@ class TodoFailureRecovery:
                 "reason": "Max retries exceeded"
             }
 
-        # 지수 백오프
-        wait_time = 2 ** todo.metadata.execution.retry_count
+        # 지수 백오프 (jitter + 상한, 동시 재시도의 wakeup 동기화 방지)
+        wait_time = round(min(
+            _RETRY_MAX_DELAY,
+            random.uniform(
+                _RETRY_BASE_DELAY,
+                _RETRY_BASE_DELAY * 3 ** todo.metadata.execution.retry_count
+            )
+        ), 2)
         logger.info(f"Auto-retry todo {todo.id} after {wait_time}s (attempt {todo.metadata.execution.retry_count + 1}/{todo.metadata.execution.max_retries})")
 
         await asyncio.sleep(wait_time)
 
-        # Todo 업데이트 (pending으로, retry_count 증가)
-        updated_todo = todo.model_copy(update={
-            "status": "pending",
-            "version": todo.version + 1,
-            "updated_at": datetime.now()
-        })
-
-        updated_todo.metadata.execution.retry_count += 1
-        updated_todo.metadata.progress.error_message = None  # 에러 클리어
-
-        updated_todo.history.append({
-            "timestamp": datetime.now().isoformat(),
-            "action": "auto_retry",
-            "error": str(error),
-            "retry_count": updated_todo.metadata.execution.retry_count,
-            "wait_time": wait_time
-        })
+        # Todo 업데이트 (pending으로, retry_count 증가, 에러 클리어)
+        now = datetime.now()
+        retry_count = todo.metadata.execution.retry_count + 1
+        updated_todo = _fast_update(
+            todo,
+            {
+                "timestamp": now.isoformat(),
+                "action": "auto_retry",
+                "error": str(error),
+                "retry_count": retry_count,
+                "wait_time": wait_time
+            },
+            execution_update={"retry_count": retry_count},
+            progress_update={"error_message": None},
+            status="pending",
+            version=todo.version + 1,
+            updated_at=now
+        )
 
         return {
             "action": "retry",
             "updated_todo": updated_todo,
-            "updated_todos": [],
+            "updated_todos": _NO_UPDATES,
             "message": f"Auto-retrying after {wait_time}s (attempt {updated_todo.metadata.execution.retry_count})"
         }
 
@@ -201,29 +426,12 @@ class TodoFailureRecovery:
 
             llm_client = get_llm_client()
 
-            fix_prompt = f"""
-Todo 실행 중 에러가 발생했습니다.
-
-**Todo**:
-- Task: {todo.task}
-- Tool: {todo.metadata.execution.tool}
-- Parameters: {json.dumps(todo.metadata.execution.tool_params, indent=2)}
-
-**Error**:
-{error}
-
-**요청**:
-1. 에러 원인을 분석하세요.
-2. tool_params를 수정하여 에러를 해결하세요.
-3. 수정된 tool_params를 JSON으로 반환하세요.
-
-출력 형식:
-{{
-  "analysis": "에러 원인 분석",
-  "fixed_params": {{}},
-  "explanation": "수정 사항 설명"
-}}
-"""
+            fix_prompt = _FIX_PROMPT_TMPL.format(
+                task=todo.task,
+                tool=todo.metadata.execution.tool,
+                params=_dumps_indent(todo.metadata.execution.tool_params),
+                error=error
+            )
 
             response = await llm_client.chat_with_system(
                 system_prompt="You are a helpful assistant that fixes errors.",
@@ -231,34 +439,36 @@ Todo 실행 중 에러가 발생했습니다.
                 max_tokens=500
             )
 
-            fix_data = json.loads(response)
+            fix_data = _loads(response)
 
             # Todo 업데이트
-            updated_todo = todo.model_copy(update={
-                "status": "pending",
-                "version": todo.version + 1,
-                "updated_at": datetime.now()
-            })
-
-            updated_todo.metadata.execution.tool_params = fix_data["fixed_params"]
-            updated_todo.metadata.execution.retry_count += 1
-            updated_todo.metadata.progress.error_message = None
-
-            updated_todo.history.append({
-                "timestamp": datetime.now().isoformat(),
-                "action": "auto_fix",
-                "error": str(error),
-                "fix_explanation": fix_data["explanation"],
-                "old_params": todo.metadata.execution.tool_params,
-                "new_params": fix_data["fixed_params"]
-            })
+            now = datetime.now()
+            updated_todo = _fast_update(
+                todo,
+                {
+                    "timestamp": now.isoformat(),
+                    "action": "auto_fix",
+                    "error": str(error),
+                    "fix_explanation": fix_data["explanation"],
+                    "old_params": todo.metadata.execution.tool_params,
+                    "new_params": fix_data["fixed_params"]
+                },
+                execution_update={
+                    "tool_params": fix_data["fixed_params"],
+                    "retry_count": todo.metadata.execution.retry_count + 1
+                },
+                progress_update={"error_message": None},
+                status="pending",
+                version=todo.version + 1,
+                updated_at=now
+            )
 
             logger.info(f"Auto-fixed todo {todo.id}: {fix_data['explanation']}")
 
             return {
                 "action": "retry_with_fix",
                 "updated_todo": updated_todo,
-                "updated_todos": [],
+                "updated_todos": _NO_UPDATES,
                 "message": f"Auto-fixed: {fix_data['explanation']}"
             }
 
@@ -322,8 +532,8 @@ Todo 실행 중 에러가 발생했습니다.
                 error=error
             )
         else:
-            # 직접 WebSocket 메시지 전송
-            await websocket_callback.websocket.send_json({
+            # 직접 WebSocket 메시지 전송 (짧은 window 내 알림은 한 프레임으로 병합)
+            await self._batcher.enqueue(websocket_callback.websocket, session_id, {
                 "type": "todo_failure",
                 "session_id": session_id,
                 "todo": {
@@ -338,34 +548,7 @@ Todo 실행 중 에러가 발생했습니다.
                     "message": str(error),
                     "retry_count": todo.metadata.execution.retry_count
                 },
-                "options": [
-                    {
-                        "id": "retry",
-                        "label": "재시도",
-                        "description": "동일한 설정으로 다시 시도"
-                    },
-                    {
-                        "id": "modify_and_retry",
-                        "label": "수정 후 재시도",
-                        "description": "파라미터를 수정한 후 재시도",
-                        "requires_input": True
-                    },
-                    {
-                        "id": "skip",
-                        "label": "건너뛰기",
-                        "description": "이 todo를 건너뛰고 다음으로 진행"
-                    },
-                    {
-                        "id": "skip_dependent",
-                        "label": "의존 todos도 건너뛰기",
-                        "description": "이 todo와 의존하는 모든 todos 건너뛰기"
-                    },
-                    {
-                        "id": "abort",
-                        "label": "중단",
-                        "description": "전체 작업 중단"
-                    }
-                ],
+                "options": _FAILURE_OPTIONS_PAYLOAD,
                 "timestamp": datetime.now().isoformat()
             })
 
@@ -386,38 +569,60 @@ Todo 실행 중 에러가 발생했습니다.
         Returns:
             사용자 결정
         """
-        decision_key = f"{session_id}:{todo_id}"
-
-        # 이벤트 생성
-        event = asyncio.Event()
-        self._pending_decisions[decision_key] = event
+        pending = self._pending_decisions.setdefault(session_id, {})
+        queue = self._session_queues.get(session_id)
+        if queue is None:
+            queue = self._session_queues[session_id] = asyncio.Queue(_DECISION_QUEUE_SIZE)
+        own = pending[todo_id] = asyncio.get_running_loop().create_future()
+        getter: Optional[asyncio.Future] = None
 
         try:
-            # 대기
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-
-            # 결과 반환
-            result = self._decision_results.get(decision_key, {
-                "action": "skip",
-                "reason": "No decision received"
-            })
-
-            return result
-
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(timeout):
+                # 큐에서 꺼낸 결정은 해당 대기자의 future로 전달
+                # (되돌려 넣으면 두 대기자가 서로의 결정만 번갈아 꺼내며 타임아웃까지 헛돎)
+                while not own.done():
+                    getter = asyncio.ensure_future(queue.get())
+                    await asyncio.wait((getter, own), return_when=asyncio.FIRST_COMPLETED)
+                    if getter.done():
+                        self._route_decision(pending, getter.result())
+                        getter = None
+                return own.result()
+
+        except TimeoutError:
             # 타임아웃 시 자동 skip
-            logger.warning(f"User decision timeout for {decision_key} - auto-skipping")
+            logger.warning(f"User decision timeout for {session_id}:{todo_id} - auto-skipping")
             return {
                 "action": "skip",
                 "reason": "Timeout - auto-skipped"
             }
 
         finally:
-            # 정리
-            self._pending_decisions.pop(decision_key, None)
-            self._decision_results.pop(decision_key, None)
+            if getter is not None:
+                # 이미 꺼낸 결정은 다른 대기자에게 넘기고, 대기 중이면 취소
+                if getter.done() and not getter.cancelled():
+                    self._route_decision(pending, getter.result())
+                else:
+                    getter.cancel()
+            # 정리 (세션에 남은 대기자가 없으면 큐째 제거 → 늦게 온 결정도 함께 폐기)
+            pending.pop(todo_id, None)
+            if not pending:
+                self._pending_decisions.pop(session_id, None)
+                self._session_queues.pop(session_id, None)
+
+    @staticmethod
+    def _route_decision(pending: Dict[str, asyncio.Future], decision: Dict[str, Any]) -> None:
+        """
+        결정을 해당 todo 대기자의 future로 전달 (대기자가 없거나 이미 받았으면 폐기)
+
+        Args:
+            pending: 세션의 todo ID -> 대기 future
+            decision: 큐에서 꺼낸 사용자 결정
+        """
+        waiter = pending.get(decision["todo_id"])
+        if waiter is not None and not waiter.done():
+            waiter.set_result(decision)
 
-    def submit_user_decision(
+    async def submit_user_decision(
         self,
         session_id: str,
         todo_id: str,
@@ -432,22 +637,23 @@ Todo 실행 중 에러가 발생했습니다.
             todo_id: todo ID
             action: 액션 (retry, modify_and_retry, skip, skip_dependent, abort)
             data: 추가 데이터 (modify_and_retry 시 modified_params)
+
+        Raises:
+            asyncio.QueueFull: 세션 결정 큐가 가득 찬 경우
         """
         decision_key = f"{session_id}:{todo_id}"
 
-        if decision_key not in self._pending_decisions:
+        if todo_id not in self._pending_decisions.get(session_id, ()):
             logger.warning(f"No pending decision for {decision_key}")
             return
 
-        # 결과 저장
-        self._decision_results[decision_key] = {
+        # 대기자에게 전달 (큐가 가득 차면 호출자에게 QueueFull 전파)
+        self._session_queues[session_id].put_nowait({
+            "todo_id": todo_id,
             "action": action,
             "data": data or {},
             "timestamp": datetime.now().isoformat()
-        }
-
-        # 이벤트 발동
-        self._pending_decisions[decision_key].set()
+        })
 
         logger.info(f"User decision received for {decision_key}: {action}")
 
@@ -458,7 +664,7 @@ Todo 실행 중 에러가 발생했습니다.
         decision: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        사용자 결정 처리
+        사용자 결정 처리 (action별 핸들러로 분기)
 
         Args:
             failed_todo: 실패한 todo
@@ -468,136 +674,176 @@ Todo 실행 중 에러가 발생했습니다.
         Returns:
             처리 결과
         """
-        action = decision["action"]
+        handler = self._decision_handlers.get(decision["action"], self._apply_unknown)
+        return await handler(failed_todo, todos, decision)
 
-        if action == "retry":
-            # 재시도
-            updated_todo = failed_todo.model_copy(update={
-                "status": "pending",
-                "version": failed_todo.version + 1
-            })
+    @staticmethod
+    def _base_updated_todo(
+        todo: TodoItem,
+        status: str,
+        history_entry: Dict[str, Any],
+        **updates: Any
+    ) -> TodoItem:
+        """상태 전이 공통 처리 (history 추가 + version 증가)"""
+        return _fast_update(
+            todo,
+            history_entry,
+            status=status,
+            version=todo.version + 1,
+            **updates
+        )
 
-            updated_todo.metadata.progress.error_message = None
-            updated_todo.history.append({
+    async def _apply_retry(
+        self,
+        failed_todo: TodoItem,
+        todos: List[TodoItem],
+        decision: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """재시도"""
+        updated_todo = self._base_updated_todo(
+            failed_todo,
+            "pending",
+            {
                 "timestamp": datetime.now().isoformat(),
                 "action": "user_retry",
                 "reason": decision.get("reason", "User requested retry")
-            })
-
-            return {
-                "action": "retry",
-                "updated_todo": updated_todo,
-                "updated_todos": [],
-                "message": "사용자가 재시도를 선택했습니다"
-            }
-
-        elif action == "modify_and_retry":
-            # 수정 후 재시도
-            modified_params = decision.get("data", {}).get("modified_params", {})
+            },
+            progress_update={"error_message": None}
+        )
 
-            updated_todo = failed_todo.model_copy(update={
-                "status": "pending",
-                "version": failed_todo.version + 1
-            })
+        return {
+            "action": "retry",
+            "updated_todo": updated_todo,
+            "updated_todos": _NO_UPDATES,
+            "message": _RETRY_MSG
+        }
 
-            updated_todo.metadata.execution.tool_params = modified_params
-            updated_todo.metadata.progress.error_message = None
+    async def _apply_modify_retry(
+        self,
+        failed_todo: TodoItem,
+        todos: List[TodoItem],
+        decision: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """수정 후 재시도"""
+        modified_params = decision.get("data", {}).get("modified_params", {})
 
-            updated_todo.history.append({
+        updated_todo = self._base_updated_todo(
+            failed_todo,
+            "pending",
+            {
                 "timestamp": datetime.now().isoformat(),
                 "action": "user_modify_and_retry",
                 "old_params": failed_todo.metadata.execution.tool_params,
                 "new_params": modified_params
-            })
-
-            return {
-                "action": "retry",
-                "updated_todo": updated_todo,
-                "updated_todos": [],
-                "message": "파라미터를 수정하여 재시도합니다"
-            }
+            },
+            execution_update={"tool_params": modified_params},
+            progress_update={"error_message": None}
+        )
 
-        elif action == "skip":
-            # 건너뛰기
-            updated_todo = failed_todo.model_copy(update={
-                "status": "skipped",
-                "version": failed_todo.version + 1
-            })
+        return {
+            "action": "retry",
+            "updated_todo": updated_todo,
+            "updated_todos": _NO_UPDATES,
+            "message": _MODIFY_RETRY_MSG
+        }
 
-            updated_todo.history.append({
+    async def _apply_skip(
+        self,
+        failed_todo: TodoItem,
+        todos: List[TodoItem],
+        decision: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """건너뛰기"""
+        updated_todo = self._base_updated_todo(
+            failed_todo,
+            "skipped",
+            {
                 "timestamp": datetime.now().isoformat(),
                 "action": "user_skip",
                 "reason": decision.get("reason", "User skipped")
-            })
-
-            return {
-                "action": "skip",
-                "updated_todo": updated_todo,
-                "updated_todos": [],
-                "message": "이 todo를 건너뛰었습니다"
             }
+        )
 
-        elif action == "skip_dependent":
-            # Import at function scope to avoid circular dependency
-            from backend.app.dream_agent.workflow_manager import TodoDependencyManager
-
-            # 의존 todos도 건너뛰기
-            updated_todo = failed_todo.model_copy(update={
-                "status": "skipped",
-                "version": failed_todo.version + 1
-            })
-
-            # 의존하는 todos 찾기 (순환 import 방지를 위해 지연 import)
-            from backend.app.dream_agent.workflow_manager import TodoDependencyManager
-            dependent_todos = TodoDependencyManager.get_dependent_todos(
-                todos, failed_todo.id
-            )
-
-            # 모두 skipped로 변경
-            updated_todos = []
-            for dep_todo in dependent_todos:
-                updated_dep = dep_todo.model_copy(update={
-                    "status": "skipped",
-                    "version": dep_todo.version + 1
-                })
+        return {
+            "action": "skip",
+            "updated_todo": updated_todo,
+            "updated_todos": _NO_UPDATES,
+            "message": _SKIP_MSG
+        }
 
-                updated_dep.metadata.progress.error_message = (
-                    f"Skipped: dependency {failed_todo.id} was skipped"
-                )
+    async def _apply_skip_dependent(
+        self,
+        failed_todo: TodoItem,
+        todos: List[TodoItem],
+        decision: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """의존 todos도 건너뛰기"""
+        updated_todo = failed_todo.model_copy(update={
+            "status": "skipped",
+            "version": failed_todo.version + 1
+        })
 
-                updated_dep.history.append({
-                    "timestamp": datetime.now().isoformat(),
-                    "action": "auto_skip_dependent",
-                    "reason": f"Dependency {failed_todo.id} was skipped by user"
-                })
+        # 직/간접 의존 todos 찾기 (역방향 인덱스 + BFS)
+        dependent_todos = todo_dependency_manager.get_transitive_dependents(
+            todos, failed_todo.id
+        )
 
-                updated_todos.append(updated_dep)
+        # 모두 skipped로 변경 (history/에러 메시지는 모든 의존 todo에 동일)
+        # history 항목은 todo마다 독립 dict가 되도록 템플릿을 복사
+        history_tmpl = {
+            "timestamp": datetime.now().isoformat(),
+            "action": "auto_skip_dependent",
+            "reason": f"Dependency {failed_todo.id} was skipped by user"
+        }
+        progress_update = {
+            "error_message": f"Skipped: dependency {failed_todo.id} was skipped"
+        }
+        updated_todos = [
+            self._base_updated_todo(
+                dep_todo,
+                "skipped",
+                history_tmpl.copy(),
+                progress_update=progress_update
+            )
+            for dep_todo in dependent_todos
+        ]
 
-            return {
-                "action": "skip",
-                "updated_todo": updated_todo,
-                "updated_todos": updated_todos,
-                "message": f"이 todo와 의존하는 {len(updated_todos)}개 todos를 건너뛰었습니다"
-            }
+        return {
+            "action": "skip",
+            "updated_todo": updated_todo,
+            "updated_todos": updated_todos,
+            "message": f"이 todo와 의존하는 {len(updated_todos)}개 todos를 건너뛰었습니다"
+        }
 
-        elif action == "abort":
-            # 전체 중단
-            return {
-                "action": "abort",
-                "updated_todo": failed_todo,
-                "updated_todos": [],
-                "message": "사용자가 전체 작업을 중단했습니다"
-            }
+    async def _apply_abort(
+        self,
+        failed_todo: TodoItem,
+        todos: List[TodoItem],
+        decision: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """전체 중단 (todo 변경 없음)"""
+        return {
+            "action": "abort",
+            "updated_todo": failed_todo,
+            "updated_todos": _NO_UPDATES,
+            "message": _ABORT_MSG
+        }
 
-        else:
-            # 알 수 없는 액션
-            logger.error(f"Unknown action: {action}")
-            return {
-                "action": "skip",
-                "updated_todo": failed_todo,
-                "updated_todos": [],
-                "message": f"알 수 없는 액션: {action}"
-            }
+    async def _apply_unknown(
+        self,
+        failed_todo: TodoItem,
+        todos: List[TodoItem],
+        decision: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """알 수 없는 액션"""
+        action = decision["action"]
+        logger.error(f"Unknown action: {action}")
+        return {
+            "action": "skip",
+            "updated_todo": failed_todo,
+            "updated_todos": _NO_UPDATES,
+            "message": f"알 수 없는 액션: {action}"
+        }
 
 
 # 글로벌 인스턴스
@@ -6,6 +6,7 @@ P0-4.3: BaseManager 상속 및 Instance Method 리팩토링
 - 기존 인터페이스 호환성 유지
 """
 
+from collections import deque
 from typing import List, Set, Dict, Tuple, Optional
 from backend.app.core.logging import get_logger
 from backend.app.dream_agent.models.todo import TodoItem
@@ -13,6 +14,7 @@ from backend.app.dream_agent.workflow_manager.base_manager import (
     BaseManager,
     ManagerStatus,
 )
+from .todo_queries import get_ready_todos as _get_ready_todos
 
 logger = get_logger(__name__)
 
@@ -90,57 +92,7 @@ class TodoDependencyManager(BaseManager):
         Returns:
             실행 가능한 todos (우선순위 순)
         """
-        # Completed todo IDs
-        completed_ids = {
-            t.id for t in todos
-            if t.status == "completed"
-        }
-
-        # Completed todos의 tool name → todo ID 매핑
-        # depends_on=["collector"] 형태의 의존성 해결용
-        completed_tools: Set[str] = set()
-        for t in todos:
-            if t.status == "completed":
-                # metadata.execution.tool에서 tool name 추출
-                if hasattr(t, "metadata") and t.metadata:
-                    if hasattr(t.metadata, "execution") and t.metadata.execution:
-                        tool_name = t.metadata.execution.tool
-                        if tool_name:
-                            completed_tools.add(tool_name)
-
-        def is_dependency_satisfied(dep: str) -> bool:
-            """
-            의존성이 충족되었는지 확인
-
-            Args:
-                dep: 의존성 (todo ID 또는 tool name)
-
-            Returns:
-                충족 여부
-            """
-            # 1. UUID 형식인지 확인 (todo ID)
-            if dep in completed_ids:
-                return True
-
-            # 2. Tool name으로 확인
-            if dep in completed_tools:
-                return True
-
-            return False
-
-        ready = []
-        for todo in todos:
-            if todo.status != "pending":
-                continue
-
-            # 의존성 확인
-            dependencies = todo.metadata.dependency.depends_on
-
-            if all(is_dependency_satisfied(dep) for dep in dependencies):
-                ready.append(todo)
-
-        # 우선순위 순 정렬 (높은 것 먼저)
-        return sorted(ready, key=lambda x: -x.priority)
+        return _get_ready_todos(todos)
 
     @staticmethod
     def _build_tool_to_id_map(todos: List[TodoItem]) -> Dict[str, str]:
@@ -303,6 +255,49 @@ class TodoDependencyManager(BaseManager):
 
         return dependent
 
+    def get_transitive_dependents(
+        self,
+        todos: List[TodoItem],
+        todo_id: str
+    ) -> List[TodoItem]:
+        """
+        특정 todo에 직/간접적으로 의존하는 todos 찾기
+
+        depends_on 값(todo ID 또는 tool name) → 의존 todo IDs 역방향 인덱스를
+        한 번 구축한 뒤 BFS로 전이 폐포를 구합니다.
+        각 단계의 매칭 규칙은 get_dependent_todos와 같습니다.
+
+        Args:
+            todos: Todo 리스트
+            todo_id: 대상 todo ID
+
+        Returns:
+            todo_id에 직/간접 의존하는 todos (리스트 순)
+        """
+        todo_map: Dict[str, TodoItem] = {}
+        dependents_index: Dict[str, Set[str]] = {}
+        for todo in todos:
+            todo_map[todo.id] = todo
+            for dep in todo.metadata.dependency.depends_on:
+                dependents_index.setdefault(dep, set()).add(todo.id)
+
+        found: Set[str] = set()
+        queue = deque([todo_id])
+        while queue:
+            current = todo_map.get(queue.popleft())
+            if current is None:
+                continue
+            keys = [current.id]
+            if current.metadata.execution.tool:
+                keys.append(current.metadata.execution.tool)
+            for key in keys:
+                for dependent_id in dependents_index.get(key, ()):
+                    if dependent_id not in found and dependent_id != todo_id:
+                        found.add(dependent_id)
+                        queue.append(dependent_id)
+
+        return [t for t in todos if t.id in found]
+
     def build_dependency_graph(
         self,
         todos: List[TodoItem]
@@ -1,45 +1,365 @@
 """Todo Queries - Todo 조회 헬퍼 함수들"""
 
-from typing import List, Optional
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Set
 from backend.app.dream_agent.models.todo import TodoItem
 
+_PRIO = attrgetter("priority")
 
-def get_pending_todos(todos: List[TodoItem], layer: Optional[str] = None) -> List[TodoItem]:
+
+class TodoIndex:
+    """
+    상태별 Todo 인덱스
+
+    buckets[status][layer] = {todo_id: TodoItem}
+    한 번 구축하면 상태/레이어 조회가 전체 스캔 없이 O(k log k)이며,
+    결과는 최초 삽입 순서(리스트 순서)를 유지합니다.
+    update_todo_status(index=...)가 상태 전이 시 버킷을 이동시킵니다.
+
+    Example:
+        index = TodoIndex(todos)
+        pending = get_pending_todos(todos, index=index)
+        todos = update_todo_status(todos, todo_id, "completed", index=index)
+    """
+
+    def __init__(self, todos: Iterable[TodoItem] = ()):
+        self.buckets: Dict[str, Dict[str, Dict[str, TodoItem]]] = {}
+        self._seq: Dict[str, int] = {}  # todo_id -> 최초 삽입 순번 (상태 전이 후에도 유지)
+        self._pending_cache: Dict[Optional[str], List[TodoItem]] = {}
+        for todo in todos:
+            self.add(todo)
+
+    def add(self, todo: TodoItem) -> None:
+        """Todo 추가 (같은 ID가 있으면 덮어씀)"""
+        self._seq.setdefault(todo.id, len(self._seq))
+        self.buckets.setdefault(todo.status, {}).setdefault(todo.layer, {})[todo.id] = todo
+        if todo.status == "pending":
+            self._pending_cache.clear()
+
+    def remove(self, todo: TodoItem) -> None:
+        """Todo 제거 (없으면 무시)"""
+        layers = self.buckets.get(todo.status)
+        if layers is None:
+            return
+        bucket = layers.get(todo.layer)
+        if bucket is not None and bucket.pop(todo.id, None) is not None:
+            if todo.status == "pending":
+                self._pending_cache.clear()
+
+    def replace(self, old: TodoItem, new: TodoItem) -> None:
+        """상태 전이 반영 (old 버킷에서 제거 후 new 버킷에 추가)"""
+        self.remove(old)
+        self.add(new)
+
+    def get(self, status: str, layer: Optional[str] = None) -> List[TodoItem]:
+        """
+        상태(및 레이어)별 Todo 조회
+
+        Args:
+            status: Todo 상태
+            layer: 필터링할 레이어 (None이면 전체)
+
+        Returns:
+            해당 todos (리스트 순)
+        """
+        layers = self.buckets.get(status)
+        if not layers:
+            return []
+        if layer:
+            result = list(layers.get(layer, {}).values())
+        else:
+            result = [todo for bucket in layers.values() for todo in bucket.values()]
+        seq = self._seq
+        result.sort(key=lambda t: seq[t.id])
+        return result
+
+    def pending(self, layer: Optional[str] = None) -> List[TodoItem]:
+        """pending todos (우선순위 순, 정렬 결과는 다음 pending 변경 전까지 캐시)"""
+        cached = self._pending_cache.get(layer)
+        if cached is None:
+            cached = sorted(self.get("pending", layer), key=_PRIO, reverse=True)
+            self._pending_cache[layer] = cached
+        return list(cached)
+
+
+class ReadyTracker:
+    """
+    의존성 in-degree 증분 추적 (실행 가능한 pending todo 집합 유지)
+
+    todo마다 미충족 의존성 수(in-degree)와 의존성 키(todo ID 또는 tool name)
+    → 대기 todo 역방향 인덱스를 유지합니다. todo가 completed가 되면 그
+    dependents만 감소시키므로 매 tick get_ready_todos로 전체를 다시 스캔하는
+    O(V+E) 대신 완료당 O(deg)입니다. completed는 최종 상태로 가정합니다.
+
+    Example:
+        tracker = ReadyTracker(todos)
+        ready = tracker.ready()
+        todos = update_todo_status(todos, todo_id, "completed", tracker=tracker)
+    """
+
+    def __init__(self, todos: Iterable[TodoItem] = ()):
+        self._todos: Dict[str, TodoItem] = {}
+        self._seq: Dict[str, int] = {}  # todo_id -> 최초 삽입 순번 (리스트 순서 유지용)
+        self._in_degree: Dict[str, int] = {}  # todo_id -> 미충족 의존성 수
+        self._dependents: Dict[str, List[str]] = {}  # 미충족 의존성 키 -> 대기 todo IDs
+        self._done: Set[str] = set()  # 충족된 의존성 키 (completed todo의 ID/tool)
+        self._ready: Dict[str, None] = {}  # in-degree 0인 pending todo IDs
+        for todo in todos:
+            self.add(todo)
+
+    def add(self, todo: TodoItem) -> List[TodoItem]:
+        """
+        Todo 추가
+
+        Returns:
+            이번 추가로 새로 실행 가능해진 todos
+        """
+        self._seq.setdefault(todo.id, len(self._seq))
+        self._todos[todo.id] = todo
+
+        if todo.status == "completed":
+            return self._complete(todo)
+
+        done = self._done
+        unmet = {dep for dep in todo.metadata.dependency.depends_on if dep not in done}
+        for dep in unmet:
+            self._dependents.setdefault(dep, []).append(todo.id)
+        self._in_degree[todo.id] = len(unmet)
+
+        if not unmet and todo.status == "pending":
+            self._ready[todo.id] = None
+            return [todo]
+        return []
+
+    def replace(self, old: TodoItem, new: TodoItem) -> List[TodoItem]:
+        """
+        상태 전이 반영
+
+        Returns:
+            이번 전이로 새로 실행 가능해진 todos
+        """
+        self._todos[new.id] = new
+
+        if new.status == "completed":
+            if old.status == "completed":
+                return []
+            return self._complete(new)
+
+        if new.status == "pending" and self._in_degree.get(new.id) == 0:
+            if new.id in self._ready:
+                return []
+            self._ready[new.id] = None
+            return [new]
+
+        self._ready.pop(new.id, None)
+        return []
+
+    def _complete(self, todo: TodoItem) -> List[TodoItem]:
+        """completed 처리: todo의 ID/tool 키에 걸린 dependents의 in-degree 감소"""
+        self._ready.pop(todo.id, None)
+        self._in_degree.pop(todo.id, None)
+
+        newly_ready = []
+        in_degree = self._in_degree
+        for key in (todo.id, todo.metadata.execution.tool):
+            if not key or key in self._done:
+                continue
+            self._done.add(key)
+            for dep_id in self._dependents.pop(key, ()):
+                if dep_id not in in_degree:
+                    continue
+                in_degree[dep_id] -= 1
+                if in_degree[dep_id] == 0 and self._todos[dep_id].status == "pending":
+                    self._ready[dep_id] = None
+                    newly_ready.append(self._todos[dep_id])
+        return newly_ready
+
+    def ready(self, layer: Optional[str] = None) -> List[TodoItem]:
+        """
+        실행 가능한 pending todos (우선순위 순, 동률이면 리스트 순)
+
+        get_ready_todos(todos, layer)와 같은 결과입니다.
+        """
+        todos = self._todos
+        result = [todos[todo_id] for todo_id in self._ready]
+        if layer:
+            result = [t for t in result if t.layer == layer]
+        seq = self._seq
+        result.sort(key=lambda t: (-t.priority, seq[t.id]))
+        return result
+
+
+def get_pending_todos(
+    todos: List[TodoItem],
+    layer: Optional[str] = None,
+    index: Optional[TodoIndex] = None
+) -> List[TodoItem]:
     """
     대기 중인 Todo 조회
 
     Args:
         todos: Todo 리스트
         layer: 필터링할 레이어 (None이면 전체)
+        index: todos의 TodoIndex (있으면 스캔 없이 조회)
 
     Returns:
         pending 상태의 todos (우선순위 순)
     """
+    if index is not None:
+        return index.pending(layer)
     result = [t for t in todos if t.status == "pending"]
     if layer:
         result = [t for t in result if t.layer == layer]
-    return sorted(result, key=lambda x: -x.priority)
+    return sorted(result, key=_PRIO, reverse=True)
 
 
-def get_in_progress_todos(todos: List[TodoItem], layer: Optional[str] = None) -> List[TodoItem]:
+def peek_next_pending(
+    todos: List[TodoItem],
+    layer: Optional[str] = None,
+    index: Optional[TodoIndex] = None
+) -> Optional[TodoItem]:
+    """
+    다음 실행할 pending Todo 조회 (가장 높은 우선순위, 동률이면 리스트 순)
+
+    전체 정렬 없이 O(n) 한 번 순회합니다 (index가 있으면 캐시된 정렬 결과 사용).
+
+    Args:
+        todos: Todo 리스트
+        layer: 필터링할 레이어 (None이면 전체)
+        index: todos의 TodoIndex
+
+    Returns:
+        get_pending_todos(...)[0]과 같은 todo (없으면 None)
+    """
+    if index is not None:
+        pending = index.pending(layer)
+        return pending[0] if pending else None
+    return max(
+        (t for t in todos if t.status == "pending" and (not layer or t.layer == layer)),
+        key=_PRIO,
+        default=None
+    )
+
+
+def get_ready_todos(
+    todos: List[TodoItem],
+    layer: Optional[str] = None,
+    index: Optional[TodoIndex] = None
+) -> List[TodoItem]:
+    """
+    실행 가능한 (의존성이 충족된) pending Todo 조회
+
+    반환된 todos는 서로 독립적이므로 한 번에 동시 실행할 수 있습니다
+    (예: asyncio.TaskGroup으로 일괄 dispatch).
+    의존성은 todo ID 또는 tool name이며, completed todo로만 충족됩니다.
+
+    Args:
+        todos: Todo 리스트
+        layer: 필터링할 레이어 (None이면 전체)
+        index: todos의 TodoIndex (있으면 스캔 없이 조회)
+
+    Returns:
+        실행 가능한 todos (우선순위 순)
+    """
+    if index is not None:
+        completed = index.get("completed")
+        pending = index.pending(layer)
+    else:
+        completed = [t for t in todos if t.status == "completed"]
+        pending = None
+
+    # 완료된 todo ID와 tool name을 한 집합으로 (depends_on은 둘 중 하나)
+    done = {t.id for t in completed}
+    done.update(t.metadata.execution.tool for t in completed if t.metadata.execution.tool)
+
+    if pending is None:
+        pending = [
+            t for t in todos
+            if t.status == "pending" and (not layer or t.layer == layer)
+        ]
+        pending.sort(key=_PRIO, reverse=True)
+
+    return [
+        t for t in pending
+        if all(dep in done for dep in t.metadata.dependency.depends_on)
+    ]
+
+
+def get_in_progress_todos(
+    todos: List[TodoItem],
+    layer: Optional[str] = None,
+    index: Optional[TodoIndex] = None
+) -> List[TodoItem]:
     """진행 중인 Todo 조회"""
+    if index is not None:
+        return index.get("in_progress", layer)
     result = [t for t in todos if t.status == "in_progress"]
     if layer:
         result = [t for t in result if t.layer == layer]
     return result
 
 
-def get_completed_todos(todos: List[TodoItem], layer: Optional[str] = None) -> List[TodoItem]:
+def get_completed_todos(
+    todos: List[TodoItem],
+    layer: Optional[str] = None,
+    index: Optional[TodoIndex] = None
+) -> List[TodoItem]:
     """완료된 Todo 조회"""
+    if index is not None:
+        return index.get("completed", layer)
     result = [t for t in todos if t.status == "completed"]
     if layer:
         result = [t for t in result if t.layer == layer]
     return result
 
 
-def get_failed_todos(todos: List[TodoItem], layer: Optional[str] = None) -> List[TodoItem]:
+def get_failed_todos(
+    todos: List[TodoItem],
+    layer: Optional[str] = None,
+    index: Optional[TodoIndex] = None
+) -> List[TodoItem]:
     """실패한 Todo 조회"""
+    if index is not None:
+        return index.get("failed", layer)
     result = [t for t in todos if t.status == "failed"]
     if layer:
         result = [t for t in result if t.layer == layer]
     return result
+
+
+def partition_by_status(
+    todos: List[TodoItem],
+    layer: Optional[str] = None
+) -> Dict[str, List[TodoItem]]:
+    """
+    상태별 Todo 분류 (한 번 순회)
+
+    여러 상태를 동시에 조회할 때 get_*_todos를 각각 호출하는 대신 사용합니다.
+
+    Args:
+        todos: Todo 리스트
+        layer: 필터링할 레이어 (None이면 전체)
+
+    Returns:
+        {"pending", "in_progress", "completed", "failed", "skipped"} -> todos (리스트 순)
+        그 외 상태의 todo는 포함되지 않습니다.
+    """
+    out: Dict[str, List[TodoItem]] = {
+        "pending": [],
+        "in_progress": [],
+        "completed": [],
+        "failed": [],
+        "skipped": [],
+    }
+    if layer is None:
+        for t in todos:
+            bucket = out.get(t.status)
+            if bucket is not None:
+                bucket.append(t)
+    else:
+        for t in todos:
+            if t.layer == layer:
+                bucket = out.get(t.status)
+                if bucket is not None:
+                    bucket.append(t)
+    return out
@@ -1,16 +1,39 @@
 """Todo Store - Save/Load with file locking"""
 
+import atexit
 import json
 import os
+import shutil
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime
+from pydantic import TypeAdapter
 from backend.app.core.logging import get_logger
 from backend.app.dream_agent.models.todo import TodoItem
+from .todo_updater import update_todo_status
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = get_logger(__name__)
 
+# 백업 생성 후 백그라운드 정리 시 유지할 백업 개수
+_BACKUP_KEEP_COUNT = 5
+
+# list_sessions 결과 캐시 유지 시간 (초, 이 프로세스의 저장/삭제 시 즉시 무효화)
+_SESSIONS_CACHE_TTL = 5.0
+
+# List[TodoItem] 직렬화/검증기 (모듈 로드 시 1회 생성, 리스트 전체를 한 번에 처리)
+_TODOS_ADAPTER = TypeAdapter(List[TodoItem])
+
 # Platform-specific file locking
 try:
     import fcntl  # Unix/Linux/Mac
@@ -25,6 +48,79 @@ except ImportError:
         logger.warning("No file locking available on this platform")
 
 
+def _dumps_pretty(data) -> bytes:
+    """todos 파일용 JSON 직렬화 (indent=2, UTF-8 bytes, orjson 우선)"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """WAL 레코드 직렬화 (한 줄 JSON + 개행)"""
+    if HAS_ORJSON:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return json.dumps(record, ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+
+
+def _loads(content: bytes):
+    """todos 파일 JSON 파싱 (orjson 우선, orjson.JSONDecodeError는 json.JSONDecodeError 하위 클래스)"""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+_BACKUP_PREFIX = "todos.json.bak."
+
+def _open_temp(path: Path) -> Tuple[int, str]:
+    """
+    path 옆에 교체용 임시 파일 생성 (os.replace 후에도 권한이 바뀌지 않도록)
+
+    기존 파일이 있으면 그 권한을 복사하고, 없으면 0o666으로 생성해
+    커널이 현재 umask를 적용합니다 (mkstemp의 0600과 달리 open()으로 만든 파일과 같은 권한).
+
+    Args:
+        path: 교체할 대상 파일 경로
+
+    Returns:
+        (쓰기용 fd, 임시 파일 경로)
+    """
+    try:
+        mode: Optional[int] = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_path = str(path.parent / f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            fd = os.open(tmp_path, flags, 0o666)
+            break
+        except FileExistsError:
+            continue
+
+    if mode is not None:
+        try:
+            os.chmod(tmp_path, mode)
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+    return fd, tmp_path
+
+
+def _backup_sort_key(entry: os.DirEntry) -> float:
+    """
+    백업 파일 정렬 키 (파일명의 timestamp 접미사, 형식이 다르면 mtime)
+
+    접미사는 time.time_ns()이며, 이전 형식(int(time.time()), 초 단위)은
+    값이 훨씬 작아 자연히 더 오래된 백업으로 정렬됩니다.
+    """
+    try:
+        return int(entry.name[len(_BACKUP_PREFIX):])
+    except ValueError:
+        return entry.stat().st_mtime
+
+
 class TodoStore:
     """Todo 저장/로드 시스템 with file locking"""
 
@@ -35,26 +131,93 @@ class TodoStore:
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        # 이미 mkdir한 session ID (중복 mkdir은 exist_ok라 무해하므로 lock 없이 사용)
+        self._ensured_sessions: Set[str] = set()
+        # durable=False로 저장되어 아직 fsync되지 않은 파일 (flush()에서 동기화)
+        self._unsynced: Set[Path] = set()
+        # durable=False 저장 시점의 WAL 길이 (session_id -> bytes, 이 앞부분은 스냅샷에 반영됨)
+        # 스냅샷이 fsync되기 전 crash에 대비해 flush()까지 WAL을 남겨 둠
+        self._pending_wal: Dict[str, int] = {}
+        # list_sessions 캐시 (None이면 다음 호출 시 재스캔)
+        self._sessions_cache: Optional[List[str]] = None
+        self._sessions_cache_ts = 0.0
+        # 백업 정리 등 저장 경로에서 기다릴 필요 없는 I/O (첫 사용 시 생성)
+        self._bg: Optional[ThreadPoolExecutor] = None
+        self._bg_lock = threading.Lock()
 
     def _get_session_path(self, session_id: str) -> Path:
-        """Session 경로 반환"""
+        """Session 경로 반환 (디렉토리 생성은 session당 1회)"""
         session_path = self.base_path / session_id
-        session_path.mkdir(parents=True, exist_ok=True)
+        if session_id not in self._ensured_sessions:
+            session_path.mkdir(parents=True, exist_ok=True)
+            self._ensured_sessions.add(session_id)
         return session_path
 
     def _get_todos_file(self, session_id: str) -> Path:
         """Todos 파일 경로 반환"""
         return self._get_session_path(session_id) / "todos.json"
 
-    def _lock_file(self, file_handle):
-        """파일 잠금 (플랫폼별)"""
+    def _get_wal_file(self, session_id: str) -> Path:
+        """상태 변경 WAL 파일 경로 반환 (todos.json 이후의 변경분)"""
+        return self._get_session_path(session_id) / "todos.wal"
+
+    def _get_lock_file(self, session_id: str) -> Path:
+        """세션 잠금 파일 경로"""
+        return self._get_session_path(session_id) / "todos.lock"
+
+    @contextmanager
+    def _session_lock(self, session_id: str, shared: bool = False):
+        """
+        세션 잠금 (스냅샷 교체 + WAL 비우기와 WAL append를 직렬화)
+
+        교체와 WAL 삭제 사이에 append된 레코드가 스냅샷에 반영되지 않은 채
+        함께 지워지지 않도록, 두 작업은 항상 이 잠금 안에서 수행합니다.
+        파일 단위 잠금이므로 같은 프로세스 안에서 중첩해 잡으면 안 됩니다.
+
+        Args:
+            session_id: Session ID
+            shared: 읽기(공유) 잠금 여부 (Windows는 항상 배타 잠금)
+        """
+        with open(self._get_lock_file(session_id), "ab") as f:
+            if HAS_FCNTL or HAS_MSVCRT:
+                self._lock_file(f, shared=shared)
+            try:
+                yield
+            finally:
+                if HAS_FCNTL or HAS_MSVCRT:
+                    self._unlock_file(f)
+
+    def _background(self) -> ThreadPoolExecutor:
+        """백그라운드 I/O executor (단일 worker, 종료 시 남은 작업 완료 대기)"""
+        if self._bg is None:
+            with self._bg_lock:
+                if self._bg is None:
+                    self._bg = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="todo-store"
+                    )
+                    atexit.register(self._bg.shutdown, wait=True)
+        return self._bg
+
+    def _lock_file(self, file_handle, shared: bool = False):
+        """
+        파일 잠금 (플랫폼별)
+
+        Args:
+            file_handle: 열린 파일
+            shared: 읽기(공유) 잠금 여부 (Windows는 항상 배타 잠금)
+        """
         if HAS_FCNTL:
             # Unix/Linux/Mac
-            fcntl.flock(file_handle.fileno(), fcntl.LOCK_EX)
+            fcntl.flock(file_handle.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
         elif HAS_MSVCRT:
-            # Windows - msvcrt.locking은 까다로우므로 skip
-            # 대신 atomic write (temp file + rename)를 사용
-            pass
+            # Windows - offset 0의 1바이트를 sentinel로 잠금 (EOF 너머도 잠금 가능하므로 빈 파일도 OK)
+            # LK_LOCK은 실패 시 1초 간격으로 10회 재시도 후 OSError
+            pos = file_handle.tell()
+            file_handle.seek(0)
+            try:
+                msvcrt.locking(file_handle.fileno(), msvcrt.LK_LOCK, 1)
+            finally:
+                file_handle.seek(pos)
 
     def _unlock_file(self, file_handle):
         """파일 잠금 해제 (플랫폼별)"""
@@ -62,22 +225,130 @@ class TodoStore:
             # Unix/Linux/Mac
             fcntl.flock(file_handle.fileno(), fcntl.LOCK_UN)
         elif HAS_MSVCRT:
-            # Windows - skip
-            pass
+            # Windows - 잠금과 같은 sentinel 범위 해제
+            pos = file_handle.tell()
+            file_handle.seek(0)
+            try:
+                msvcrt.locking(file_handle.fileno(), msvcrt.LK_UNLCK, 1)
+            except OSError:
+                pass
+            finally:
+                file_handle.seek(pos)
+
+    def _write_atomic(
+        self,
+        todos_file: Path,
+        content: bytes,
+        backup: bool,
+        durable: bool = True
+    ) -> None:
+        """
+        임시 파일에 쓰고 fsync 후 os.replace로 교체 (원자적 저장)
+
+        교체 전까지 기존 todos.json이 그대로 남아 있으므로 파일이 없는 구간이 없고,
+        읽는 쪽은 항상 이전 또는 새 내용 전체를 봅니다.
+
+        Args:
+            todos_file: 대상 todos.json 경로
+            content: 저장할 내용 (UTF-8 bytes)
+            backup: 기존 파일 백업 여부 (교체 전 hard link, 불가하면 복사,
+                    오래된 백업 정리는 백그라운드에서 수행)
+            durable: False면 fsync 생략 (crash 시 최근 저장분 유실 가능, flush()로 동기화)
+        """
+        fd, tmp_path = _open_temp(todos_file)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())  # 디스크에 강제 쓰기
+
+            # 백업 (기존 파일이 있으면) - 이전 내용 보존을 위해 교체 전에 동기로 수행
+            backed_up = False
+            if backup and todos_file.exists():
+                backup_file = todos_file.with_suffix(
+                    f".json.bak.{time.time_ns()}"
+                )
+                try:
+                    os.link(todos_file, backup_file)
+                except OSError:
+                    shutil.copy2(todos_file, backup_file)
+                backed_up = True
+                logger.info(f"Backup created: {backup_file}")
+
+            os.replace(tmp_path, todos_file)
+            self._sessions_cache = None
+            if durable:
+                self._unsynced.discard(todos_file)
+            else:
+                self._unsynced.add(todos_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        if backed_up:
+            self._background().submit(
+                self.cleanup_old_backups, todos_file.parent.name, _BACKUP_KEEP_COUNT
+            )
+
+    def _snapshot_content(self, session_id: str, todos: List[TodoItem]) -> bytes:
+        """todos.json 내용 직렬화 (metadata 헤더 + todos)"""
+        # TodoItem을 dict로 변환 (JSON 호환 모드)
+        # mode='json'을 사용하면 datetime이 자동으로 ISO format으로 변환됨
+        todos_data = _TODOS_ADAPTER.dump_python(todos, mode='json')
+
+        # Metadata 추가
+        data = {
+            "session_id": session_id,
+            "saved_at": datetime.now().isoformat(),
+            "total_todos": len(todos),
+            "todos": todos_data
+        }
+        return _dumps_pretty(data)
+
+    def _commit_snapshot(
+        self,
+        session_id: str,
+        todos_file: Path,
+        content: bytes,
+        backup: bool,
+        durable: bool
+    ) -> None:
+        """스냅샷 교체 후 WAL 비우기 (_session_lock 안에서 호출)"""
+        # 파일 저장 (temp file + os.replace)
+        self._write_atomic(todos_file, content, backup, durable)
+
+        wal_file = self._get_wal_file(session_id)
+        if durable:
+            # 스냅샷에 반영된 WAL 비우기 (다음 load에서 다시 적용되지 않도록)
+            wal_file.unlink(missing_ok=True)
+            self._pending_wal.pop(session_id, None)
+            return
+
+        # fsync 전이므로 WAL은 flush()까지 유지 (load 시 이미 반영된 레코드는 건너뜀)
+        try:
+            self._pending_wal[session_id] = wal_file.stat().st_size
+        except FileNotFoundError:
+            self._pending_wal.pop(session_id, None)
 
     def save_todos(
         self,
         session_id: str,
         todos: List[TodoItem],
-        backup: bool = True
+        backup: bool = True,
+        durable: bool = True
     ) -> bool:
         """
-        Todos를 JSON 파일로 저장 (file locking 포함)
+        Todos를 JSON 파일로 저장 (temp file + os.replace 원자적 교체)
 
         Args:
             session_id: Session ID
             todos: 저장할 todos
             backup: 기존 파일 백업 여부
+            durable: False면 fsync 생략 (임시 저장용, 필요 시 flush() 호출)
 
         Returns:
             성공 여부
@@ -85,44 +356,61 @@ class TodoStore:
         todos_file = self._get_todos_file(session_id)
 
         try:
-            # 백업 (기존 파일이 있으면)
-            if backup and todos_file.exists():
-                backup_file = todos_file.with_suffix(
-                    f".json.bak.{int(time.time())}"
-                )
-                todos_file.rename(backup_file)
-                logger.info(f"Backup created: {backup_file}")
+            content = self._snapshot_content(session_id, todos)
+            with self._session_lock(session_id):
+                self._commit_snapshot(session_id, todos_file, content, backup, durable)
+
+            logger.info(
+                f"Todos saved: session={session_id}, "
+                f"count={len(todos)}, path={todos_file}"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save todos: {e}", exc_info=True)
+            return False
+
+    def save_todos_raw(
+        self,
+        session_id: str,
+        todos_payload: bytes,
+        total_todos: int,
+        backup: bool = True,
+        durable: bool = True
+    ) -> bool:
+        """
+        미리 직렬화된 todos JSON 배열을 한 번의 write로 저장 (원자적 교체)
+
+        save_todos와 같은 파일 포맷을 사용하며, 호출자가 todos를
+        한 번에 직렬화(orjson 등)한 경우 model_dump/json.dump 단계를 생략합니다.
+
+        Args:
+            session_id: Session ID
+            todos_payload: JSON 배열로 직렬화된 todos (UTF-8 bytes)
+            total_todos: todos 개수
+            backup: 기존 파일 백업 여부
+            durable: False면 fsync 생략 (임시 저장용, 필요 시 flush() 호출)
 
-            # TodoItem을 dict로 변환 (JSON 호환 모드)
-            # mode='json'을 사용하면 datetime이 자동으로 ISO format으로 변환됨
-            todos_data = [todo.model_dump(mode='json') for todo in todos]
+        Returns:
+            성공 여부
+        """
+        todos_file = self._get_todos_file(session_id)
 
-            # Metadata 추가
-            data = {
+        try:
+            # Metadata 헤더 + todos 배열을 하나의 버퍼로 구성
+            header = json.dumps({
                 "session_id": session_id,
                 "saved_at": datetime.now().isoformat(),
-                "total_todos": len(todos),
-                "todos": todos_data
-            }
+                "total_todos": total_todos,
+            }, ensure_ascii=False)
+            content = header[:-1].encode("utf-8") + b', "todos": ' + todos_payload + b"}"
 
-            # 파일 저장 (with locking)
-            with open(todos_file, "w", encoding="utf-8") as f:
-                # 파일 잠금
-                if HAS_FCNTL or HAS_MSVCRT:
-                    self._lock_file(f)
-
-                try:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                    f.flush()
-                    os.fsync(f.fileno())  # 디스크에 강제 쓰기
-                finally:
-                    # 파일 잠금 해제
-                    if HAS_FCNTL or HAS_MSVCRT:
-                        self._unlock_file(f)
+            with self._session_lock(session_id):
+                self._commit_snapshot(session_id, todos_file, content, backup, durable)
 
             logger.info(
-                f"Todos saved: session={session_id}, "
-                f"count={len(todos)}, path={todos_file}"
+                f"Todos saved (raw): session={session_id}, "
+                f"count={total_todos}, path={todos_file}"
             )
             return True
 
@@ -157,35 +445,9 @@ class TodoStore:
                 return None
 
         try:
-            # 파일 로드 (with locking)
-            with open(todos_file, "r", encoding="utf-8") as f:
-                # 파일 잠금 (읽기 잠금)
-                if HAS_FCNTL:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                elif HAS_MSVCRT:
-                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
-
-                try:
-                    data = json.load(f)
-                finally:
-                    # 파일 잠금 해제
-                    if HAS_FCNTL or HAS_MSVCRT:
-                        self._unlock_file(f)
-
-            # 검증
-            if not isinstance(data, dict) or "todos" not in data:
-                logger.error(f"Invalid todos file format: {todos_file}")
-                return None
-
-            # TodoItem으로 변환
-            todos_data = data["todos"]
-            todos = [TodoItem(**todo_dict) for todo_dict in todos_data]
-
-            logger.info(
-                f"Todos loaded: session={session_id}, "
-                f"count={len(todos)}, saved_at={data.get('saved_at')}"
-            )
-            return todos
+            # 스냅샷과 WAL을 같은 잠금 안에서 읽음 (사이에 저장이 끼어들지 않도록)
+            with self._session_lock(session_id, shared=True):
+                return self._load_locked(session_id, todos_file)
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse todos JSON: {e}", exc_info=True)
@@ -194,6 +456,188 @@ class TodoStore:
             logger.error(f"Failed to load todos: {e}", exc_info=True)
             return None
 
+    def _load_locked(self, session_id: str, todos_file: Path) -> Optional[List[TodoItem]]:
+        """스냅샷 로드 + WAL 적용 (_session_lock 안에서 호출, 파싱 오류는 호출자가 처리)"""
+        with open(todos_file, "rb") as f:
+            data = _loads(f.read())
+
+        # 검증
+        if not isinstance(data, dict) or "todos" not in data:
+            logger.error(f"Invalid todos file format: {todos_file}")
+            return None
+
+        # TodoItem으로 변환 (리스트 전체를 pydantic-core 한 번 호출로 검증)
+        todos = _TODOS_ADAPTER.validate_python(data["todos"])
+
+        # 스냅샷 이후의 상태 변경(WAL) 적용
+        todos = self._replay_wal(session_id, todos)
+
+        logger.info(
+            f"Todos loaded: session={session_id}, "
+            f"count={len(todos)}, saved_at={data.get('saved_at')}"
+        )
+        return todos
+
+    def flush(self) -> int:
+        """
+        durable=False로 저장된 파일을 디스크에 동기화하고, 스냅샷에 반영된 WAL 제거
+
+        Returns:
+            fsync한 파일 개수
+        """
+        synced = 0
+        for path in list(self._unsynced):
+            self._unsynced.discard(path)
+            session_id = path.parent.name
+            try:
+                with self._session_lock(session_id):
+                    with open(path, "rb") as f:
+                        os.fsync(f.fileno())
+                    synced += 1
+
+                    # 스냅샷이 디스크에 반영되었으므로 저장 시점까지의 WAL 제거
+                    wal_size = self._pending_wal.pop(session_id, None)
+                    if wal_size is not None:
+                        self._drop_wal_prefix(session_id, wal_size)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.error(f"Failed to fsync {path}: {e}", exc_info=True)
+        return synced
+
+    def _drop_wal_prefix(self, session_id: str, size: int) -> None:
+        """WAL 앞부분 size bytes 제거 (_session_lock 안에서 호출, 이후 append분은 유지)"""
+        wal_file = self._get_wal_file(session_id)
+        try:
+            with open(wal_file, "rb") as f:
+                rest = f.read()[size:]
+        except FileNotFoundError:
+            return
+
+        if not rest:
+            wal_file.unlink()
+            return
+
+        fd, tmp_path = _open_temp(wal_file)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(rest)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, wal_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def append_wal(self, session_id: str, record: Dict[str, Any]) -> bool:
+        """
+        상태 변경 레코드를 WAL에 추가 (todos.json 전체를 다시 쓰지 않음)
+
+        update_todo_status(on_update=...)에 연결해 사용합니다.
+        레코드는 load_todos에서 스냅샷 위에 순서대로 적용되며,
+        save_todos/compact 시 비워집니다.
+
+        Args:
+            session_id: Session ID
+            record: {"todo_id", "status", "error_message"} 레코드
+
+        Returns:
+            성공 여부
+
+        Example:
+            todos = update_todo_status(
+                todos, todo_id, "completed",
+                on_update=functools.partial(todo_store.append_wal, session_id)
+            )
+        """
+        wal_file = self._get_wal_file(session_id)
+
+        try:
+            # 동시 append 레코드가 섞이지 않고, 스냅샷 교체 + WAL 비우기와 겹치지 않도록 잠금
+            with self._session_lock(session_id):
+                with open(wal_file, "ab") as f:
+                    f.write(_dumps_line(record))
+                    f.flush()
+                    os.fsync(f.fileno())
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to append todo WAL: {e}", exc_info=True)
+            return False
+
+    def _replay_wal(self, session_id: str, todos: List[TodoItem]) -> List[TodoItem]:
+        """WAL 레코드를 순서대로 적용 (깨진 줄은 경고 후 건너뜀)"""
+        wal_file = self._get_wal_file(session_id)
+        if not wal_file.exists():
+            return todos
+
+        applied = 0
+        # todo별 마지막 변경 시각 (이보다 이전 레코드는 스냅샷에 이미 반영된 것)
+        updated_at = {t.id: t.updated_at for t in todos}
+        with open(wal_file, "rb") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = _loads(line)
+                    todo_id = record["todo_id"]
+                    status = record["status"]
+                    timestamp = record.get("timestamp")
+                    changed_at = datetime.fromisoformat(timestamp) if timestamp else None
+                except (ValueError, KeyError, TypeError) as e:
+                    # 기록 도중 중단된 마지막 줄 등
+                    logger.warning(f"Skipping invalid WAL record {wal_file}:{line_no}: {e}")
+                    continue
+
+                if changed_at is not None:
+                    # durable=False 저장 후 flush 전에는 WAL에 스냅샷 반영분이 남아 있음
+                    last = updated_at.get(todo_id)
+                    if last is not None and changed_at <= last:
+                        continue
+                    updated_at[todo_id] = changed_at
+
+                # 기록된 시각으로 적용 (load할 때마다 started_at/completed_at 등이 바뀌지 않도록)
+                todos = update_todo_status(
+                    todos, todo_id, status, record.get("error_message"), now=changed_at
+                )
+                applied += 1
+
+        if applied:
+            logger.info(f"Todo WAL replayed: session={session_id}, records={applied}")
+        return todos
+
+    def compact(self, session_id: str) -> bool:
+        """
+        WAL을 스냅샷(todos.json)에 합치고 비움
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            성공 여부
+        """
+        todos_file = self._get_todos_file(session_id)
+        if not todos_file.exists():
+            logger.warning(f"Todos file not found: {todos_file}")
+            return False
+
+        try:
+            # load와 저장 사이에 append된 레코드가 지워지지 않도록 한 잠금 안에서 수행
+            with self._session_lock(session_id):
+                todos = self._load_locked(session_id, todos_file)
+                if todos is None:
+                    return False
+                content = self._snapshot_content(session_id, todos)
+                self._commit_snapshot(session_id, todos_file, content, backup=False, durable=True)
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to compact todos: {e}", exc_info=True)
+            return False
+
     def delete_todos(self, session_id: str) -> bool:
         """
         Todos 파일 삭제
@@ -211,7 +655,10 @@ class TodoStore:
             return False
 
         try:
-            todos_file.unlink()
+            with self._session_lock(session_id):
+                todos_file.unlink()
+                self._get_wal_file(session_id).unlink(missing_ok=True)
+            self._sessions_cache = None
             logger.info(f"Todos deleted: {todos_file}")
             return True
         except Exception as e:
@@ -220,21 +667,30 @@ class TodoStore:
 
     def list_sessions(self) -> List[str]:
         """
-        저장된 session ID 리스트 반환
+        저장된 session ID 리스트 반환 (_SESSIONS_CACHE_TTL 동안 캐시)
 
         Returns:
             Session ID 리스트
         """
+        if (
+            self._sessions_cache is not None
+            and time.monotonic() - self._sessions_cache_ts < _SESSIONS_CACHE_TTL
+        ):
+            return list(self._sessions_cache)
+
         try:
+            # scandir의 DirEntry.is_dir()은 대부분 추가 stat 없이 판별
             sessions = []
-            for session_path in self.base_path.iterdir():
-                if session_path.is_dir():
-                    todos_file = session_path / "todos.json"
-                    if todos_file.exists():
-                        sessions.append(session_path.name)
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    if entry.is_dir() and os.path.exists(os.path.join(entry.path, "todos.json")):
+                        sessions.append(entry.name)
+
+            self._sessions_cache = sessions
+            self._sessions_cache_ts = time.monotonic()
 
             logger.info(f"Found {len(sessions)} sessions with todos")
-            return sessions
+            return list(sessions)
 
         except Exception as e:
             logger.error(f"Failed to list sessions: {e}", exc_info=True)
@@ -258,17 +714,18 @@ class TodoStore:
         session_path = self._get_session_path(session_id)
 
         try:
-            # 백업 파일 찾기
-            backup_files = sorted(
-                session_path.glob("todos.json.bak.*"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True
-            )
+            # 백업 파일 찾기 (scandir 한 번, 정렬은 파일명의 timestamp로 → 파일별 stat 없음)
+            with os.scandir(session_path) as entries:
+                backup_files = sorted(
+                    (e for e in entries if e.name.startswith(_BACKUP_PREFIX)),
+                    key=_backup_sort_key,
+                    reverse=True
+                )
 
             # 최신 N개 제외하고 삭제
             deleted_count = 0
             for backup_file in backup_files[keep_count:]:
-                backup_file.unlink()
+                os.unlink(backup_file.path)
                 deleted_count += 1
 
             if deleted_count > 0:
@@ -1,15 +1,36 @@
 """Todo Updater - Todo 상태 업데이트"""
 
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple
 from datetime import datetime
 from backend.app.dream_agent.models.todo import TodoItem
 
+if TYPE_CHECKING:
+    from .todo_queries import ReadyTracker, TodoIndex
+
+
+# 상태별 metadata 갱신: status -> (중첩 모델 필드, (now, error_message) -> 변경 필드)
+_STATUS_METADATA_UPDATES: Dict[
+    str, Tuple[str, Callable[[datetime, Optional[str]], Dict[str, Any]]]
+] = {
+    "in_progress": ("progress", lambda now, err: {"started_at": now}),
+    "completed": ("progress", lambda now, err: {"completed_at": now, "progress_percentage": 100}),
+    "failed": ("progress", lambda now, err: {"error_message": err}),
+    # 승인 대기 상태 - approval 메타데이터 업데이트
+    "needs_approval": ("approval", lambda now, err: {"requires_approval": True}),
+    # 취소 상태 - 완료 시간 기록
+    "cancelled": ("progress", lambda now, err: {"completed_at": now}),
+}
+
 
 def update_todo_status(
     todos: List[TodoItem],
     todo_id: str,
     status: Literal["pending", "in_progress", "completed", "failed", "blocked", "skipped", "needs_approval", "cancelled"],
-    error_message: Optional[str] = None
+    error_message: Optional[str] = None,
+    index: Optional["TodoIndex"] = None,
+    tracker: Optional["ReadyTracker"] = None,
+    on_update: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    now: Optional[datetime] = None
 ) -> List[TodoItem]:
     """
     Todo 상태 업데이트 헬퍼 함수 V2.1
@@ -19,50 +40,65 @@ def update_todo_status(
         todo_id: 업데이트할 todo ID
         status: 새 상태
         error_message: 에러 메시지 (failed 상태일 때)
+        index: 함께 갱신할 TodoIndex (상태 버킷 이동)
+        tracker: 함께 갱신할 ReadyTracker (completed 시 dependents in-degree 감소)
+        on_update: 상태 변경 레코드 콜백 (예: TodoStore.append_wal로 WAL 기록)
+        now: 변경 시각 (None이면 현재 시각, WAL 재적용 시 기록된 시각 사용)
 
     Returns:
         전체 todo 리스트 (업데이트된 todo 포함)
     """
-    result = []
-    for todo in todos:
+    for idx, todo in enumerate(todos):
         if todo.id == todo_id:
-            # History 추가
-            history_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "action": "status_change",
-                "old_status": todo.status,
-                "new_status": status
-            }
+            break
+    else:
+        return list(todos)
+
+    if now is None:
+        now = datetime.now()
 
-            if error_message:
-                history_entry["error"] = error_message
+    # History 추가
+    history_entry = {
+        "timestamp": now.isoformat(),
+        "action": "status_change",
+        "old_status": todo.status,
+        "new_status": status
+    }
 
-            updated = todo.model_copy(update={
-                "status": status,
-                "version": todo.version + 1,
-                "updated_at": datetime.now()
-            })
+    if error_message:
+        history_entry["error"] = error_message
 
-            updated.history.append(history_entry)
+    # Progress/Approval 업데이트 (변경되는 중첩 모델만 복사 - 원본 todo는 변경되지 않음)
+    metadata = todo.metadata
+    metadata_update = _STATUS_METADATA_UPDATES.get(status)
+    if metadata_update is not None:
+        field, build_update = metadata_update
+        metadata = metadata.model_copy(update={
+            field: getattr(metadata, field).model_copy(update=build_update(now, error_message))
+        })
 
-            # Progress 업데이트
-            if status == "in_progress":
-                updated.metadata.progress.started_at = datetime.now()
-            elif status == "completed":
-                updated.metadata.progress.completed_at = datetime.now()
-                updated.metadata.progress.progress_percentage = 100
-            elif status == "failed":
-                updated.metadata.progress.error_message = error_message
-            elif status == "needs_approval":
-                # 승인 대기 상태 - approval 메타데이터 업데이트
-                updated.metadata.approval.requires_approval = True
-            elif status == "cancelled":
-                # 취소 상태 - 완료 시간 기록
-                updated.metadata.progress.completed_at = datetime.now()
+    # model_copy는 검증 없이 __dict__를 복사 (필드 기본값을 다시 채우는 model_construct보다 빠름)
+    updated = todo.model_copy(update={
+        "status": status,
+        "version": todo.version + 1,
+        "updated_at": now,
+        "metadata": metadata,
+        "history": [*todo.history, history_entry]
+    })
 
-            result.append(updated)
-        else:
-            # 변경되지 않은 todo는 그대로 유지
-            result.append(todo)
+    if index is not None:
+        index.replace(todo, updated)
+    if tracker is not None:
+        tracker.replace(todo, updated)
+    if on_update is not None:
+        on_update({
+            "todo_id": todo_id,
+            "status": status,
+            "error_message": error_message,
+            "timestamp": history_entry["timestamp"]
+        })
 
+    # 변경되지 않은 todo는 그대로 유지
+    result = list(todos)
+    result[idx] = updated
     return result
@@ -1,11 +1,100 @@
 """Todo validation system"""
 
-from typing import List, Dict, Any
+import re
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple, Union
 from backend.app.dream_agent.states import TodoItem
 from backend.app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 보고서 생성 요청 키워드 (소문자 입력에 대해 부분 문자열 매칭)
+_REPORT_KEYWORDS = frozenset(("보고서", "report", "문서", "document", "만들어", "생성"))
+_REPORT_KEYWORD_RE = re.compile("|".join(map(re.escape, sorted(_REPORT_KEYWORDS))))
+
+# 트렌드 인사이트 사용 키워드
+_TREND_KEYWORDS = frozenset(("트렌드", "trend", "k-beauty", "kbeauty", "글로벌", "global", "마케팅", "marketing"))
+_TREND_KEYWORD_RE = re.compile("|".join(map(re.escape, sorted(_TREND_KEYWORDS))))
+
+# 사용자 입력 키워드 추출 패턴 ("X 리뷰", "X 분석", "X 수집" 등에서 X 추출, 순서대로 시도)
+_KEYWORD_PATTERNS = tuple(re.compile(p) for p in (
+    r'([가-힣a-zA-Z0-9\s]+?)\s*리뷰',
+    r'([가-힣a-zA-Z0-9\s]+?)\s*분석',
+    r'([가-힣a-zA-Z0-9\s]+?)\s*수집',
+    r'([가-힣a-zA-Z0-9\s]+?)\s*인사이트',
+    r'([가-힣a-zA-Z0-9\s]+?)\s*데이터',
+))
+
+# 키워드로 쓰기엔 너무 일반적인 단어
+_KEYWORD_STOPWORDS = frozenset(('이', '그', '저', '해당', '관련'))
+
+# fallback todos 기본값 (extracted_entities에 없을 때)
+_DEFAULT_BRAND = "laneige"
+_DEFAULT_PLATFORMS = ("youtube", "oliveyoung", "amazon")
+
+
+@dataclass(frozen=True, slots=True)
+class IntentView:
+    """
+    검증/fallback에 필요한 intent 필드의 읽기 전용 뷰
+
+    요청당 한 번 만들어 validate_todos와 get_fallback_todos에 함께 넘기면
+    intent dict 조회와 user_input 소문자 변환을 반복하지 않습니다.
+
+    Example:
+        view = IntentView.from_intent(intent, user_input)
+        result = TodoValidator.validate_todos(todos, view)
+        if not result["valid"]:
+            todos = TodoValidator.get_fallback_todos(view)
+    """
+
+    requires_ml: bool
+    requires_biz: bool
+    requires_data_collection: bool
+    requires_preprocessing: bool
+    brand: str
+    platforms: Tuple[str, ...]      # fallback collector 대상 (없으면 기본 플랫폼)
+    keywords: Tuple[str, ...]
+    data_sources: Tuple[str, ...]   # intent가 요청한 소스 그대로 (없으면 빈 튜플)
+    user_input: str
+    user_input_lower: str
+
+    @classmethod
+    def from_intent(cls, intent: Dict[str, Any], user_input: str) -> "IntentView":
+        """
+        intent dict와 사용자 입력으로 IntentView 생성
+
+        Args:
+            intent: Cognitive 노드가 파악한 의도
+            user_input: 사용자 입력
+
+        Returns:
+            IntentView
+        """
+        entities = intent.get("extracted_entities", {})
+        data_sources = entities.get("data_sources")
+        platforms = entities.get("data_sources", _DEFAULT_PLATFORMS)
+        user_input = user_input or ""
+        return cls(
+            requires_ml=bool(intent.get("requires_ml")),
+            requires_biz=bool(intent.get("requires_biz")),
+            requires_data_collection=bool(intent.get("requires_data_collection")),
+            requires_preprocessing=bool(intent.get("requires_preprocessing")),
+            brand=entities.get("brand", _DEFAULT_BRAND),
+            platforms=tuple(platforms) if platforms is not None else (),
+            keywords=tuple(entities.get("keywords") or ()),
+            data_sources=tuple(data_sources) if data_sources else (),
+            user_input=user_input,
+            user_input_lower=user_input.lower(),
+        )
+
+
+def _as_view(intent: Union[IntentView, Dict[str, Any]], user_input: str) -> IntentView:
+    """dict intent는 IntentView로 변환 (이미 뷰면 그대로)"""
+    if isinstance(intent, IntentView):
+        return intent
+    return IntentView.from_intent(intent, user_input)
+
 
 class TodoValidator:
     """Todo 검증 시스템"""
@@ -13,16 +102,16 @@ class TodoValidator:
     @staticmethod
     def validate_todos(
         todos: List[TodoItem],
-        intent: Dict[str, Any],
-        user_input: str
+        intent: Union[IntentView, Dict[str, Any]],
+        user_input: str = ""
     ) -> Dict[str, Any]:
         """
         Planning이 생성한 Todos를 검증
 
         Args:
             todos: Planning 노드가 생성한 todos
-            intent: Cognitive 노드가 파악한 의도
-            user_input: 사용자 입력
+            intent: Cognitive 노드가 파악한 의도 (dict 또는 IntentView)
+            user_input: 사용자 입력 (intent가 IntentView면 무시)
 
         Returns:
             검증 결과:
@@ -33,14 +122,68 @@ class TodoValidator:
                 "suggestions": List[str]
             }
         """
+        view = _as_view(intent, user_input)
+        requests_report = _REPORT_KEYWORD_RE.search(view.user_input_lower) is not None
+
+        # 단순 질문 (todos 없음 + ML/Biz, 데이터 소스, 보고서 요청 모두 없음)이면
+        # 이후 검사가 아무것도 추가하지 않으므로 바로 통과
+        if (
+            not todos
+            and not view.requires_ml
+            and not view.requires_biz
+            and not view.data_sources
+            and not requests_report
+        ):
+            logger.info("No todos created for simple question - this is expected")
+            return {
+                "valid": True,
+                "errors": [],
+                "warnings": [],
+                "suggestions": [],
+                "total_todos": 0,
+                "ml_todos": 0,
+                "biz_todos": 0,
+            }
+
         errors = []
         warnings = []
         suggestions = []
 
+        # todos 한 번 순회로 이후 검증에 필요한 값 수집
+        ml_todos_count = 0
+        biz_todos_count = 0
+        ml_tools = set()                # ML todos의 tool
+        has_collector = False           # collector todo 존재 여부 (레이어 무관)
+        collector_sources = []          # collector todos의 source (순서 유지)
+        has_report_agent = False
+        priority_warnings = []
+        for t in todos:
+            layer = t.layer
+            meta = t.metadata
+            execution = meta.execution if meta else None
+            tool = execution.tool if execution else None
+
+            if layer == "ml_execution":
+                ml_todos_count += 1
+                ml_tools.add(tool)
+            elif layer == "biz_execution":
+                biz_todos_count += 1
+
+            if tool == "collector":
+                has_collector = True
+                source = execution.tool_params.get("source")
+                if source:
+                    collector_sources.append(source)
+            elif tool == "report_agent":
+                has_report_agent = True
+
+            if t.priority is None or t.priority < 0 or t.priority > 10:
+                priority_warnings.append(f"Todo '{t.task}' has invalid priority: {t.priority}")
+
         # 1. 기본 검증: Todos가 존재하는가?
         if not todos:
             # Intent에 ML이나 Biz 작업이 필요한데 todos가 없으면 에러
-            if intent.get("requires_ml") or intent.get("requires_biz"):
+            if view.requires_ml or view.requires_biz:
                 errors.append("Planning did not create any todos despite requiring ML/Biz execution")
                 suggestions.append("Planning should be re-run to generate appropriate todos")
             else:
@@ -48,35 +191,23 @@ class TodoValidator:
                 logger.info("No todos created for simple question - this is expected")
 
         # 2. ML/Biz 요구사항 검증
-        if intent.get("requires_ml"):
-            ml_todos = [t for t in todos if t.layer == "ml_execution"]
-            if not ml_todos:
+        if view.requires_ml:
+            if not ml_todos_count:
                 errors.append("Intent requires ML execution but no ML todos were created")
                 suggestions.append("Add ML execution todos (collector, preprocessor, analyzer, insight)")
 
-        if intent.get("requires_biz"):
-            biz_todos = [t for t in todos if t.layer == "biz_execution"]
-            if not biz_todos:
+        if view.requires_biz:
+            if not biz_todos_count:
                 errors.append("Intent requires Biz execution but no Biz todos were created")
                 suggestions.append("Add Biz execution todos (report_agent, ad_creative_agent, etc.)")
 
         # 3. 데이터 소스 검증 (intent에서 추출된 소스와 todos의 소스가 일치하는지)
-        extracted_entities = intent.get("extracted_entities", {})
-        requested_sources = extracted_entities.get("data_sources", [])
+        requested_sources = view.data_sources
 
         if requested_sources:
             # Collector todos 확인
-            collector_todos = [
-                t for t in todos
-                if t.metadata and t.metadata.execution.tool == "collector"
-            ]
-
-            if collector_todos:
-                todo_sources = [
-                    t.metadata.execution.tool_params.get("source")
-                    for t in collector_todos
-                    if t.metadata.execution.tool_params.get("source")
-                ]
+            if has_collector:
+                todo_sources = collector_sources
 
                 # 요청된 소스가 모두 포함되었는지 확인
                 for source in requested_sources:
@@ -93,10 +224,9 @@ class TodoValidator:
                     warnings.append("Data sources specified in intent but no collector todos created")
 
         # 4. ML 파이프라인 순서 검증
-        ml_todos = [t for t in todos if t.layer == "ml_execution"]
-        if len(ml_todos) > 1:
+        if ml_todos_count > 1:
             # 일반적인 ML 파이프라인 순서: collect → preprocess → analyze → insight
-            tool_order = [t.metadata.execution.tool if t.metadata else None for t in ml_todos]
+            tool_order = ml_tools
 
             # Collector가 있으면 preprocessor가 있어야 함
             if "collector" in tool_order and "preprocessor" not in tool_order:
@@ -114,22 +244,13 @@ class TodoValidator:
                 suggestions.append("Add insight todo after analyzer")
 
         # 5. 보고서 생성 요청 검증
-        user_input_lower = user_input.lower()
-        report_keywords = ["보고서", "report", "문서", "document", "만들어", "생성"]
-
-        if any(keyword in user_input_lower for keyword in report_keywords):
-            report_todos = [
-                t for t in todos
-                if t.metadata and t.metadata.execution.tool == "report_agent"
-            ]
-            if not report_todos:
+        if requests_report:
+            if not has_report_agent:
                 warnings.append("User requested report generation but no report_agent todo found")
                 suggestions.append("Add biz_execution todo with tool: report_agent")
 
         # 6. Todo 우선순위 검증
-        for idx, todo in enumerate(todos):
-            if todo.priority is None or todo.priority < 0 or todo.priority > 10:
-                warnings.append(f"Todo '{todo.task}' has invalid priority: {todo.priority}")
+        warnings.extend(priority_warnings)
 
         # 결과 생성
         valid = len(errors) == 0
@@ -140,8 +261,8 @@ class TodoValidator:
             "warnings": warnings,
             "suggestions": suggestions,
             "total_todos": len(todos),
-            "ml_todos": len([t for t in todos if t.layer == "ml_execution"]),
-            "biz_todos": len([t for t in todos if t.layer == "biz_execution"]),
+            "ml_todos": ml_todos_count,
+            "biz_todos": biz_todos_count,
         }
 
         # 로깅
@@ -155,13 +276,16 @@ class TodoValidator:
         return result
 
     @staticmethod
-    def get_fallback_todos(intent: Dict[str, Any], user_input: str) -> List[TodoItem]:
+    def get_fallback_todos(
+        intent: Union[IntentView, Dict[str, Any]],
+        user_input: str = ""
+    ) -> List[TodoItem]:
         """
         Planning 실패 시 fallback todos 생성 (조건부 실행 로직)
 
         Args:
-            intent: Cognitive 노드가 파악한 의도
-            user_input: 사용자 입력
+            intent: Cognitive 노드가 파악한 의도 (dict 또는 IntentView)
+            user_input: 사용자 입력 (intent가 IntentView면 무시)
 
         Returns:
             기본 todos 리스트
@@ -175,23 +299,24 @@ class TodoValidator:
 
         todos = []
 
+        view = _as_view(intent, user_input)
+
         # Intent 플래그 추출
-        requires_data_collection = intent.get("requires_data_collection", False)
-        requires_preprocessing = intent.get("requires_preprocessing", False)
-        requires_ml = intent.get("requires_ml", False)
+        requires_data_collection = view.requires_data_collection
+        requires_preprocessing = view.requires_preprocessing
+        requires_ml = view.requires_ml
 
         # 추출된 엔티티에서 정보 가져오기
-        extracted_entities = intent.get("extracted_entities", {})
-        brand = extracted_entities.get("brand", "laneige")
-        platforms = extracted_entities.get("data_sources", ["youtube", "oliveyoung", "amazon"])
+        brand = view.brand
+        platforms = list(view.platforms)
 
         # 키워드 추출: entities에서 가져오거나, user_input에서 추출
-        keywords = extracted_entities.get("keywords", [])
+        keywords = view.keywords
         if keywords:
             keyword = keywords[0]  # 첫 번째 키워드 사용
         else:
             # user_input에서 키워드 추출 (간단한 휴리스틱)
-            keyword = TodoValidator._extract_keyword_from_input(user_input, brand)
+            keyword = TodoValidator._extract_keyword_from_input(view.user_input, brand)
 
         logger.info(f"[TodoValidator] Creating fallback todos: "
                    f"requires_data_collection={requires_data_collection}, "
@@ -260,9 +385,7 @@ class TodoValidator:
             priority_counter -= 1
 
             # 인사이트 도출 (트렌드/마케팅/글로벌 요청 시 K-Beauty RAG 사용)
-            user_input_lower = user_input.lower() if user_input else ""
-            trend_keywords = ["트렌드", "trend", "k-beauty", "kbeauty", "글로벌", "global", "마케팅", "marketing"]
-            use_trend_insight = any(kw in user_input_lower for kw in trend_keywords)
+            use_trend_insight = _TREND_KEYWORD_RE.search(view.user_input_lower) is not None
 
             insight_tool = "insight_with_trends" if use_trend_insight else "insight_generator"
             insight_task = "K-Beauty 트렌드 인사이트 도출" if use_trend_insight else "인사이트 도출"
@@ -279,7 +402,7 @@ class TodoValidator:
                 depends_on=["absa_analyzer"]
             ))
 
-        if intent.get("requires_biz"):
+        if view.requires_biz:
             # 기본 Biz 작업
             todos.append(create_todo(
                 task="보고서 생성",
@@ -294,7 +417,7 @@ class TodoValidator:
         return todos
 
     @staticmethod
-    def _extract_keyword_from_input(user_input: str, default_brand: str = "laneige") -> str:
+    def _extract_keyword_from_input(user_input: str, default_brand: str = _DEFAULT_BRAND) -> str:
         """
         사용자 입력에서 검색 키워드 추출
 
@@ -305,27 +428,16 @@ class TodoValidator:
         Returns:
             추출된 키워드
         """
-        import re
-
         if not user_input:
             return default_brand
 
         # 일반적인 제품/키워드 패턴
-        # "X 리뷰", "X 분석", "X 수집" 등에서 X 추출
-        patterns = [
-            r'([가-힣a-zA-Z0-9\s]+?)\s*리뷰',
-            r'([가-힣a-zA-Z0-9\s]+?)\s*분석',
-            r'([가-힣a-zA-Z0-9\s]+?)\s*수집',
-            r'([가-힣a-zA-Z0-9\s]+?)\s*인사이트',
-            r'([가-힣a-zA-Z0-9\s]+?)\s*데이터',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, user_input)
+        for pattern in _KEYWORD_PATTERNS:
+            match = pattern.search(user_input)
             if match:
                 keyword = match.group(1).strip()
                 # 너무 짧거나 일반적인 단어 제외
-                if len(keyword) >= 2 and keyword not in ['이', '그', '저', '해당', '관련']:
+                if len(keyword) >= 2 and keyword not in _KEYWORD_STOPWORDS:
                     logger.info(f"[TodoValidator] Extracted keyword from user input: '{keyword}'")
                     return keyword
 
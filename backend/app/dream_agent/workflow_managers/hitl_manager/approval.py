@@ -26,6 +26,24 @@ class ApprovalHandler:
     Plan 승인/수정/거부 처리
     """
 
+    # 승인 요청 메시지 템플릿 (str.format)
+    _TEMPLATE_KO = """## 실행 계획 승인 요청
+
+다음 작업을 실행할까요?
+
+{todos_summary}
+
+예상 소요 시간: {est}초
+"""
+    _TEMPLATE_EN = """## Execution Plan Approval
+
+Do you want to execute the following tasks?
+
+{todos_summary}
+
+Estimated time: {est} seconds
+"""
+
     def process_approval(
         self,
         plan: Plan,
@@ -121,29 +139,17 @@ class ApprovalHandler:
         Returns:
             승인 요청 메시지
         """
+        # join은 어차피 시퀀스를 만들므로 generator보다 list comprehension이 빠름
         todos_summary = "\n".join([
-            f"  {i+1}. {t.task} ({t.tool})"
-            for i, t in enumerate(plan.todos)
+            f"  {i}. {t.task} ({t.tool})"
+            for i, t in enumerate(plan.todos, 1)
         ])
 
-        if language == "ko":
-            return f"""## 실행 계획 승인 요청
-
-다음 작업을 실행할까요?
-
-{todos_summary}
-
-예상 소요 시간: {plan.estimated_duration_sec}초
-"""
-        else:
-            return f"""## Execution Plan Approval
-
-Do you want to execute the following tasks?
-
-{todos_summary}
-
-Estimated time: {plan.estimated_duration_sec} seconds
-"""
+        template = self._TEMPLATE_KO if language == "ko" else self._TEMPLATE_EN
+        return template.format(
+            todos_summary=todos_summary,
+            est=plan.estimated_duration_sec,
+        )
 
     def get_approval_options(self, language: str = "ko") -> list[str]:
         """승인 선택지 반환"""
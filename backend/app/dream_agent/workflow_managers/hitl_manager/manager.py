@@ -24,10 +24,8 @@ class HITLManager:
     def __init__(self):
         # session_id → HITLRequest
         self._pending_requests: dict[str, HITLRequest] = {}
-        # request_id → asyncio.Event
-        self._response_events: dict[str, asyncio.Event] = {}
-        # request_id → HITLResponse
-        self._responses: dict[str, HITLResponse] = {}
+        # request_id → 응답 Future (한 번만 완료되는 요청/응답)
+        self._futures: dict[str, asyncio.Future[HITLResponse]] = {}
 
     def create_request(
         self,
@@ -40,6 +38,8 @@ class HITLManager:
     ) -> HITLRequest:
         """HITL 요청 생성
 
+        응답 Future를 현재 이벤트 루프에 만들므로 루프 안에서 호출해야 합니다.
+
         Args:
             session_id: 세션 ID
             request_type: 요청 타입
@@ -61,7 +61,7 @@ class HITLManager:
         )
 
         self._pending_requests[session_id] = request
-        self._response_events[request.request_id] = asyncio.Event()
+        self._futures[request.request_id] = asyncio.get_running_loop().create_future()
 
         logger.info(
             "HITL request created",
@@ -86,13 +86,13 @@ class HITLManager:
         Returns:
             HITLResponse 또는 None (타임아웃)
         """
-        event = self._response_events.get(request_id)
-        if not event:
+        future = self._futures.get(request_id)
+        if future is None:
             return None
 
         try:
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-            return self._responses.get(request_id)
+            # shield: 타임아웃이 Future 자체를 취소하지 않도록 (다른 대기자/이후 응답 보존)
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
         except asyncio.TimeoutError:
             logger.warning("HITL response timeout", request_id=request_id)
             return None
@@ -115,10 +115,13 @@ class HITLManager:
         Returns:
             성공 여부
         """
-        event = self._response_events.get(request_id)
-        if not event:
+        future = self._futures.get(request_id)
+        if future is None:
             logger.warning("HITL request not found", request_id=request_id)
             return False
+        if future.done():
+            logger.warning("HITL request already resolved", request_id=request_id)
+            return False
 
         response = HITLResponse(
             request_id=request_id,
@@ -128,8 +131,7 @@ class HITLManager:
             responded_at=datetime.utcnow(),
         )
 
-        self._responses[request_id] = response
-        event.set()
+        future.set_result(response)
 
         logger.info(
             "HITL response submitted",
@@ -145,8 +147,8 @@ class HITLManager:
 
     def cancel_request(self, request_id: str) -> bool:
         """요청 취소"""
-        event = self._response_events.get(request_id)
-        if not event:
+        future = self._futures.get(request_id)
+        if future is None or future.done():
             return False
 
         # 취소 응답 생성
@@ -157,8 +159,7 @@ class HITLManager:
             comment="Request cancelled",
         )
 
-        self._responses[request_id] = response
-        event.set()
+        future.set_result(response)
 
         logger.info("HITL request cancelled", request_id=request_id)
         return True
@@ -167,8 +168,7 @@ class HITLManager:
         """세션 정리"""
         request = self._pending_requests.pop(session_id, None)
         if request:
-            self._response_events.pop(request.request_id, None)
-            self._responses.pop(request.request_id, None)
+            self._futures.pop(request.request_id, None)
 
 
 # 싱글톤
@@ -5,6 +5,8 @@
 Reference: docs/specs/HITL_SPEC.md#Plan-Editing
 """
 
+import copy
+from collections import OrderedDict
 from typing import Any, Optional
 
 from app.core.logging import get_logger
@@ -13,6 +15,35 @@ from app.dream_agent.models import Plan, PlanChange, TodoItem
 
 logger = get_logger(__name__)
 
+# 편집 명령 파싱 시스템 프롬프트 (매 호출 동일한 bytes → LLM 프롬프트 prefix 캐시 적중)
+_PARSE_SYSTEM_PROMPT = """
+당신은 Plan 편집 명령을 파싱하는 AI입니다.
+
+사용자의 자연어 명령을 다음 형식으로 변환하세요:
+
+## 지원 액션
+- add: Todo 추가
+- remove: Todo 삭제
+- modify: Todo 수정
+- reorder: 순서 변경
+
+## 응답 형식 (JSON)
+{
+    "action": "add|remove|modify|reorder",
+    "target_todo_ids": ["todo_id1", ...],
+    "params": {
+        "task": "작업 설명 (add/modify)",
+        "tool": "도구명 (add/modify)",
+        "priority": 1-10 (modify),
+        "new_position": 1-N (reorder)
+    },
+    "reason": "변경 이유"
+}
+"""
+
+# 파싱 결과 캐시 최대 항목 수 (오래 안 쓴 항목부터 제거)
+_PARSE_CACHE_SIZE = 128
+
 
 class PlanEditor:
     """Plan 편집기
@@ -22,6 +53,8 @@ class PlanEditor:
 
     def __init__(self):
         self.client = get_llm_client("planning")
+        # (plan_id, version, todo 목록, 정규화된 명령) → 파싱 결과
+        self._parse_cache: OrderedDict[tuple[str, int, str, str], dict[str, Any]] = OrderedDict()
 
     async def parse_instruction(
         self,
@@ -39,38 +72,19 @@ class PlanEditor:
         """
         logger.info("Parsing plan edit instruction", instruction=instruction)
 
-        # 프롬프트 구성
-        system_prompt = """
-당신은 Plan 편집 명령을 파싱하는 AI입니다.
-
-사용자의 자연어 명령을 다음 형식으로 변환하세요:
-
-## 지원 액션
-- add: Todo 추가
-- remove: Todo 삭제
-- modify: Todo 수정
-- reorder: 순서 변경
-
-## 응답 형식 (JSON)
-{
-    "action": "add|remove|modify|reorder",
-    "target_todo_ids": ["todo_id1", ...],
-    "params": {
-        "task": "작업 설명 (add/modify)",
-        "tool": "도구명 (add/modify)",
-        "priority": 1-10 (modify),
-        "new_position": 1-N (reorder)
-    },
-    "reason": "변경 이유"
-}
-"""
-
         # 현재 Todo 목록 문자열
         todos_str = "\n".join([
             f"{i+1}. [{t.id[:8]}] {t.task} (tool: {t.tool}, status: {t.status})"
             for i, t in enumerate(plan.todos)
         ])
 
+        # 같은 Plan 상태에서 같은 명령(재시도 등)이면 LLM 호출 생략
+        cache_key = (plan.plan_id, plan.version, todos_str, instruction.strip())
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            self._parse_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+
         user_prompt = f"""
 ## 현재 Plan의 Todo 목록
 {todos_str}
@@ -84,8 +98,11 @@ JSON으로 응답하세요.
         try:
             result = await self.client.generate_json(
                 prompt=user_prompt,
-                system_prompt=system_prompt,
+                system_prompt=_PARSE_SYSTEM_PROMPT,
             )
+            self._parse_cache[cache_key] = copy.deepcopy(result)
+            if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
             return result
         except Exception as e:
             logger.error("Failed to parse instruction", error=str(e))
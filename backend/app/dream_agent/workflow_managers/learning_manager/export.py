@@ -14,9 +14,33 @@ from pydantic import BaseModel, Field
 
 from app.core.logging import get_logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 
+def _dumps_line(record: dict[str, Any]) -> bytes:
+    """익스포트 레코드 직렬화 (한 줄 JSON + 개행, UTF-8 bytes, orjson 우선)"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            record,
+            default=str,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+    return (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def _loads(line: bytes) -> Any:
+    """JSONL 한 줄 파싱 (orjson.JSONDecodeError는 json.JSONDecodeError 하위 클래스)"""
+    if HAS_ORJSON:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
 class ExportConfig(BaseModel):
     """익스포트 설정"""
 
@@ -63,7 +87,7 @@ class LearningDataExporter:
         output_file = config.output_dir / f"traces_{timestamp}.jsonl"
 
         count = 0
-        with open(output_file, "w", encoding="utf-8") as f:
+        with open(output_file, "wb") as f:
             for record in self._read_trace_files(start_date, end_date):
                 if config.max_records and count >= config.max_records:
                     break
@@ -71,7 +95,7 @@ class LearningDataExporter:
                 if not config.include_metadata:
                     record.pop("metadata", None)
 
-                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                f.write(_dumps_line(record))
                 count += 1
 
         logger.info("Traces exported", count=count, file=str(output_file))
@@ -98,7 +122,7 @@ class LearningDataExporter:
         output_file = config.output_dir / f"queries_{timestamp}.jsonl"
 
         count = 0
-        with open(output_file, "w", encoding="utf-8") as f:
+        with open(output_file, "wb") as f:
             for record in self._read_query_files(start_date, end_date):
                 if config.max_records and count >= config.max_records:
                     break
@@ -106,7 +130,7 @@ class LearningDataExporter:
                 if not config.include_metadata:
                     record.pop("metadata", None)
 
-                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                f.write(_dumps_line(record))
                 count += 1
 
         logger.info("Queries exported", count=count, file=str(output_file))
@@ -133,7 +157,7 @@ class LearningDataExporter:
         output_file = config.output_dir / f"feedback_{timestamp}.jsonl"
 
         count = 0
-        with open(output_file, "w", encoding="utf-8") as f:
+        with open(output_file, "wb") as f:
             for record in self._read_feedback_files(start_date, end_date):
                 if config.max_records and count >= config.max_records:
                     break
@@ -141,7 +165,7 @@ class LearningDataExporter:
                 if not config.include_metadata:
                     record.pop("context", None)
 
-                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                f.write(_dumps_line(record))
                 count += 1
 
         logger.info("Feedback exported", count=count, file=str(output_file))
@@ -169,29 +193,19 @@ class LearningDataExporter:
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         output_file = config.output_dir / f"training_pairs_{timestamp}.jsonl"
 
-        # 피드백 데이터를 세션별로 그룹화
-        feedback_by_session: dict[str, list[dict]] = {}
-        for record in self._read_feedback_files(start_date, end_date):
-            session_id = record.get("session_id")
-            if session_id:
-                if session_id not in feedback_by_session:
-                    feedback_by_session[session_id] = []
-                feedback_by_session[session_id].append(record)
-
+        # 피드백 레코드마다 독립적으로 쌍을 만들므로 세션별로 모으지 않고 스트리밍
         count = 0
-        with open(output_file, "w", encoding="utf-8") as f:
-            for feedback_list in feedback_by_session.values():
-                if config.max_records and count >= config.max_records:
-                    break
+        with open(output_file, "wb") as f:
+            for feedback in self._read_feedback_files(start_date, end_date):
+                if not feedback.get("session_id"):
+                    continue
 
-                for feedback in feedback_list:
-                    training_pair = self._create_training_pair(feedback)
-                    if training_pair:
-                        f.write(
-                            json.dumps(training_pair, ensure_ascii=False, default=str)
-                            + "\n"
-                        )
-                        count += 1
+                training_pair = self._create_training_pair(feedback)
+                if training_pair:
+                    f.write(_dumps_line(training_pair))
+                    count += 1
+                    if config.max_records and count >= config.max_records:
+                        break
 
         logger.info("Training pairs exported", count=count, file=str(output_file))
         return output_file
@@ -281,10 +295,10 @@ class LearningDataExporter:
                 if end_date and file_date > end_date:
                     continue
 
-                with open(file_path, "r", encoding="utf-8") as f:
+                with open(file_path, "rb") as f:
                     for line in f:
                         try:
-                            yield json.loads(line)
+                            yield _loads(line)
                         except json.JSONDecodeError:
                             continue
 
@@ -5,8 +5,11 @@
 Reference: docs/specs/LEARNING_SPEC.md
 """
 
+import asyncio
 import json
-from datetime import datetime
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Literal, Optional
 
@@ -14,9 +17,71 @@ from pydantic import BaseModel, Field
 
 from app.core.logging import get_logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 
+def _feedback_path(output_dir: Path, date_str: str) -> Path:
+    """날짜(YYYY-MM-DD)별 피드백 파일 경로"""
+    return output_dir / f"feedback_{date_str}.jsonl"
+
+
+def _serialize_records(records: list["FeedbackRecord"]) -> bytes:
+    """레코드들을 JSONL 한 덩어리로 직렬화 (한 번의 write로 기록)"""
+    return "".join([record.model_dump_json() + "\n" for record in records]).encode("utf-8")
+
+
+def _append_payload(output_file: Path, payload: bytes, count: int) -> None:
+    """직렬화된 레코드를 파일에 추가 (writer 스레드 또는 종료 시 직접 실행)"""
+    try:
+        with open(output_file, "ab") as f:
+            f.write(payload)
+
+        logger.debug("Feedback buffer flushed", count=count)
+
+    except Exception as e:
+        logger.error("Failed to flush feedback buffer", error=str(e))
+
+
+def _flush_orphaned(
+    buffer: list["FeedbackRecord"],
+    output_dir: Path,
+    writer: ThreadPoolExecutor,
+) -> None:
+    """수집기가 GC되거나 인터프리터가 종료될 때 남은 버퍼 기록 (weakref.finalize 콜백)
+
+    Args:
+        buffer: 수집기의 버퍼 (수집기 자체는 참조하지 않음)
+        output_dir: 피드백 저장 디렉토리
+        writer: 수집기의 writer (앞서 넘긴 배치 뒤에 기록해 순서 유지)
+    """
+    if buffer:
+        payload = _serialize_records(buffer)
+        count = len(buffer)
+        buffer.clear()
+
+        output_file = _feedback_path(output_dir, datetime.utcnow().date().isoformat())
+        try:
+            writer.submit(_append_payload, output_file, payload, count)
+        except RuntimeError:
+            # 인터프리터 종료 중에는 executor에 새 작업을 넣을 수 없으므로 직접 기록
+            _append_payload(output_file, payload, count)
+    # 대기 중인 배치는 끝까지 기록됨 (wait=False는 취소하지 않음)
+    writer.shutdown(wait=False)
+
+
+def _loads(line: bytes) -> Any:
+    """JSONL 한 줄 파싱 (orjson 우선)"""
+    if HAS_ORJSON:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
 class FeedbackRecord(BaseModel):
     """피드백 레코드 모델"""
 
@@ -51,8 +116,25 @@ class FeedbackCollector:
         self.output_dir = output_dir or Path("logs/feedback")
         self.buffer_size = buffer_size
         self._buffer: list[FeedbackRecord] = []
+        # 오늘(UTC) 피드백 파일 경로 캐시 (날짜가 바뀌면 갱신)
+        self._cached_date: Optional[date] = None
+        self._cached_file: Optional[Path] = None
+        # 파일 기록 전용 단일 worker (요청 처리 루프를 막지 않고, 배치 순서 유지)
+        # 스레드는 첫 submit 때 생성되므로 미리 만들어 finalizer에 넘김
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="feedback-writer")
+        self._last_write: Optional[Future] = None
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # GC 또는 인터프리터 종료 시 남은 버퍼 기록 (수집기 자체는 참조하지 않아 수명에 영향 없음)
+        self._finalizer = weakref.finalize(
+            self, _flush_orphaned, self._buffer, self.output_dir, self._writer
+        )
+
+    async def __aenter__(self) -> "FeedbackCollector":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aflush()
 
     def collect_rating(
         self,
@@ -142,33 +224,70 @@ class FeedbackCollector:
         logger.info("Preference feedback collected", session_id=session_id)
 
     def _add_record(self, record: FeedbackRecord) -> None:
-        """레코드 추가"""
+        """레코드 추가 (버퍼가 차면 백그라운드 기록, 호출자는 대기하지 않음)"""
         self._buffer.append(record)
 
         if len(self._buffer) >= self.buffer_size:
-            self.flush()
-
-    def flush(self) -> None:
-        """버퍼 내용을 파일에 기록"""
-        if not self._buffer:
-            return
-
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        output_file = self.output_dir / f"feedback_{today}.jsonl"
+            self._submit_flush()
 
-        try:
-            with open(output_file, "a", encoding="utf-8") as f:
-                for record in self._buffer:
-                    line = record.model_dump_json()
-                    f.write(line + "\n")
+    def _submit_flush(self) -> Optional[Future]:
+        """버퍼를 직렬화해 writer에 넘기고 버퍼를 비움
 
-            logger.debug("Feedback buffer flushed", count=len(self._buffer))
+        Returns:
+            마지막 기록 작업의 Future (기록한 적이 없으면 None)
+        """
+        if self._buffer:
+            # 버퍼 전체를 미리 직렬화해 한 번의 write로 기록
+            payload = _serialize_records(self._buffer)
+            count = len(self._buffer)
+            self._buffer.clear()
 
-        except Exception as e:
-            logger.error("Failed to flush feedback buffer", error=str(e))
+            output_file = self._today_file()
+            try:
+                self._last_write = self._writer.submit(
+                    _append_payload, output_file, payload, count
+                )
+            except RuntimeError:
+                # 인터프리터 종료 중에는 executor에 새 작업을 넣을 수 없으므로 직접 기록
+                _append_payload(output_file, payload, count)
+        return self._last_write
+
+    def _wait_pending(self) -> None:
+        """진행 중인 백그라운드 기록 완료 대기 (파일 조회 전)"""
+        if self._last_write is not None:
+            self._last_write.result()
 
-        finally:
-            self._buffer.clear()
+    def flush(self) -> None:
+        """버퍼 내용을 파일에 기록 (진행 중인 백그라운드 기록 포함, 완료까지 대기)"""
+        future = self._submit_flush()
+        if future is not None:
+            future.result()
+
+    async def aflush(self) -> None:
+        """flush의 비동기 버전 (이벤트 루프를 막지 않고 기록 완료 대기)"""
+        future = self._submit_flush()
+        if future is not None:
+            await asyncio.wrap_future(future)
+
+    def _feedback_file(self, date_str: str) -> Path:
+        """날짜(YYYY-MM-DD)별 피드백 파일 경로"""
+        return _feedback_path(self.output_dir, date_str)
+
+    def _today_file(self) -> Path:
+        """오늘(UTC) 피드백 파일 경로 (날짜가 바뀔 때만 새로 생성)"""
+        today = datetime.utcnow().date()
+        if today != self._cached_date or self._cached_file is None:
+            self._cached_date = today
+            self._cached_file = self._feedback_file(today.isoformat())
+        return self._cached_file
+
+    def _recent_files(self, days: int) -> list[Path]:
+        """최근 days일의 피드백 파일 경로 (오늘부터 역순)"""
+        today = datetime.utcnow().date()
+        return [
+            self._feedback_file((today - timedelta(days=days_ago)).isoformat())
+            for days_ago in range(days)
+        ]
 
     def get_session_feedback(
         self,
@@ -183,6 +302,7 @@ class FeedbackCollector:
             피드백 목록
         """
         records: list[FeedbackRecord] = []
+        self._wait_pending()
 
         # 버퍼에서 조회
         for record in self._buffer:
@@ -190,21 +310,18 @@ class FeedbackCollector:
                 records.append(record)
 
         # 파일에서 조회 (최근 7일)
-        for days_ago in range(7):
-            date = datetime.utcnow()
-            date = date.replace(
-                day=date.day - days_ago if date.day > days_ago else 1
-            )
-            date_str = date.strftime("%Y-%m-%d")
-            feedback_file = self.output_dir / f"feedback_{date_str}.jsonl"
-
+        # 세션 ID(JSON 이스케이프 형태)가 없는 줄은 파싱하지 않고 건너뜀
+        needle = json.dumps(session_id, ensure_ascii=False)[1:-1].encode("utf-8")
+        for feedback_file in self._recent_files(7):
             if not feedback_file.exists():
                 continue
 
             try:
-                with open(feedback_file, "r", encoding="utf-8") as f:
+                with open(feedback_file, "rb") as f:
                     for line in f:
-                        data = json.loads(line)
+                        if needle not in line:
+                            continue
+                        data = _loads(line)
                         if data.get("session_id") == session_id:
                             records.append(FeedbackRecord(**data))
             except Exception as e:
@@ -222,22 +339,16 @@ class FeedbackCollector:
             평균 평점
         """
         ratings: list[int] = []
+        self._wait_pending()
 
-        for days_ago in range(days):
-            date = datetime.utcnow()
-            date = date.replace(
-                day=date.day - days_ago if date.day > days_ago else 1
-            )
-            date_str = date.strftime("%Y-%m-%d")
-            feedback_file = self.output_dir / f"feedback_{date_str}.jsonl"
-
+        for feedback_file in self._recent_files(days):
             if not feedback_file.exists():
                 continue
 
             try:
-                with open(feedback_file, "r", encoding="utf-8") as f:
+                with open(feedback_file, "rb") as f:
                     for line in f:
-                        data = json.loads(line)
+                        data = _loads(line)
                         if data.get("feedback_type") == "rating":
                             rating = data.get("rating")
                             if rating:
@@ -247,10 +358,6 @@ class FeedbackCollector:
 
         return sum(ratings) / len(ratings) if ratings else 0.0
 
-    def __del__(self) -> None:
-        """소멸자 - 버퍼 flush"""
-        self.flush()
-
 
 # 싱글톤
 _feedback_collector: Optional[FeedbackCollector] = None
@@ -0,0 +1 @@
+"""Workflow Manager 유닛 테스트 패키지"""
@@ -0,0 +1,128 @@
+"""ManagerRegistry 테스트
+
+위치: backend.app.dream_agent.workflow_manager.manager_registry
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from backend.app.dream_agent.workflow_manager.base_manager import BaseManager
+from backend.app.dream_agent.workflow_manager.manager_registry import ManagerRegistry, RegistryStatus
+
+
+class _RecordingManager(BaseManager):
+    """초기화 순서를 기록하는 테스트용 Manager"""
+
+    def __init__(self, name: str, log: List[str]):
+        super().__init__(name)
+        self._log = log
+
+    def _do_initialize(self) -> None:
+        self._log.append(self.name)
+
+    def validate(self) -> Dict[str, Any]:
+        return {"valid": True}
+
+
+@pytest.fixture
+def registry():
+    """비어 있는 싱글톤 Registry (테스트 후 다시 비움)"""
+    registry = ManagerRegistry()
+    registry.reset()
+    yield registry
+    registry.reset()
+
+
+def _register(registry: ManagerRegistry, log: List[str], name: str, *depends_on: str) -> None:
+    registry.register(name, _RecordingManager(name, log), depends_on=list(depends_on))
+
+
+class TestInitializationOrder:
+    """Kahn 위상 정렬 초기화 순서 테스트"""
+
+    def test_dependencies_come_first(self, registry):
+        """의존 대상이 먼저 오고, 독립 Manager는 같은 레이어"""
+        log: List[str] = []
+        _register(registry, log, "todo", "config", "store")
+        _register(registry, log, "config")
+        _register(registry, log, "store", "config")
+        _register(registry, log, "cache")
+
+        order = registry._compute_initialization_order()
+
+        assert order.index("config") < order.index("store") < order.index("todo")
+        assert registry._initialization_layers[0] == ["config", "cache"]
+
+    def test_order_cached_until_registration_changes(self, registry):
+        """등록 변경이 없으면 같은 결과를 재사용, 해제 시 재계산"""
+        log: List[str] = []
+        _register(registry, log, "a")
+        _register(registry, log, "b", "a")
+
+        first = registry._compute_initialization_order()
+        assert registry._compute_initialization_order() is first
+
+        registry.unregister("a")
+        assert registry._compute_initialization_order() == ["b"]
+
+    def test_dependency_registered_later_is_counted(self, registry):
+        """나중에 등록된 의존 대상도 in-degree에 반영"""
+        log: List[str] = []
+        _register(registry, log, "b", "a")
+        _register(registry, log, "a")
+
+        assert registry._compute_initialization_order() == ["a", "b"]
+
+    async def test_initialize_all_follows_order(self, registry):
+        """initialize_all은 계산된 순서대로 초기화"""
+        log: List[str] = []
+        _register(registry, log, "c", "b")
+        _register(registry, log, "b", "a")
+        _register(registry, log, "a")
+
+        result = await registry.initialize_all()
+
+        assert log == ["a", "b", "c"]
+        assert registry.status == RegistryStatus.READY
+        assert result["order"] == ["a", "b", "c"]
+
+
+class TestCircularDependency:
+    """순환 의존성 오류 테스트"""
+
+    def test_cycle_error_shows_path(self, registry):
+        """순환 경로가 오류 메시지에 포함"""
+        log: List[str] = []
+        _register(registry, log, "a", "c")
+        _register(registry, log, "b", "a")
+        _register(registry, log, "c", "b")
+        _register(registry, log, "d", "a")
+
+        with pytest.raises(ValueError) as exc_info:
+            registry._compute_initialization_order()
+
+        message = str(exc_info.value)
+        assert "Circular dependency detected" in message
+        path = message.split(": ", 1)[1].split(" -> ")
+        assert path[0] == path[-1]
+        assert set(path) == {"a", "b", "c"}
+
+    def test_self_dependency(self, registry):
+        """자기 자신에 대한 의존도 순환으로 보고"""
+        _register(registry, [], "a", "a")
+
+        with pytest.raises(ValueError, match="a -> a"):
+            registry._compute_initialization_order()
+
+    async def test_initialize_all_reports_cycle(self, registry):
+        """initialize_all은 순환 시 ERROR 상태와 실패 정보 반환"""
+        log: List[str] = []
+        _register(registry, log, "a", "b")
+        _register(registry, log, "b", "a")
+
+        result = await registry.initialize_all()
+
+        assert log == []
+        assert registry.status == RegistryStatus.ERROR
+        assert result["failed"][0]["name"] == "registry"
@@ -0,0 +1,121 @@
+"""PlanEditor 테스트
+
+위치: backend.app.dream_agent.workflow_manager.hitl_manager.plan_editor
+"""
+
+from typing import List, Optional
+
+import pytest
+
+from backend.app.dream_agent.models.plan import Plan
+from backend.app.dream_agent.models.todo import TodoDependencyConfig, TodoItem, TodoMetadata
+from backend.app.dream_agent.workflow_manager.hitl_manager.plan_editor import (
+    EditOperation,
+    PlanEdit,
+    PlanEditor,
+)
+
+
+def _make_todo(todo_id: str, depends_on: Optional[List[str]] = None) -> TodoItem:
+    return TodoItem(
+        id=todo_id,
+        task=f"작업 {todo_id}",
+        layer="ml_execution",
+        metadata=TodoMetadata(dependency=TodoDependencyConfig(depends_on=depends_on or [])),
+    )
+
+
+@pytest.fixture
+def plan():
+    """t1 <- t2 <- t3 의존 체인 Plan"""
+    return Plan(
+        session_id="s1",
+        todos=[_make_todo("t1"), _make_todo("t2", ["t1"]), _make_todo("t3", ["t2"])],
+    )
+
+
+class TestEditHistoryLimit:
+    """편집/변경 이력 보관 한도 테스트"""
+
+    async def test_change_columns_trimmed_with_history(self, plan):
+        """변경 이력 컬럼도 max_history개로 제한"""
+        editor = PlanEditor("s1", max_history=3)
+        edits = [PlanEdit(EditOperation.UPDATE, todo_id="t1", data={"priority": p}) for p in range(5)]
+
+        await editor.apply_edits(plan, edits, actor="user")
+
+        assert len(editor._edit_history) == 3
+        assert len(editor._change_types) == len(editor._change_actors) == len(editor._change_ts) == 3
+        summary = editor.get_summary()
+        assert summary["total_edits"] == 3
+        assert summary["changes_summary"] == {"modify_todo": 3}
+        assert summary["last_change_at"] is not None
+
+
+class TestBatchEdits:
+    """배치 편집 + 역방향 의존성 인덱스 테스트"""
+
+    async def test_batch_bumps_version_once(self, plan):
+        """배치 전체에 대해 Plan 버전은 1회만 증가"""
+        editor = PlanEditor("s1")
+        edits = [
+            PlanEdit(EditOperation.UPDATE, todo_id="t1", data={"priority": 9}),
+            PlanEdit(EditOperation.ADD, data={"task": "새 작업"}),
+            PlanEdit(EditOperation.SKIP, todo_id="t3"),
+        ]
+
+        await editor.apply_edits(plan, edits)
+
+        assert plan.current_version == 2
+        assert len(plan.todos) == 4
+
+    async def test_delete_strips_dependents(self, plan):
+        """삭제된 todo에 의존하던 todo의 depends_on만 정리"""
+        editor = PlanEditor("s1")
+
+        await editor.apply_edits(plan, [PlanEdit(EditOperation.DELETE, todo_id="t1")])
+
+        todos = {t.id: t for t in plan.todos}
+        assert set(todos) == {"t2", "t3"}
+        assert todos["t2"].metadata.dependency.depends_on == []
+        assert todos["t3"].metadata.dependency.depends_on == ["t2"]
+
+    async def test_batch_deletes_use_updated_index(self, plan):
+        """배치 안에서 추가/수정된 의존성도 삭제 시 정리"""
+        editor = PlanEditor("s1")
+        edits = [
+            PlanEdit(EditOperation.ADD, data={"task": "후처리", "depends_on": ["t2"]}),
+            PlanEdit(EditOperation.UPDATE, todo_id="t3", data={"depends_on": ["t1", "t2"]}),
+            PlanEdit(EditOperation.DELETE, todo_id="t2"),
+            PlanEdit(EditOperation.DELETE, todo_id="t1"),
+        ]
+
+        await editor.apply_edits(plan, edits)
+
+        assert [t.id for t in plan.todos][0] == "t3"
+        assert all(t.metadata.dependency.depends_on == [] for t in plan.todos)
+        assert editor._dependents.get("t1", set()) == set()
+
+    async def test_cycle_introduced_by_batch_is_reverted(self, plan):
+        """배치 커밋 시 순환 의존성을 만든 변경은 되돌림"""
+        editor = PlanEditor("s1")
+
+        await editor.apply_edits(plan, [
+            PlanEdit(EditOperation.UPDATE, todo_id="t1", data={"depends_on": ["t3"]}),
+        ])
+
+        todos = {t.id: t for t in plan.todos}
+        assert todos["t1"].metadata.dependency.depends_on == []
+        assert plan.changes[-1].change_data == {"reverted_depends_on": ["t1"]}
+
+    async def test_failed_edit_does_not_stop_batch(self, plan):
+        """실패한 편집이 있어도 나머지는 적용"""
+        editor = PlanEditor("s1")
+
+        await editor.apply_edits(plan, [
+            PlanEdit(EditOperation.DELETE, todo_id="missing"),
+            PlanEdit(EditOperation.UPDATE, todo_id="t2", data={"task": "변경"}),
+        ])
+
+        assert {t.id: t.task for t in plan.todos}["t2"] == "변경"
+        assert len(editor.get_edit_history()) == 1
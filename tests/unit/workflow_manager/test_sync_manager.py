@@ -0,0 +1,51 @@
+"""SyncManager 테스트
+
+위치: backend.app.dream_agent.workflow_manager.planning_manager.sync_manager
+"""
+
+import sys
+
+from backend.app.dream_agent.models.plan import Plan
+from backend.app.dream_agent.models.todo import TodoItem
+from backend.app.dream_agent.workflow_manager.planning_manager.sync_manager import SyncManager
+
+# 패키지의 sync_manager 이름은 싱글톤 인스턴스이므로 모듈은 sys.modules에서 조회
+sync_module = sys.modules[SyncManager.__module__]
+
+
+def _make_plan(*todo_ids: str) -> Plan:
+    return Plan(
+        session_id="s1",
+        todos=[TodoItem(id=tid, task=f"작업 {tid}", layer="ml_execution") for tid in todo_ids],
+    )
+
+
+class TestPlanIdMap:
+    """plan_obj.todos id 맵 메모이즈 테스트"""
+
+    def test_reused_for_same_version_and_list(self):
+        """버전과 리스트가 같으면 같은 맵 재사용"""
+        plan = _make_plan("t1", "t2")
+
+        assert sync_module._plan_id_map(plan) is sync_module._plan_id_map(plan)
+
+    def test_rebuilt_for_new_list_with_same_length(self):
+        """같은 길이의 새 리스트로 교체되면 다시 구축"""
+        plan = _make_plan("t1", "t2")
+        sync_module._plan_id_map(plan)
+
+        plan.todos = [TodoItem(id=tid, task="새 작업", layer="ml_execution") for tid in ("t3", "t4")]
+
+        assert set(sync_module._plan_id_map(plan)) == {"t3", "t4"}
+
+    def test_rebuilt_after_in_place_replace_with_version_bump(self):
+        """제자리 교체 + 버전 증가 후에는 새 todo를 반환"""
+        plan = _make_plan("t1", "t2")
+        sync_module._plan_id_map(plan)
+
+        replacement = plan.todos[0].model_copy(update={"status": "completed"})
+        plan.todos[0] = replacement
+        plan.current_version += 1
+
+        assert sync_module._plan_id_map(plan)["t1"] is replacement
+
@@ -0,0 +1,40 @@
+"""Todo 생성 헬퍼 테스트
+
+위치: backend.app.dream_agent.workflow_manager.todo_manager.todo_creator
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from backend.app.dream_agent.workflow_manager.todo_manager.todo_creator import (
+    create_biz_todo,
+    create_ml_todo,
+)
+
+
+class TestCreateHelpers:
+    """ML/Biz todo 생성 헬퍼 테스트"""
+
+    def test_create_ml_todo(self):
+        """ML todo 필드 설정"""
+        todo = create_ml_todo("리뷰 수집", tool="collector", tool_params={"source": "web"}, depends_on=["t0"])
+
+        assert todo.layer == "ml_execution"
+        assert todo.task_type == "ml_collector"
+        assert todo.metadata.execution.tool_params == {"source": "web"}
+        assert todo.metadata.dependency.depends_on == ["t0"]
+
+    def test_create_biz_todo(self):
+        """Biz todo 필드 설정"""
+        todo = create_biz_todo("리포트 생성", tool="report", requires_approval=True)
+
+        assert todo.layer == "biz_execution"
+        assert todo.metadata.approval.requires_approval is True
+        assert todo.metadata.dependency.depends_on == []
+
+    @pytest.mark.parametrize("factory", [create_ml_todo, create_biz_todo])
+    @pytest.mark.parametrize("priority", [-1, 11])
+    def test_priority_out_of_range_rejected(self, factory, priority):
+        """priority 범위(0-10) 검증"""
+        with pytest.raises(ValidationError):
+            factory("작업", tool="collector", priority=priority)
@@ -0,0 +1,111 @@
+"""TodoFailureRecovery 테스트
+
+위치: backend.app.dream_agent.workflow_manager.todo_manager.todo_failure_recovery
+"""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from backend.app.dream_agent.models.todo import TodoItem
+from backend.app.dream_agent.workflow_manager.todo_manager.todo_failure_recovery import TodoFailureRecovery
+
+# 패키지의 todo_failure_recovery 이름은 싱글톤 인스턴스이므로 모듈은 sys.modules에서 조회
+recovery_module = sys.modules[TodoFailureRecovery.__module__]
+
+
+def _make_todo(todo_id: str, tool: str = "collector") -> TodoItem:
+    todo = TodoItem(id=todo_id, task=f"작업 {todo_id}", layer="ml_execution", status="failed")
+    todo.metadata.execution.tool = tool
+    return todo
+
+
+@pytest.fixture
+def recovery():
+    """새 TodoFailureRecovery"""
+    return TodoFailureRecovery()
+
+
+class TestAutoRetry:
+    """자동 재시도 테스트"""
+
+    async def test_retry_resets_to_pending(self, recovery, monkeypatch):
+        """재시도 시 pending + retry_count 증가"""
+        monkeypatch.setattr(recovery_module, "_RETRY_MAX_DELAY", 0.0)
+        todo = _make_todo("t1")
+
+        result = await recovery.handle_todo_failure(todo, TimeoutError("request timed out"), [todo], "s1")
+
+        assert result["action"] == "retry"
+        assert result["updated_todo"].status == "pending"
+        assert result["updated_todo"].metadata.execution.retry_count == 1
+
+    async def test_same_tool_retries_back_off_concurrently(self, recovery, monkeypatch):
+        """같은 tool의 동시 재시도가 서로의 백오프를 기다리지 않음"""
+        monkeypatch.setattr(recovery_module, "_RETRY_BASE_DELAY", 0.2)
+        monkeypatch.setattr(recovery_module, "_RETRY_MAX_DELAY", 0.2)
+        todos = [_make_todo(f"t{i}") for i in range(4)]
+
+        start = time.monotonic()
+        results = await asyncio.gather(*(
+            recovery.handle_todo_failure(t, TimeoutError("timeout"), todos, "s1") for t in todos
+        ))
+        elapsed = time.monotonic() - start
+
+        assert [r["action"] for r in results] == ["retry"] * 4
+        assert elapsed < 0.6
+
+    async def test_max_retries_escalates(self, recovery):
+        """최대 재시도 초과 시 사용자 개입 (websocket 없으면 skip)"""
+        todo = _make_todo("t1")
+        todo.metadata.execution.retry_count = todo.metadata.execution.max_retries
+
+        result = await recovery.handle_todo_failure(todo, TimeoutError("timeout"), [todo], "s1")
+
+        assert result["action"] == "skip"
+
+
+class TestUserDecisionQueue:
+    """세션별 사용자 결정 큐 테스트"""
+
+    async def test_waiters_in_same_session_get_own_decisions(self, recovery):
+        """같은 세션의 두 대기자가 각자의 결정을 받음 (제출 순서와 무관)"""
+        first = asyncio.create_task(recovery._wait_for_user_decision("s1", "t1", timeout=2))
+        second = asyncio.create_task(recovery._wait_for_user_decision("s1", "t2", timeout=2))
+        await asyncio.sleep(0)
+
+        await recovery.submit_user_decision("s1", "t2", "skip")
+        await recovery.submit_user_decision("s1", "t1", "retry")
+
+        assert (await first)["action"] == "retry"
+        assert (await second)["action"] == "skip"
+
+    async def test_sessions_are_isolated(self, recovery):
+        """다른 세션의 같은 todo ID 결정은 섞이지 않음"""
+        waiter_a = asyncio.create_task(recovery._wait_for_user_decision("a", "t1", timeout=2))
+        waiter_b = asyncio.create_task(recovery._wait_for_user_decision("b", "t1", timeout=2))
+        await asyncio.sleep(0)
+
+        await recovery.submit_user_decision("b", "t1", "abort")
+        await recovery.submit_user_decision("a", "t1", "retry", {"note": "a"})
+
+        decision_a = await waiter_a
+        assert decision_a["action"] == "retry"
+        assert decision_a["data"] == {"note": "a"}
+        assert (await waiter_b)["action"] == "abort"
+
+    async def test_timeout_auto_skips_and_cleans_up(self, recovery):
+        """타임아웃 시 skip 반환 + 세션 큐 정리"""
+        decision = await recovery._wait_for_user_decision("s1", "t1", timeout=0.05)
+
+        assert decision["action"] == "skip"
+        assert "s1" not in recovery._session_queues
+        assert "s1" not in recovery._pending_decisions
+
+    async def test_submit_without_waiter_is_ignored(self, recovery):
+        """대기자가 없으면 결정을 버리고 큐를 만들지 않음"""
+        await recovery.submit_user_decision("s1", "t1", "retry")
+
+        assert "s1" not in recovery._session_queues
@@ -0,0 +1,145 @@
+"""Todo 조회 헬퍼 / TodoIndex / ReadyTracker 테스트
+
+위치: backend.app.dream_agent.workflow_manager.todo_manager.todo_queries
+"""
+
+from typing import List, Optional
+
+import pytest
+
+from backend.app.dream_agent.models.todo import TodoItem
+from backend.app.dream_agent.workflow_manager.todo_manager.todo_queries import (
+    ReadyTracker,
+    TodoIndex,
+    get_completed_todos,
+    get_failed_todos,
+    get_in_progress_todos,
+    get_pending_todos,
+    get_ready_todos,
+    peek_next_pending,
+)
+from backend.app.dream_agent.workflow_manager.todo_manager.todo_updater import update_todo_status
+
+
+def _make_todo(
+    todo_id: str,
+    layer: str = "ml_execution",
+    priority: int = 5,
+    depends_on: Optional[List[str]] = None,
+    tool: Optional[str] = None,
+    status: str = "pending",
+) -> TodoItem:
+    todo = TodoItem(id=todo_id, task=f"작업 {todo_id}", layer=layer, priority=priority, status=status)
+    todo.metadata.dependency.depends_on = depends_on or []
+    todo.metadata.execution.tool = tool
+    return todo
+
+
+def _ids(todos: List[TodoItem]) -> List[str]:
+    return [t.id for t in todos]
+
+
+@pytest.fixture
+def todos():
+    """레이어/우선순위/의존성이 섞인 todo 목록"""
+    return [
+        _make_todo("collect", priority=5, tool="collector"),
+        _make_todo("preprocess", priority=7, depends_on=["collect"], tool="preprocessor"),
+        _make_todo("sentiment", priority=5, depends_on=["preprocessor"]),
+        _make_todo("keywords", priority=5, depends_on=["preprocess"]),
+        _make_todo("report", layer="biz_execution", priority=9, depends_on=["sentiment", "keywords"]),
+        _make_todo("notify", layer="biz_execution", priority=1),
+    ]
+
+
+class TestTodoIndex:
+    """상태별 인덱스 테스트"""
+
+    @pytest.mark.parametrize("layer", [None, "ml_execution", "biz_execution"])
+    def test_queries_match_linear_scan(self, todos, layer):
+        """상태 전이 후에도 인덱스 조회 결과가 전체 스캔과 동일"""
+        index = TodoIndex(todos)
+        todos = update_todo_status(todos, "collect", "completed", index=index)
+        todos = update_todo_status(todos, "preprocess", "in_progress", index=index)
+        todos = update_todo_status(todos, "notify", "failed", "boom", index=index)
+
+        for query in (get_pending_todos, get_in_progress_todos, get_completed_todos, get_failed_todos):
+            assert _ids(query(todos, layer, index=index)) == _ids(query(todos, layer))
+        assert peek_next_pending(todos, layer, index=index) == peek_next_pending(todos, layer)
+        assert _ids(get_ready_todos(todos, layer, index=index)) == _ids(get_ready_todos(todos, layer))
+
+    def test_pending_cache_invalidated_on_transition(self, todos):
+        """pending 정렬 캐시는 pending 전이 시 갱신"""
+        index = TodoIndex(todos)
+        assert _ids(index.pending())[0] == "report"
+
+        todos = update_todo_status(todos, "report", "in_progress", index=index)
+        assert "report" not in _ids(index.pending())
+
+        todos = update_todo_status(todos, "report", "pending", index=index)
+        assert _ids(index.pending())[0] == "report"
+
+    def test_keeps_list_order_after_round_trip(self, todos):
+        """상태가 되돌아와도 최초 리스트 순서 유지"""
+        index = TodoIndex(todos)
+        todos = update_todo_status(todos, "collect", "in_progress", index=index)
+        todos = update_todo_status(todos, "collect", "pending", index=index)
+
+        assert _ids(index.get("pending", "ml_execution")) == [
+            "collect", "preprocess", "sentiment", "keywords"
+        ]
+
+
+class TestReadyTracker:
+    """의존성 in-degree 추적 테스트"""
+
+    def test_initial_ready_matches_scan(self, todos):
+        """초기 ready 집합이 get_ready_todos와 동일"""
+        tracker = ReadyTracker(todos)
+
+        assert _ids(tracker.ready()) == _ids(get_ready_todos(todos)) == ["collect", "notify"]
+
+    def test_completion_releases_dependents(self, todos):
+        """완료 시 ID/tool 의존성이 모두 충족된 dependents만 ready"""
+        tracker = ReadyTracker(todos)
+
+        todos = update_todo_status(todos, "collect", "completed", tracker=tracker)
+        assert _ids(tracker.ready("ml_execution")) == ["preprocess"]
+
+        newly_ready = tracker.replace(
+            todos[1], todos[1].model_copy(update={"status": "completed"})
+        )
+        # preprocess 완료: ID 의존(keywords) + tool 의존(sentiment) 모두 해소
+        assert sorted(_ids(newly_ready)) == ["keywords", "sentiment"]
+
+    def test_matches_scan_through_workflow(self, todos):
+        """실행 흐름 전체에서 tracker.ready()가 get_ready_todos와 동일"""
+        tracker = ReadyTracker(todos)
+
+        while tracker.ready():
+            assert _ids(tracker.ready()) == _ids(get_ready_todos(todos))
+            next_id = tracker.ready()[0].id
+            todos = update_todo_status(todos, next_id, "in_progress", tracker=tracker)
+            assert next_id not in _ids(tracker.ready())
+            todos = update_todo_status(todos, next_id, "completed", tracker=tracker)
+
+        assert all(t.status == "completed" for t in todos)
+
+    def test_retry_after_failure_is_ready_again(self, todos):
+        """failed → pending 재시도 시 다시 ready"""
+        tracker = ReadyTracker(todos)
+        todos = update_todo_status(todos, "collect", "in_progress", tracker=tracker)
+        todos = update_todo_status(todos, "collect", "failed", "boom", tracker=tracker)
+        assert "collect" not in _ids(tracker.ready())
+
+        todos = update_todo_status(todos, "collect", "pending", tracker=tracker)
+        assert "collect" in _ids(tracker.ready())
+
+    def test_added_after_dependency_completed(self, todos):
+        """이미 완료된 의존성에 걸린 todo는 추가 즉시 ready"""
+        tracker = ReadyTracker(todos)
+        update_todo_status(todos, "collect", "completed", tracker=tracker)
+
+        added = _make_todo("summary", depends_on=["collect", "collector"])
+
+        assert tracker.add(added) == [added]
@@ -0,0 +1,185 @@
+"""TodoStore 테스트
+
+위치: backend.app.dream_agent.workflow_manager.todo_manager.todo_store
+"""
+
+import functools
+import os
+import threading
+
+import pytest
+
+from backend.app.dream_agent.models.todo import TodoItem
+from backend.app.dream_agent.workflow_manager.todo_manager.todo_store import TodoStore
+from backend.app.dream_agent.workflow_manager.todo_manager.todo_updater import update_todo_status
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 디렉토리 TodoStore"""
+    return TodoStore(base_path=str(tmp_path / "sessions"))
+
+
+@pytest.fixture
+def todos():
+    """샘플 todos"""
+    return [
+        TodoItem(id="t1", task="수집", layer="ml_execution"),
+        TodoItem(id="t2", task="분석", layer="ml_execution"),
+    ]
+
+
+def _progress_fields(todo: TodoItem):
+    return (
+        todo.status,
+        todo.version,
+        todo.updated_at,
+        todo.metadata.progress.started_at,
+        todo.metadata.progress.completed_at,
+        todo.history,
+    )
+
+
+class TestTodoStoreWal:
+    """WAL 기록/재적용/압축 테스트"""
+
+    def test_load_replays_wal(self, store, todos):
+        """WAL 레코드가 스냅샷 위에 적용됨"""
+        assert store.save_todos("s1", todos)
+        wal = functools.partial(store.append_wal, "s1")
+        todos = update_todo_status(todos, "t1", "in_progress", on_update=wal)
+
+        loaded = store.load_todos("s1")
+
+        assert [t.status for t in loaded] == ["in_progress", "pending"]
+
+    def test_round_trip_keeps_timestamps(self, store, todos):
+        """save → append_wal → load → compact 후에도 변경 시각 유지"""
+        assert store.save_todos("s1", todos)
+        wal = functools.partial(store.append_wal, "s1")
+        todos = update_todo_status(todos, "t1", "in_progress", on_update=wal)
+        todos = update_todo_status(todos, "t1", "completed", on_update=wal)
+        todos = update_todo_status(todos, "t2", "failed", "boom", on_update=wal)
+        expected = [_progress_fields(t) for t in todos]
+
+        # 여러 번 load해도 같은 결과
+        assert [_progress_fields(t) for t in store.load_todos("s1")] == expected
+        assert [_progress_fields(t) for t in store.load_todos("s1")] == expected
+
+        # compact 후 스냅샷에도 같은 값이 저장되고 WAL은 비워짐
+        assert store.compact("s1")
+        assert not store._get_wal_file("s1").exists()
+        assert [_progress_fields(t) for t in store.load_todos("s1")] == expected
+
+    def test_save_clears_wal(self, store, todos):
+        """durable 저장 시 WAL 삭제"""
+        assert store.save_todos("s1", todos)
+        todos = update_todo_status(
+            todos, "t1", "completed", on_update=functools.partial(store.append_wal, "s1")
+        )
+        assert store._get_wal_file("s1").exists()
+
+        assert store.save_todos("s1", todos)
+
+        assert not store._get_wal_file("s1").exists()
+        assert store.load_todos("s1")[0].status == "completed"
+
+    def test_invalid_wal_line_is_skipped(self, store, todos):
+        """깨진 WAL 줄은 건너뜀"""
+        assert store.save_todos("s1", todos)
+        store.append_wal("s1", {"todo_id": "t2", "status": "in_progress"})
+        with open(store._get_wal_file("s1"), "ab") as f:
+            f.write(b'{"todo_id": "t1", "sta')
+
+        loaded = store.load_todos("s1")
+
+        assert [t.status for t in loaded] == ["pending", "in_progress"]
+
+
+class TestTodoStoreAtomicWrite:
+    """원자적 저장 테스트"""
+
+    def test_keeps_existing_file_mode(self, store, todos):
+        """교체 후에도 기존 todos.json 권한 유지"""
+        assert store.save_todos("s1", todos)
+        todos_file = store._get_todos_file("s1")
+        todos_file.chmod(0o644)
+
+        assert store.save_todos("s1", todos)
+
+        assert todos_file.stat().st_mode & 0o777 == 0o644
+
+    def test_new_file_is_not_private(self, store, todos):
+        """첫 저장은 umask를 바꾸지 않고, 새 파일은 0600이 아닌 현재 umask 기준 권한"""
+        previous = os.umask(0o027)
+        try:
+            assert store.save_todos("s1", todos)
+            current = os.umask(previous)
+        finally:
+            os.umask(previous)
+
+        assert current == 0o027
+        assert store._get_todos_file("s1").stat().st_mode & 0o777 == 0o640
+
+
+class TestTodoStoreLocking:
+    """스냅샷 교체와 WAL append 직렬화 테스트"""
+
+    def test_compact_does_not_drop_concurrent_appends(self, store):
+        """compact 도중 append된 레코드가 유실되지 않음"""
+        todos = [TodoItem(id=f"t{i}", task=f"작업 {i}", layer="ml_execution") for i in range(200)]
+        assert store.save_todos("s1", todos)
+
+        def append_all():
+            for todo in todos:
+                store.append_wal("s1", {"todo_id": todo.id, "status": "completed"})
+
+        writer = threading.Thread(target=append_all)
+        writer.start()
+        while writer.is_alive():
+            assert store.compact("s1")
+        writer.join()
+
+        loaded = store.load_todos("s1")
+
+        assert all(t.status == "completed" for t in loaded)
+
+
+class TestTodoStoreNonDurable:
+    """durable=False 저장 테스트"""
+
+    def test_keeps_wal_until_flush(self, store, todos):
+        """fsync 전에는 WAL을 남기고, flush 후 반영분만 제거"""
+        assert store.save_todos("s1", todos)
+        wal = functools.partial(store.append_wal, "s1")
+        todos = update_todo_status(todos, "t1", "completed", on_update=wal)
+
+        assert store.save_todos("s1", todos, durable=False)
+        wal_file = store._get_wal_file("s1")
+        assert wal_file.exists()
+
+        # 스냅샷에 이미 반영된 레코드는 다시 적용되지 않음
+        assert [_progress_fields(t) for t in store.load_todos("s1")] == [
+            _progress_fields(t) for t in todos
+        ]
+
+        # flush 전에 추가된 레코드는 flush 후에도 남음
+        todos = update_todo_status(todos, "t2", "in_progress", on_update=wal)
+        assert store.flush() == 1
+
+        assert wal_file.read_bytes().count(b"\n") == 1
+        assert [_progress_fields(t) for t in store.load_todos("s1")] == [
+            _progress_fields(t) for t in todos
+        ]
+
+    def test_flush_removes_fully_applied_wal(self, store, todos):
+        """추가 레코드가 없으면 flush 후 WAL 삭제"""
+        assert store.save_todos("s1", todos)
+        todos = update_todo_status(
+            todos, "t1", "completed", on_update=functools.partial(store.append_wal, "s1")
+        )
+        assert store.save_todos("s1", todos, durable=False)
+
+        store.flush()
+
+        assert not store._get_wal_file("s1").exists()
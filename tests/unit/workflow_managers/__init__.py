@@ -0,0 +1 @@
+"""Workflow Managers 유닛 테스트 패키지"""
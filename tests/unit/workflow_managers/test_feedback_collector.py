@@ -0,0 +1,105 @@
+"""FeedbackCollector 테스트
+
+위치: app.dream_agent.workflow_managers.learning_manager.feedback_collector
+"""
+
+import gc
+import json
+
+import pytest
+
+from app.dream_agent.workflow_managers.learning_manager.feedback_collector import FeedbackCollector
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    """피드백 저장 디렉토리"""
+    return tmp_path / "feedback"
+
+
+def _collect(collector: FeedbackCollector, count: int, session_id: str = "s1") -> None:
+    for i in range(count):
+        collector.collect_rating(session_id, f"질문 {i}", f"응답 {i}", rating=4)
+
+
+def _read_lines(output_dir) -> list[bytes]:
+    return [line for path in sorted(output_dir.glob("*.jsonl")) for line in path.read_bytes().splitlines()]
+
+
+class TestFeedbackCollectorFinalize:
+    """수집기 정리 시 버퍼 기록 테스트"""
+
+    def test_collected_without_flush_keeps_records(self, output_dir):
+        """flush 없이 GC된 수집기의 버퍼도 기록됨"""
+        collector = FeedbackCollector(output_dir=output_dir, buffer_size=10)
+        _collect(collector, 3)
+        writer = collector._writer
+
+        del collector
+        gc.collect()
+        writer.shutdown(wait=True)
+
+        assert len(_read_lines(output_dir)) == 3
+
+    def test_finalize_keeps_batch_order(self, output_dir):
+        """진행 중인 배치 뒤에 남은 버퍼가 기록됨"""
+        collector = FeedbackCollector(output_dir=output_dir, buffer_size=2)
+        for i in range(5):
+            collector.collect_rating("s1", f"질문 {i}", "응답", rating=i + 1)
+        writer = collector._writer
+
+        del collector
+        gc.collect()
+        writer.shutdown(wait=True)
+
+        ratings = [json.loads(line)["rating"] for line in _read_lines(output_dir)]
+        assert ratings == [1, 2, 3, 4, 5]
+
+    def test_collector_is_not_kept_alive(self, output_dir):
+        """finalizer가 수집기를 강하게 참조하지 않음"""
+        collector = FeedbackCollector(output_dir=output_dir)
+        finalizer = collector._finalizer
+
+        del collector
+        gc.collect()
+
+        assert not finalizer.alive
+
+
+class TestFeedbackCollectorWriter:
+    """백그라운드 writer 테스트"""
+
+    def test_full_buffer_written_in_background(self, output_dir):
+        """버퍼가 차면 writer 스레드에서 기록하고 호출자 버퍼는 비움"""
+        collector = FeedbackCollector(output_dir=output_dir, buffer_size=3)
+        _collect(collector, 3)
+
+        assert collector._buffer == []
+        collector._last_write.result(timeout=5)
+        assert len(_read_lines(output_dir)) == 3
+
+    def test_flush_waits_for_all_batches(self, output_dir):
+        """flush 반환 시 앞선 배치와 남은 버퍼가 순서대로 기록됨"""
+        collector = FeedbackCollector(output_dir=output_dir, buffer_size=2)
+        for i in range(5):
+            collector.collect_rating("s1", f"질문 {i}", "응답", rating=i + 1)
+
+        collector.flush()
+
+        assert [json.loads(line)["rating"] for line in _read_lines(output_dir)] == [1, 2, 3, 4, 5]
+
+    async def test_aflush_as_context_manager(self, output_dir):
+        """async with 종료 시 aflush로 기록 완료"""
+        async with FeedbackCollector(output_dir=output_dir, buffer_size=10) as collector:
+            _collect(collector, 2)
+
+        assert len(_read_lines(output_dir)) == 2
+
+    def test_queries_see_in_flight_writes(self, output_dir):
+        """조회는 진행 중인 기록을 기다린 뒤 파일과 버퍼를 함께 읽음"""
+        collector = FeedbackCollector(output_dir=output_dir, buffer_size=2)
+        _collect(collector, 3, session_id="s1")
+        _collect(collector, 1, session_id="s2")
+
+        assert len(collector.get_session_feedback("s1")) == 3
+        assert collector.get_average_rating() == 4.0
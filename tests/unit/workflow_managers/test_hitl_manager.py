@@ -0,0 +1,86 @@
+"""HITLManager 테스트
+
+위치: app.dream_agent.workflow_managers.hitl_manager.manager
+"""
+
+import asyncio
+
+import pytest
+
+from app.dream_agent.models import HITLRequestType
+from app.dream_agent.workflow_managers.hitl_manager.manager import HITLManager
+
+
+@pytest.fixture
+def manager():
+    """새 HITLManager"""
+    return HITLManager()
+
+
+def _create(manager: HITLManager, session_id: str = "s1"):
+    return manager.create_request(session_id, HITLRequestType.APPROVAL, "계획을 승인할까요?")
+
+
+class TestHITLResponseFlow:
+    """Future 기반 요청/응답 테스트"""
+
+    async def test_waiter_receives_submitted_response(self, manager):
+        """대기 중인 호출자가 제출된 응답을 받음"""
+        request = _create(manager)
+        waiter = asyncio.create_task(manager.wait_for_response(request.request_id, timeout=2))
+        await asyncio.sleep(0)
+
+        assert manager.submit_response(request.request_id, "approve", comment="ok")
+
+        response = await waiter
+        assert response.action == "approve"
+        assert response.comment == "ok"
+
+    async def test_response_before_wait_is_kept(self, manager):
+        """대기 전에 제출된 응답도 이후 대기에서 반환"""
+        request = _create(manager)
+        manager.submit_response(request.request_id, "reject")
+
+        response = await manager.wait_for_response(request.request_id, timeout=1)
+
+        assert response.action == "reject"
+
+    async def test_second_response_rejected(self, manager):
+        """한 번 완료된 요청에 대한 추가 응답은 거부"""
+        request = _create(manager)
+
+        assert manager.submit_response(request.request_id, "approve")
+        assert not manager.submit_response(request.request_id, "reject")
+        assert (await manager.wait_for_response(request.request_id)).action == "approve"
+
+    async def test_timeout_keeps_request_open(self, manager):
+        """타임아웃은 None을 반환하고 이후 응답은 여전히 전달"""
+        request = _create(manager)
+
+        assert await manager.wait_for_response(request.request_id, timeout=0.01) is None
+
+        assert manager.submit_response(request.request_id, "modify", value={"step": 2})
+        response = await manager.wait_for_response(request.request_id, timeout=1)
+        assert response.value == {"step": 2}
+
+    async def test_cancel_resolves_waiter(self, manager):
+        """취소 시 대기자는 cancelled 응답을 받음"""
+        request = _create(manager)
+        waiter = asyncio.create_task(manager.wait_for_response(request.request_id, timeout=2))
+        await asyncio.sleep(0)
+
+        assert manager.cancel_request(request.request_id)
+        assert not manager.cancel_request(request.request_id)
+        assert (await waiter).action == "cancelled"
+
+    async def test_unknown_and_cleaned_up_requests(self, manager):
+        """없는 요청이나 정리된 세션의 요청은 즉시 실패"""
+        request = _create(manager)
+        assert manager.get_pending_request("s1") is request
+
+        manager.cleanup("s1")
+
+        assert manager.get_pending_request("s1") is None
+        assert await manager.wait_for_response(request.request_id) is None
+        assert not manager.submit_response(request.request_id, "approve")
+        assert not manager.submit_response("missing", "approve")